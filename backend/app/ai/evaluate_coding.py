@@ -9,26 +9,13 @@ import json
 
 PROMPT_VERSION = "2.5.0"
 
-def evaluate_coding(
-    *,
-    code: str,
-    language: str,
-    context: TaskContext,
-) -> AIEvaluationResult:
-    """
-    AI evaluation for coding tasks.
-    Context is mandatory.
-    """
-
-    # llm = get_gemini_llm()
-    llm = get_groq_llm()
-    model_name = settings.GROQ_MODEL # or settings.GEMINI_MODEL if using gemini
-
-    prompt = f"""
+# prompt_version -> template; register candidate versions here for shadow evaluation
+PROMPTS = {
+    "2.5.0": """
 You are evaluating a coding task.
 
-Skill: {context.skill}
-Difficulty: {context.difficulty}
+Skill: {skill}
+Difficulty: {difficulty}
 
 Rules:
 - Return ONLY valid JSON
@@ -55,7 +42,28 @@ Scoring Guide:
 
 User code ({language}):
 {code}
-"""
+""",
+}
+
+def evaluate_coding(
+    *,
+    code: str,
+    language: str,
+    context: TaskContext,
+    prompt_version: str | None = None,
+    model: str | None = None,
+) -> AIEvaluationResult:
+    """
+    AI evaluation for coding tasks.
+    Context is mandatory.
+    """
+
+    # llm = get_gemini_llm()
+    llm = get_groq_llm(model)
+    model_name = model or settings.GROQ_MODEL # or settings.GEMINI_MODEL if using gemini
+    prompt_version = prompt_version or PROMPT_VERSION
+
+    prompt = PROMPTS[prompt_version].format(skill=context.skill, difficulty=context.difficulty, language=language, code=code)
 
     response = llm.invoke([HumanMessage(content=prompt)])
     raw = normalize_llm_content(response.content)
@@ -72,7 +80,7 @@ User code ({language}):
             explanation=data.get("explanation"),
             model_name=model_name,
             model_version="1.0.0",
-            prompt_version=PROMPT_VERSION,
+            prompt_version=prompt_version,
             temperature=0.0
         )
     except Exception as e:
@@ -9,24 +9,13 @@ import json
 
 PROMPT_VERSION = "2.5.0"
 
-def evaluate_explanation(
-    *,
-    text: str,
-    context: TaskContext,
-) -> AIEvaluationResult:
-    """
-    AI evaluation for explanation tasks.
-    """
-
-    # llm = get_gemini_llm()
-    llm = get_groq_llm()
-    model_name = settings.GROQ_MODEL
-
-    prompt = f"""
+# prompt_version -> template; register candidate versions here for shadow evaluation
+PROMPTS = {
+    "2.5.0": """
 Evaluate the explanation below.
 
-Skill: {context.skill}
-Difficulty: {context.difficulty}
+Skill: {skill}
+Difficulty: {difficulty}
 
 Rules:
 - Return ONLY valid JSON
@@ -44,7 +33,26 @@ JSON schema:
 
 User explanation:
 {text}
-"""
+""",
+}
+
+def evaluate_explanation(
+    *,
+    text: str,
+    context: TaskContext,
+    prompt_version: str | None = None,
+    model: str | None = None,
+) -> AIEvaluationResult:
+    """
+    AI evaluation for explanation tasks.
+    """
+
+    # llm = get_gemini_llm()
+    llm = get_groq_llm(model)
+    model_name = model or settings.GROQ_MODEL
+    prompt_version = prompt_version or PROMPT_VERSION
+
+    prompt = PROMPTS[prompt_version].format(skill=context.skill, difficulty=context.difficulty, text=text)
 
     response = llm.invoke([HumanMessage(content=prompt)])
     raw = normalize_llm_content(response.content)
@@ -59,7 +67,7 @@ User explanation:
             mistakes=data.get("mistakes", []),
             model_name=model_name,
             model_version="1.0.0",
-            prompt_version=PROMPT_VERSION,
+            prompt_version=prompt_version,
             temperature=0.0
         )
     except Exception as e:
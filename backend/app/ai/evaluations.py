@@ -1,5 +1,7 @@
 # app/ai/evaluations.py
 
+from typing import Optional
+
 from app.schemas.ai_evaluation import AIEvaluationResult
 from app.schemas.task_instance import TaskInstance
 from app.schemas.task_template import TaskTemplate
@@ -15,9 +17,14 @@ def evaluate_task(
     task_instance: TaskInstance,
     task_template: TaskTemplate,
     submission_payload: dict,
+    prompt_version: Optional[str] = None,
+    model: Optional[str] = None,
 ) -> AIEvaluationResult:
     """
     Unified evaluation dispatcher.
+
+    `prompt_version` and `model` override the live evaluator configuration
+    for the AI-graded task types (shadow evaluation); MCQs ignore them.
     """
 
     # Hard invariant — DB corruption if violated
@@ -66,6 +73,8 @@ def evaluate_task(
             code=code,
             language=language,
             context=context,
+            prompt_version=prompt_version,
+            model=model,
         )
 
     if task_template.question_type == "explanation":
@@ -80,6 +89,8 @@ def evaluate_task(
         return evaluate_explanation(
             text=text,
             context=context,
+            prompt_version=prompt_version,
+            model=model,
         )
 
     raise RuntimeError(f"Unknown task type: {task_template.question_type}")
@@ -3,10 +3,10 @@ from langchain_groq import ChatGroq
 from pydantic import SecretStr
 from app.core.config import settings
 
-def get_groq_llm():
+def get_groq_llm(model: str | None = None):
     api_key = settings.GROQ_API_KEY or os.getenv("GROQ_API_KEY")
     return ChatGroq(
-        model=settings.GROQ_MODEL,
+        model=model or settings.GROQ_MODEL,
         temperature=0.2,
         api_key=SecretStr(api_key) if api_key else None
     )
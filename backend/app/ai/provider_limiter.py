@@ -0,0 +1,34 @@
+import asyncio
+from typing import Any, Callable, Optional
+
+from app.core.config import settings
+
+
+class ProviderLimiter:
+    """
+    Bounds concurrent calls to the LLM provider. The evaluators are
+    synchronous, so calls run in a worker thread; a timed-out call keeps
+    its slot until the thread actually returns, so the provider never
+    sees more than `max_concurrency` requests from this process.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(self, fn: Callable[..., Any], /, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        await self._semaphore.acquire()
+
+        future = asyncio.ensure_future(asyncio.to_thread(fn, *args, **kwargs))
+        future.add_done_callback(self._release)
+
+        # shield: a timeout abandons the call, it does not free the slot
+        return await asyncio.wait_for(asyncio.shield(future), timeout)
+
+    def _release(self, future: asyncio.Future) -> None:
+        self._semaphore.release()
+        if not future.cancelled():
+            future.exception()  # mark retrieved for abandoned calls
+
+
+provider_limiter = ProviderLimiter(settings.LLM_MAX_CONCURRENCY)
@@ -27,7 +27,7 @@ async def get_roadmap(
     user_id = str(current_user["_id"])
 
     try:
-        roadmap = await repo.get_user_roadmap(user_id)
+        roadmap = await repo.get_user_roadmap_readonly(user_id)
     except ValueError:
         raise HTTPException(status_code=404, detail="Active roadmap not found")
     if not roadmap:
@@ -35,7 +35,7 @@ async def get_roadmap(
     
     # Validate roadmap integrity before returning
     try:
-        validate_roadmap_state(roadmap)
+        validate_roadmap_state(roadmap, mode="full")
     except RoadmapValidationError as e:
         raise HTTPException(status_code=500, detail=f"Roadmap corrupted: {e}")
 
@@ -48,7 +48,7 @@ async def init_roadmap(
     repo: UserRoadmapRepo = Depends(get_user_roadmap_repo),
     db = Depends(get_db)
 ):
-    existing = await repo.get_user_roadmap(user_id=user["_id"])
+    existing = await repo.get_user_roadmap_readonly(user_id=user["_id"])
     if existing:
         raise HTTPException(400, "Roadmap already exists")
 
@@ -66,7 +66,7 @@ async def init_roadmap(
     )
 
     try:
-        validate_roadmap_state(roadmap)
+        validate_roadmap_state(roadmap, mode="full")
     except RoadmapValidationError as e:
         raise HTTPException(500, f"Generated roadmap invalid: {e}")
 
@@ -82,7 +82,7 @@ async def get_latest_roadmap(
     user_id = str(user["_id"])
 
     # 1. Try active roadmap first
-    roadmap = await roadmap_repo.get_user_roadmap(user_id)
+    roadmap = await roadmap_repo.get_user_roadmap_readonly(user_id)
     if roadmap:
         return roadmap
 
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
+from typing import Optional
 from datetime import datetime, timezone
 
 from app.api.deps import get_current_user, get_user_roadmap_repo, get_db
@@ -9,12 +10,15 @@ from app.domain.roadmap_validator import (
 )
 from app.domain.task_template_loader import get_task_template
 from app.services.ai_services import AIService
+from app.services.hint_service import hint_service
 from app.services.slot_start_service import start_slot as start_slot_domain
 from app.domain.task_template_resolver import resolve_task_template_id
 from app.domain.governance_engine import apply_governance_to_roadmap
 from app.services.learning_state_service import get_decision_context
 from app.services.curriculum_service import CurriculumService
 from app.core.exceptions import TemplateResolutionError, ConcurrencyError
+from app.db.idempotency_repo import save_idempotency_record
+from app.services.idempotency_service import request_fingerprint, get_stored_response
 
 
 router = APIRouter(
@@ -28,16 +32,23 @@ ai_service = AIService()
 # ============================================================
 # START SLOT (FIXED)
 # ============================================================
-from app.db.learning_state_repo import get_user_learning_state
-
 @router.post("/start")
 async def start_slot(
     slot_id: str,
     current_user: dict = Depends(get_current_user),
     repo: UserRoadmapRepo = Depends(get_user_roadmap_repo),
     db=Depends(get_db),
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key"),
 ):
-    roadmap = await repo.get_user_roadmap(str(current_user["_id"]))
+    user_id = str(current_user["_id"])
+
+    # A retried start returns the stored response instead of a second TaskInstance
+    request_hash = request_fingerprint(slot_id=slot_id)
+    stored = await get_stored_response(db, "slot_start", user_id, idempotency_key, request_hash)
+    if stored is not None:
+        return stored
+
+    roadmap = await repo.get_user_roadmap(user_id)
     if not roadmap:
         raise HTTPException(404, "Roadmap not initialized")
 
@@ -58,11 +69,16 @@ async def start_slot(
             raise HTTPException(404, f"Slot {slot_id} not found")
 
         # 1. Build DecisionContext (Adaptive V3)
-        context = await get_decision_context(db, str(current_user["_id"]), track_id="dsa")
+        context = await get_decision_context(db, user_id, track_id="dsa")
         
         # 2. Apply Governance (Auto-skip/Reinforce/Promote)
         curriculum = CurriculumService.get_curriculum("dsa")
-        apply_governance_to_roadmap(roadmap, curriculum, context)
+        apply_governance_to_roadmap(
+            roadmap,
+            curriculum,
+            context,
+            governance=CurriculumService.get_compiled_governance("dsa"),
+        )
         
         # Re-fetch slot in case status changed during governance
         target_slot = roadmap.get_slot(slot_id)
@@ -120,25 +136,59 @@ async def start_slot(
     except ConcurrencyError:
         raise HTTPException(409, "Roadmap modified by another request")
 
-    # Fetch learning state for accurate skill vector
-    try:
-        learning_state = await get_user_learning_state(db, str(current_user["_id"]))
-        skill_vector = {k: v.level for k, v in learning_state.skill_vector.items()}
-    except Exception:
-        skill_vector = {}
-
-    hint = await ai_service.generate_hint(
-        slot=roadmap.get_slot(slot_id),
-        user_skill_vector=skill_vector,
+    # Hint is served from cache; misses are generated in the background
+    # and fetched later via GET /roadmap/slot/hint
+    started_slot = roadmap.get_slot(slot_id)
+    hint, hint_status = hint_service.get_hint(
+        skill=started_slot.skill,
+        difficulty=started_slot.difficulty,
+        level=context.all_scores.get(started_slot.skill, 0.0),
     )
 
-    return {
+    response = {
         "slot_id": slot_id,
         "task_instance_id": task_instance.task_instance_id,
         "difficulty": task_instance.difficulty,
         "hint": hint,
+        "hint_status": hint_status,
         "started_at": task_instance.started_at.isoformat(),
     }
+    if idempotency_key:
+        await save_idempotency_record(db, "slot_start", user_id, idempotency_key, request_hash, response)
+    return response
+
+
+# ============================================================
+# FETCH SLOT HINT
+# ============================================================
+@router.get("/hint")
+async def get_slot_hint(
+    slot_id: str,
+    current_user: dict = Depends(get_current_user),
+    repo: UserRoadmapRepo = Depends(get_user_roadmap_repo),
+    db=Depends(get_db),
+):
+    roadmap = await repo.get_user_roadmap_readonly(str(current_user["_id"]))
+    if not roadmap:
+        raise HTTPException(404, "Roadmap not initialized")
+
+    try:
+        slot = roadmap.get_slot(slot_id)
+    except ValueError:
+        raise HTTPException(404, f"Slot {slot_id} not found")
+
+    context = await get_decision_context(db, str(current_user["_id"]), track_id="dsa")
+    hint, hint_status = hint_service.get_hint(
+        skill=slot.skill,
+        difficulty=slot.difficulty,
+        level=context.all_scores.get(slot.skill, 0.0),
+    )
+
+    return {
+        "slot_id": slot_id,
+        "hint": hint,
+        "hint_status": hint_status,
+    }
 
 
 # ============================================================
@@ -1,5 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException
+from typing import Optional
 from datetime import datetime, timezone
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+import logging
+import uuid
 
 from app.api.deps import (
     get_current_user,
@@ -7,8 +12,10 @@ from app.api.deps import (
     get_user_roadmap_repo,
     get_db,
 )
-from app.db.base import get_client
-from app.core.exceptions import ConcurrencyError
+from app.db.transactions import run_transaction, is_transient
+from app.core.config import settings
+from app.core.single_flight import SingleFlight
+from app.core.exceptions import ConcurrencyError, DuplicateSubmissionError
 
 from app.schemas.task_submission import TaskSubmissionCreate, TaskSubmission
 from app.db.task_submission_repo import TaskSubmissionRepo
@@ -17,29 +24,309 @@ from app.db.learning_state_repo import (
     get_user_learning_state,
     apply_skill_vector_updates,
 )
+from app.db.skill_update_journal_repo import append_skill_journal
+from app.db.submission_lease_repo import acquire_submission_lease, release_submission_lease
+from app.db.idempotency_repo import save_idempotency_record
 
 from app.domain.submission_guard import validate_submission_allowed
+from app.domain.roadmap_validator import validate_roadmap_state, RoadmapValidationError
 from app.domain.task_template_loader import get_task_template
 
-from app.services.evaluation_service import evaluate_submission_and_update_roadmap
+from app.services.evaluation_service import (
+    evaluate_submission,
+    evaluate_submission_and_update_roadmap,
+)
+from app.services.learning_state_service import record_decision_snapshot
+from app.services.telemetry_service import (
+    telemetry_writer,
+    build_evaluation_telemetry,
+    build_decision_trace,
+)
+from app.services.shadow_evaluation_service import should_shadow, run_shadow_evaluation
+from app.services.idempotency_service import request_fingerprint, get_stored_response
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(
     prefix="/submissions",
     tags=["submissions"],
 )
 
+IDEMPOTENCY_SCOPE = "submissions"
+
+# One submission per user at a time: evaluation runs before the
+# optimistic-locked transaction, so concurrent submits would each pay
+# for an LLM evaluation only for all but one to fail with 409.
+submission_flight = SingleFlight()
+
 
 @router.post("", response_model=TaskSubmission)
 async def submit_task(
     payload: TaskSubmissionCreate,
+    background_tasks: BackgroundTasks,
     user=Depends(get_current_user),
     submission_repo: TaskSubmissionRepo = Depends(get_task_submission_repo),
     roadmap_repo: UserRoadmapRepo = Depends(get_user_roadmap_repo),
     db=Depends(get_db),
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key"),
 ):
     user_id = str(user["_id"])
 
+    # A retry of a completed request gets the stored response (one _id read)
+    request_hash = request_fingerprint(**payload.model_dump())
+    stored = await get_stored_response(db, IDEMPOTENCY_SCOPE, user_id, idempotency_key, request_hash)
+    if stored is not None:
+        return stored
+
+    # A concurrent duplicate (double click, second tab) shares the result
+    # of the running request; other submissions of the user wait their turn.
+    return await submission_flight.run(
+        user_id,
+        (user_id, payload.slot_id, payload.task_instance_id),
+        lambda: _submit_under_lease(
+            payload, background_tasks, user_id, submission_repo, roadmap_repo, db,
+            idempotency_key, request_hash,
+        ),
+    )
+
+
+async def _submit_under_lease(
+    payload, background_tasks, user_id, submission_repo, roadmap_repo, db, idempotency_key, request_hash
+):
+    if not settings.SUBMISSION_LEASE_ENABLED:
+        return await _submit_task(
+            payload, background_tasks, user_id, submission_repo, roadmap_repo, db, idempotency_key, request_hash
+        )
+
+    # Multi-node: a submission in flight on another node is rejected
+    # before any evaluation work starts
+    owner = uuid.uuid4().hex
+    if not await acquire_submission_lease(db, user_id, owner, settings.SUBMISSION_LEASE_SECONDS):
+        raise HTTPException(409, "Another submission is already being processed")
+    try:
+        return await _submit_task(
+            payload, background_tasks, user_id, submission_repo, roadmap_repo, db, idempotency_key, request_hash
+        )
+    finally:
+        await release_submission_lease(db, user_id, owner)
+
+
+async def _submit_task(
+    payload: TaskSubmissionCreate,
+    background_tasks: BackgroundTasks,
+    user_id: str,
+    submission_repo: TaskSubmissionRepo,
+    roadmap_repo: UserRoadmapRepo,
+    db,
+    idempotency_key: Optional[str] = None,
+    request_hash: str = "",
+):
+    # 1-6, 9. Load the roadmap and validate the targeted slot/task
+    roadmap, slot, task_instance = await _load_submission_target(roadmap_repo, user_id, payload)
+
+    # 7. Duplicate submissions are rejected by the unique index on
+    # (user_id, slot_id, task_instance_id) when the transaction inserts
+
+    # 8. (Refactored) Prepare virtual submission for evaluation
+    # We do NOT persist yet to ensure transactional integrity.
+    # The id is allocated up front so evaluation history and telemetry
+    # reference the submission that the transaction will insert.
+    submission_oid = ObjectId()
+    virtual_submission = TaskSubmission(
+        id=str(submission_oid),
+        user_id=user_id,
+        slot_id=payload.slot_id,
+        task_instance_id=payload.task_instance_id,
+        payload=payload.payload,
+        status="submitted",
+        created_at=datetime.now(timezone.utc),
+        evaluated_at=None,
+    )
+
+    # 10. Load task template
+    task_template = get_task_template(task_instance.task_template_id)
+
+    # 11. Evaluate (LLM) once; the result is reused across conflict retries
+    evaluated = evaluate_submission(
+        task_instance=task_instance,
+        task_template=task_template,
+        submission_payload=payload.payload,
+    )
+
+    for attempt in range(settings.SUBMISSION_CONFLICT_RETRIES + 1):
+        if attempt:
+            # Roadmap changed under us: reload, re-validate, re-apply
+            roadmap, slot, task_instance = await _load_submission_target(roadmap_repo, user_id, payload)
+
+        # 11.5 Load Learning State
+        learning_state = await get_user_learning_state(db, user_id)
+
+        # Capture original version for optimistic locking
+        original_roadmap_version = roadmap.version
+
+        # 12. Mutate roadmap (deterministic, from the cached evaluation)
+        skill_updates = []
+        deferred_skill_updates = []
+        evaluation = await evaluate_submission_and_update_roadmap(
+            submission=virtual_submission,
+            roadmap=roadmap,
+            learning_state=learning_state,
+            task_instance=task_instance,
+            task_template=task_template,
+            skill_updates=skill_updates,
+            deferred_skill_updates=deferred_skill_updates,
+            evaluated=evaluated,
+        )
+
+        # 🔒 HARD invariant check
+        try:
+            validate_roadmap_state(roadmap)
+        except RoadmapValidationError as e:
+            raise HTTPException(
+                500,
+                f"Roadmap invariant violated after evaluation: {e}",
+            )
+
+        # 13. Persist evaluation (TRANSACTIONAL)
+        async def persist(session):
+            # A. Create Submission (Atomic with updates)
+            submission_data = {
+                "_id": submission_oid,
+                "user_id": user_id,
+                "slot_id": payload.slot_id,
+                "task_instance_id": payload.task_instance_id,
+                "payload": payload.payload,
+                "skill": task_template.skill,
+                "difficulty": task_instance.difficulty,
+                "question_type": task_template.question_type,
+                "status": "evaluated",
+                "created_at": datetime.now(timezone.utc),
+                "evaluated_at": datetime.now(timezone.utc),
+                "evaluation": evaluation.model_dump(),
+            }
+
+            submission = await submission_repo.create_submission(
+                submission_data,
+                session=session
+            )
+
+            # B. Update Roadmap (with Optimistic Locking)
+            await roadmap_repo.update_roadmap(
+                roadmap,
+                expected_version=original_roadmap_version,
+                session=session
+            )
+
+            # C. Update Learning State
+            await apply_skill_vector_updates(
+                db,
+                user_id,
+                learning_state.skill_vector,
+                session=session
+            )
+
+            # D. Fold into DecisionContext snapshot
+            await record_decision_snapshot(
+                db,
+                user_id,
+                "dsa",
+                learning_state.skill_vector,
+                payload.task_instance_id,
+                session=session
+            )
+
+            # E. Journal skill updates withheld while FROZEN
+            await append_skill_journal(
+                db,
+                deferred_skill_updates,
+                session=session
+            )
+
+            # F. Response for retries of this Idempotency-Key
+            if idempotency_key:
+                await save_idempotency_record(
+                    db,
+                    IDEMPOTENCY_SCOPE,
+                    user_id,
+                    idempotency_key,
+                    request_hash,
+                    submission.model_dump(mode="json"),
+                    session=session
+                )
+            return submission
+
+        try:
+            # Transient errors are retried inside run_transaction
+            submission = await run_transaction(persist)
+            break
+        except ConcurrencyError:
+            if attempt == settings.SUBMISSION_CONFLICT_RETRIES:
+                raise HTTPException(
+                    409,
+                    "Roadmap was modified by another request. Please retry."
+                )
+        except DuplicateSubmissionError:
+            # A concurrent request with the same Idempotency-Key won the insert
+            if idempotency_key:
+                stored = await get_stored_response(db, IDEMPOTENCY_SCOPE, user_id, idempotency_key, request_hash)
+                if stored is not None:
+                    return stored
+            raise HTTPException(409, "Duplicate submission for this task")
+        except HTTPException:
+            raise
+        except DuplicateKeyError as e:
+            # The same Idempotency-Key committed concurrently (e.g. on another
+            # node): answer like a retry, 422 if it was a different request
+            if idempotency_key:
+                stored = await get_stored_response(db, IDEMPOTENCY_SCOPE, user_id, idempotency_key, request_hash)
+                if stored is not None:
+                    return stored
+            logger.error(f"Submission transaction failed for user {user_id}: {e}")
+            raise HTTPException(500, "Transaction failed")
+        except Exception as e:
+            logger.error(f"Submission transaction failed for user {user_id}: {e}")
+            if is_transient(e):
+                raise HTTPException(503, "Database temporarily unavailable. Please retry.")
+            raise HTTPException(500, "Transaction failed")
+
+    # 14. Telemetry (buffered; written after the response path)
+    now = datetime.now(timezone.utc)
+    telemetry_writer.record_evaluation(build_evaluation_telemetry(
+        evaluation_id=submission.id,
+        user_id=user_id,
+        slot=slot,
+        task_instance=task_instance,
+        evaluation=evaluation,
+        created_at=now,
+    ))
+    telemetry_writer.record_skill_updates(skill_updates)
+    telemetry_writer.record_decision_trace(build_decision_trace(
+        decision_id=submission.id,
+        user_id=user_id,
+        slot=slot,
+        evaluation=evaluation,
+        created_at=now,
+    ))
+
+    # 15. Shadow evaluation of a candidate prompt/model (after the response)
+    if should_shadow(submission.id):
+        background_tasks.add_task(
+            run_shadow_evaluation,
+            db,
+            submission_id=submission.id,
+            user_id=user_id,
+            task_instance=task_instance,
+            task_template=task_template,
+            payload=payload.payload,
+            live=evaluation,
+        )
+
+    return submission
+
+
+async def _load_submission_target(roadmap_repo: UserRoadmapRepo, user_id: str, payload: TaskSubmissionCreate):
+    """Active roadmap, slot and task instance a submission targets, validated."""
     # 1. Load active roadmap
     roadmap = await roadmap_repo.get_user_roadmap(user_id)
     if not roadmap:
@@ -75,38 +362,10 @@ async def submit_task(
     # 6. Domain-level submission guard
     validate_submission_allowed(slot, payload)
 
-    # 7. Prevent duplicate submission
-    existing = await submission_repo.get_submission(
-        user_id=user_id,
-        slot_id=payload.slot_id,
-        task_instance_id=payload.task_instance_id,
-    )
-    if existing:
-        raise HTTPException(409, "Duplicate submission for this task")
-
-    # 8. (Refactored) Prepare virtual submission for evaluation
-    # We do NOT persist yet to ensure transactional integrity.
-    virtual_submission = TaskSubmission(
-        id="temp_id",  # Placeholder, not used in logic
-        user_id=user_id,
-        slot_id=payload.slot_id,
-        task_instance_id=payload.task_instance_id,
-        payload=payload.payload,
-        status="submitted",
-        created_at=datetime.now(timezone.utc),
-        evaluated_at=None,
-    )
-
     # 9. Load task instance (EXPLICIT, NO MAGIC)
-    task_instance = next(
-        (
-            ti
-            for ti in roadmap.task_instances
-            if ti.task_instance_id == payload.task_instance_id
-        ),
-        None,
-    )
-    if not task_instance:
+    try:
+        task_instance = roadmap.get_task_instance(payload.task_instance_id)
+    except ValueError:
         raise HTTPException(
             500,
             "TaskInstance not found in roadmap (corrupt roadmap state)",
@@ -119,82 +378,4 @@ async def submit_task(
             "TaskInstance is not the active instance for this slot",
         )
 
-    # 10. Load task template
-    task_template = get_task_template(task_instance.task_template_id)
-
-    # 10.5 Load Learning State
-    learning_state = await get_user_learning_state(db, user_id)
-
-    # Capture original version for optimistic locking
-    original_roadmap_version = roadmap.version
-
-    # 11. Evaluate + mutate roadmap
-    evaluation = await evaluate_submission_and_update_roadmap(
-        submission=virtual_submission,
-        roadmap=roadmap,
-        learning_state=learning_state,
-        task_instance=task_instance,
-        task_template=task_template,
-    )
-
-    # 🔒 HARD invariant check
-    from app.domain.roadmap_validator import validate_roadmap_state, RoadmapValidationError
-
-    try:
-        validate_roadmap_state(roadmap)
-    except RoadmapValidationError as e:
-        raise HTTPException(
-            500,
-            f"Roadmap invariant violated after evaluation: {e}",
-        )
-
-    # 12. Persist evaluation (TRANSACTIONAL)
-    client = get_client()
-    try:
-        async with await client.start_session() as session:
-            async with session.start_transaction():
-                # A. Create Submission (Atomic with updates)
-                submission_data = {
-                    "user_id": user_id,
-                    "slot_id": payload.slot_id,
-                    "task_instance_id": payload.task_instance_id,
-                    "payload": payload.payload,
-                    "status": "evaluated",
-                    "created_at": datetime.now(timezone.utc),
-                    "evaluated_at": datetime.now(timezone.utc),
-                    "evaluation": evaluation.model_dump(),
-                }
-                
-                submission = await submission_repo.create_submission(
-                    submission_data,
-                    session=session
-                )
-
-                # B. Update Roadmap (with Optimistic Locking)
-                await roadmap_repo.update_roadmap(
-                    roadmap,
-                    expected_version=original_roadmap_version,
-                    session=session
-                )
-
-                # C. Update Learning State
-                await apply_skill_vector_updates(
-                    db,
-                    user_id,
-                    learning_state.skill_vector,
-                    session=session
-                )
-    except ConcurrencyError:
-        raise HTTPException(
-            409,
-            "Roadmap was modified by another request. Please retry."
-        )
-    except Exception as e:
-        # If anything else fails, the transaction aborts automatically.
-        # We should probably log this.
-        raise HTTPException(
-            500,
-            f"Transaction failed: {str(e)}"
-        )
-
-    return submission
+    return roadmap, slot, task_instance
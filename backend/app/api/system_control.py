@@ -1,7 +1,10 @@
-from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Request
 from app.core.system_status import system_status
+from app.db.user_roadmap_repo import roadmap_cache
 from app.schemas.system_events import SystemEvent
-from datetime import datetime
+from app.db.shadow_evaluation_repo import get_shadow_summary
+from app.services.skill_journal_service import replay_skill_journal
+from datetime import datetime, timedelta, timezone
 import logging
 
 router = APIRouter(prefix="/system", tags=["System Control"])
@@ -13,11 +16,11 @@ def verify_admin():
     return True
 
 @router.post("/freeze")
-def freeze_system(reason: str, admin: bool = Depends(verify_admin)):
+async def freeze_system(reason: str, admin: bool = Depends(verify_admin)):
     """
     Manual override: Freeze the system.
     """
-    system_status.transition_to("FROZEN", reason)
+    await system_status.transition("FROZEN", reason)
     
     event = SystemEvent(
         event_type="SYSTEM_FREEZE",
@@ -30,11 +33,18 @@ def freeze_system(reason: str, admin: bool = Depends(verify_admin)):
     return {"status": "System FROZEN", "reason": reason}
 
 @router.post("/unfreeze")
-def unfreeze_system(reason: str, admin: bool = Depends(verify_admin)):
+async def unfreeze_system(
+    reason: str,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    admin: bool = Depends(verify_admin),
+):
     """
     Manual override: Unfreeze the system (return to NORMAL).
+    Skill updates journaled while frozen are replayed in the background.
     """
-    system_status.transition_to("NORMAL", reason)
+    await system_status.transition("NORMAL", reason)
+    background_tasks.add_task(replay_skill_journal, request.app.state.db)
     
     event = SystemEvent(
         event_type="SYSTEM_UNFREEZE",
@@ -47,14 +57,14 @@ def unfreeze_system(reason: str, admin: bool = Depends(verify_admin)):
     return {"status": "System NORMAL", "reason": reason}
 
 @router.post("/set-dampening")
-def set_dampening(factor: float, reason: str, admin: bool = Depends(verify_admin)):
+async def set_dampening(factor: float, reason: str, admin: bool = Depends(verify_admin)):
     """
     Manual override: Set dampening factor.
     """
     if not 0.0 <= factor <= 1.0:
         raise HTTPException(status_code=400, detail="Factor must be between 0.0 and 1.0")
         
-    system_status.transition_to("DAMPENED", reason, dampening_factor=factor)
+    await system_status.transition("DAMPENED", reason, dampening_factor=factor)
     
     event = SystemEvent(
         event_type="MANUAL_DAMPENING",
@@ -78,6 +88,17 @@ async def get_system_status(request: Request):
 
     return {
         "system": system_status.status,
+        "system_version": system_status.version,
+        "system_sync": system_status.sync_mode,
         "database": "connected" if db_ok else "disconnected",
+        "roadmap_cache": roadmap_cache.stats(),
         "timestamp": datetime.utcnow()
     }
+
+@router.get("/shadow")
+async def get_shadow_evaluation_summary(request: Request, hours: int = 24):
+    since = datetime.now(timezone.utc) - timedelta(hours=hours)
+    return {
+        "since": since,
+        "candidates": await get_shadow_summary(request.app.state.db, since),
+    }
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from app.api.deps import get_current_user, get_user_roadmap_repo
 from app.db.user_roadmap_repo import UserRoadmapRepo
-from app.services.task_factory import TaskFactory
+from app.domain.task_template_loader import get_task_template
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
@@ -22,39 +22,24 @@ async def get_task_execution_details(
     Hydrate a TaskInstance with its static content (Question, Code, etc.)
     """
     user_id = str(current_user["_id"])
-    roadmap = await repo.get_user_roadmap(user_id)
+    roadmap = await repo.get_user_roadmap_readonly(user_id)
     
     if not roadmap:
         raise HTTPException(404, "Roadmap not found")
 
     # 1. Find the specific instance in the user's history
     #    (It could be active OR completed)
-    target_instance = None
-    for instance in roadmap.task_instances:
-        if instance.task_instance_id == instance_id:
-            target_instance = instance
-            break
-            
-    if not target_instance:
+    try:
+        target_instance = roadmap.get_task_instance(instance_id)
+    except ValueError:
         raise HTTPException(404, "Task instance not found in your history")
 
-    # 2. Lookup the static content
-    # Note: TaskFactory.load_tasks populates the cache for a skill.
-    # We need to find the template by ID or by skill + match.
-    # Since we have templates per skill in separate files, we use the skill from the instance.
-    
-    # Ensure cache is populated for this skill
-    templates = TaskFactory.load_tasks(target_instance.skill)
-    
-    template = None
-    for t in templates:
-        if t.task_template_id == target_instance.task_template_id:
-            template = t
-            break
-    
-    if not template:
-        # Fallback: Trying to load by ID might be hard without knowing the skill file,
-        # but the instance HAS the skill field.
+    # 2. Lookup the static content in the id-indexed template registry.
+    #    Templates are keyed by id, not by skill/file, so a template whose
+    #    skill differs from its YAML file name still resolves.
+    try:
+        template = get_task_template(target_instance.task_template_id)
+    except RuntimeError:
         raise HTTPException(500, f"Content missing for template: {target_instance.task_template_id} (skill: {target_instance.skill})")
 
     # 3. Merge and Return
@@ -22,11 +22,76 @@ class Settings(BaseSettings):
     
     GROQ_API_KEY: str | None = None
     GROQ_MODEL: str = "llama-3.3-70b-versatile"
+    # Concurrent provider calls per process (background jobs)
+    LLM_MAX_CONCURRENCY: int = 4
+
+    # Golden-Task Calibration
+    GOLDEN_TASK_REPEATS: int = 3
+    GOLDEN_TASK_TIMEOUT_SECONDS: float = 60.0
+    # Past passing runs pooled into each task's baseline distribution
+    GOLDEN_BASELINE_RUNS: int = 20
+
+    # Canary Replay (re-evaluates stored submissions each calibration cycle)
+    CANARY_REPLAY_BUDGET: int = 50
+    CANARY_REPLAY_CONCURRENCY: int = 2
+    CANARY_REPLAY_RATE_PER_SECOND: float = 0.5
+    CANARY_REPLAY_MAX_SECONDS: float = 600.0
+
+    # System Status (cluster-wide; polled where change streams are unavailable)
+    SYSTEM_STATUS_POLL_SECONDS: float = 2.0
+
+    # Transactions (retried with jittered exponential backoff)
+    TRANSACTION_MAX_ATTEMPTS: int = 4
+    TRANSACTION_BACKOFF_BASE_SECONDS: float = 0.05
+    TRANSACTION_BACKOFF_MAX_SECONDS: float = 1.0
+    # Roadmap version conflicts re-applied from the cached evaluation
+    SUBMISSION_CONFLICT_RETRIES: int = 2
+
+    # Idempotency-Key responses kept for retries
+    IDEMPOTENCY_TTL_SECONDS: int = 24 * 60 * 60
+
+    # Submission Single-Flight
+    # Cross-node per-user lease (in-process serialization is always on)
+    SUBMISSION_LEASE_ENABLED: bool = False
+    SUBMISSION_LEASE_SECONDS: float = 120.0
+
+    # Skill updates journaled while FROZEN, replayed on unfreeze
+    SKILL_JOURNAL_REPLAY_BATCH_SIZE: int = 500
+    SKILL_JOURNAL_CLAIM_TIMEOUT_SECONDS: float = 600.0
+
+    # Shadow Evaluation (candidate prompt/model on sampled live traffic)
+    SHADOW_EVAL_SAMPLE_RATE: float = 0.0
+    # Unset falls back to the live prompt version / GROQ_MODEL
+    SHADOW_PROMPT_VERSION: str | None = None
+    SHADOW_MODEL: str | None = None
 
     # Curriculum Paths
     CURRICULUM_ROOT: str = "curriculum"
     CURRICULUM_TASKS_ROOT: str = "curriculum/tasks"
 
+    # Shared Template Registry
+    # Compiled snapshot unpickled by every worker instead of re-parsing YAML
+    # (startup time only; each worker still holds its own copy).
+    TEMPLATE_REGISTRY_SNAPSHOT: str | None = None
+    # Load the registry at import time and gc.freeze() it (gunicorn --preload);
+    # this is what shares the registry's memory between workers.
+    PRELOAD_TEMPLATE_REGISTRY: bool = False
+
+    # Per-process cache of active roadmaps (read-only paths; 0 disables)
+    ROADMAP_CACHE_MAX_SIZE: int = 5000
+
+    # Skill registry ids cached in memory (reloaded after this long)
+    SKILL_REGISTRY_REFRESH_SECONDS: float = 300.0
+
+    # Slot Hints
+    HINT_CACHE_MAX_SIZE: int = 1024
+    HINT_CACHE_TTL_SECONDS: int = 6 * 60 * 60
+
+    # Evaluation Telemetry
+    TELEMETRY_BATCH_SIZE: int = 200
+    TELEMETRY_FLUSH_INTERVAL_SECONDS: float = 5.0
+    TELEMETRY_MAX_BUFFER: int = 10_000
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -2,6 +2,10 @@ class ConcurrencyError(Exception):
     """Raised when an update fails due to a version mismatch."""
     pass
 
+class DuplicateSubmissionError(Exception):
+    """Raised when the task instance already has a submission."""
+    pass
+
 class TemplateResolutionError(Exception):
     """Raised when a task template cannot be resolved."""
     pass
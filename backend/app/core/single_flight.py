@@ -0,0 +1,56 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """
+    Per-key request serialization within one process.
+
+    Calls sharing a `key` run one at a time. A call whose `call_key` is
+    already in flight does not run at all: it waits for the running call
+    and gets the same result (or exception).
+    """
+
+    def __init__(self):
+        self._locks: Dict[Hashable, Tuple[asyncio.Lock, int]] = {}
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, call_key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        running = self._calls.get(call_key)
+        if running is not None:
+            return await asyncio.shield(running)
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[call_key] = future
+        try:
+            async with self._lock(key):
+                result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # retrieved, even if nobody shared the call
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[call_key]
+
+    @asynccontextmanager
+    async def _lock(self, key: Hashable):
+        lock, users = self._locks.get(key, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self._locks[key] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self._locks[key]
+            if users == 1:
+                del self._locks[key]
+            else:
+                self._locks[key] = (lock, users - 1)
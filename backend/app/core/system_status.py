@@ -1,7 +1,15 @@
 
+import asyncio
+import logging
 from datetime import datetime
-from typing import Literal
+from typing import Literal, Optional, Set
 from pydantic import BaseModel
+from pymongo.errors import OperationFailure
+
+from app.core.config import settings
+from app.db.system_state_repo import get_system_state, save_system_state, watch_system_state
+
+logger = logging.getLogger(__name__)
 
 class SystemStatus(BaseModel):
     mode: Literal[
@@ -18,34 +26,126 @@ class SystemStatus(BaseModel):
     last_checked_at: datetime
 
 class SystemStateManager:
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(SystemStateManager, cls).__new__(cls)
-            cls._instance._status = SystemStatus(
-                mode="NORMAL",
-                dampening_factor=1.0,
-                reason="System startup",
-                entered_at=datetime.utcnow(),
-                last_checked_at=datetime.utcnow()
-            )
-            cls._instance.consecutive_passes = 0
-        return cls._instance
+    """
+    Process-local view of the cluster-wide system status.
+
+    The status lives in one Mongo document with a version counter. Reads
+    (`status`, `is_frozen`, `dampening_factor`) only touch the in-memory
+    copy, so hot paths pay nothing; a background task keeps that copy in
+    sync through a change stream, or by polling where change streams are
+    unavailable (standalone mongod). Transitions apply locally at once and
+    are written through to Mongo, so every worker converges on the same mode.
+    """
+
+    def __init__(self):
+        self._status = SystemStatus(
+            mode="NORMAL",
+            dampening_factor=1.0,
+            reason="System startup",
+            entered_at=datetime.utcnow(),
+            last_checked_at=datetime.utcnow()
+        )
+        self.consecutive_passes = 0
+
+        self.version = 0
+        self.sync_mode = "local"
+        self._db = None
+        self._poll_interval_seconds = settings.SYSTEM_STATUS_POLL_SECONDS
+        self._sync_task: Optional[asyncio.Task] = None
+        self._persist_lock = asyncio.Lock()
+        self._persist_tasks: Set[asyncio.Task] = set()
+        self._pending_writes = 0
 
     @property
     def status(self) -> SystemStatus:
         return self._status
 
-    def transition_to(self, mode: str, reason: str, dampening_factor: float = None):
+    # ---------- Cluster sync ----------
+
+    async def start(self, db, poll_interval_seconds: float = settings.SYSTEM_STATUS_POLL_SECONDS) -> None:
+        if self._sync_task is not None:
+            return
+        self._db = db
+        self._poll_interval_seconds = poll_interval_seconds
+        self.sync_mode = "change_stream"
+        self._sync_task = asyncio.create_task(self._run_sync())
+        await self.refresh()
+
+    async def stop(self) -> None:
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            self._sync_task = None
+        if self._persist_tasks:
+            await asyncio.gather(*self._persist_tasks, return_exceptions=True)
+        self._db = None
+        self.sync_mode = "local"
+
+    async def refresh(self) -> bool:
+        """Pulls the stored status; True if it was newer than the local one."""
+        return self._apply_document(await get_system_state(self._db))
+
+    def _apply_document(self, doc: Optional[dict]) -> bool:
+        # Local writes in flight are newer than anything stored
+        if doc is None or self._pending_writes or doc.get("version", 0) <= self.version:
+            return False
+        self._status = SystemStatus.model_validate(doc)
+        self.version = doc["version"]
+        return True
+
+    async def _run_sync(self):
+        while True:
+            if self.sync_mode == "change_stream":
+                try:
+                    async with watch_system_state(self._db) as stream:
+                        # Catch up on anything written before the stream opened
+                        await self.refresh()
+                        async for change in stream:
+                            self._apply_document(change.get("fullDocument"))
+                except asyncio.CancelledError:
+                    raise
+                except OperationFailure as e:
+                    logger.info(f"Change streams unavailable ({e}); polling system status every {self._poll_interval_seconds}s")
+                    self.sync_mode = "polling"
+                except Exception as e:
+                    logger.warning(f"System status change stream interrupted: {e}")
+
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"System status refresh failed: {e}")
+            await asyncio.sleep(self._poll_interval_seconds)
+
+    async def _persist(self, status: SystemStatus) -> None:
+        try:
+            async with self._persist_lock:
+                doc = await save_system_state(self._db, status.model_dump())
+                self.version = max(self.version, doc["version"])
+        finally:
+            self._pending_writes -= 1
+            if not self._pending_writes:
+                # Documents that arrived while writes were in flight were skipped
+                try:
+                    await self.refresh()
+                except Exception as e:
+                    logger.warning(f"System status refresh failed: {e}")
+
+    async def _persist_in_background(self, status: SystemStatus) -> None:
+        try:
+            await self._persist(status)
+        except Exception as e:
+            logger.error(f"Failed to persist system status {status.mode}: {e}")
+
+    # ---------- Transitions ----------
+
+    def _apply_transition(self, mode: str, reason: str, dampening_factor: float = None) -> SystemStatus:
         current = self._status
         new_dampening = dampening_factor if dampening_factor is not None else current.dampening_factor
-        
+
         if mode == "NORMAL":
             new_dampening = 1.0
         elif mode == "FROZEN":
             new_dampening = 0.0
-            
+
         self._status = SystemStatus(
             mode=mode,
             dampening_factor=new_dampening,
@@ -53,6 +153,33 @@ class SystemStateManager:
             entered_at=datetime.utcnow(),
             last_checked_at=datetime.utcnow()
         )
+        if self._db is not None:
+            self._pending_writes += 1
+        return self._status
+
+    async def transition(self, mode: str, reason: str, dampening_factor: float = None) -> SystemStatus:
+        """Transition that returns once the whole cluster can see it."""
+        status = self._apply_transition(mode, reason, dampening_factor)
+        if self._db is not None:
+            await self._persist(status)
+        return status
+
+    def transition_to(self, mode: str, reason: str, dampening_factor: float = None):
+        status = self._apply_transition(mode, reason, dampening_factor)
+        if self._db is None:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._pending_writes -= 1
+            logger.error(f"System status {mode} not persisted: transition_to called outside the event loop")
+            return
+
+        # Write-through in the background (ordered by the persist lock)
+        task = loop.create_task(self._persist_in_background(status))
+        self._persist_tasks.add(task)
+        task.add_done_callback(self._persist_tasks.discard)
 
     # Backward compatibility
     @property
@@ -71,13 +198,13 @@ class SystemStateManager:
 
     def set_dampening(self, factor: float):
         self.transition_to("DAMPENED", "Manual dampening via set_dampening", dampening_factor=factor)
-        
+
     def increment_passes(self):
         self.consecutive_passes += 1
-        
+
     def reset_passes(self):
         self.consecutive_passes = 0
-        
+
     def get_passes(self) -> int:
         return self.consecutive_passes
 
@@ -0,0 +1,69 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from bson import ObjectId
+
+CHECKPOINT_ID = "canary_replay"
+
+# MCQs are scored without the LLM, so replaying them measures nothing
+REPLAYABLE_QUESTION_TYPES = ["coding", "explanation"]
+
+
+async def get_replay_checkpoint(db) -> Optional[ObjectId]:
+    doc = await db.calibration_checkpoints.find_one({"_id": CHECKPOINT_ID})
+    return doc.get("last_submission_id") if doc else None
+
+
+async def save_replay_checkpoint(db, last_submission_id: Optional[ObjectId], run_id: str) -> None:
+    await db.calibration_checkpoints.update_one(
+        {"_id": CHECKPOINT_ID},
+        {"$set": {
+            "last_submission_id": last_submission_id,
+            "run_id": run_id,
+            "updated_at": datetime.now(timezone.utc),
+        }},
+        upsert=True,
+    )
+
+
+async def get_replay_candidates(db, after_id: Optional[ObjectId], limit: int) -> List[dict]:
+    """
+    Evaluated submissions with a replayable context, in _id order after
+    the checkpoint (an _id index walk, no scan of older history).
+    """
+    query = {
+        "status": "evaluated",
+        "evaluation": {"$ne": None},
+        "question_type": {"$in": REPLAYABLE_QUESTION_TYPES},
+    }
+    if after_id is not None:
+        query["_id"] = {"$gt": after_id}
+
+    cursor = db.task_submissions.find(
+        query,
+        projection={
+            "task_instance_id": 1,
+            "payload": 1,
+            "skill": 1,
+            "difficulty": 1,
+            "question_type": 1,
+            "evaluation": 1,
+        },
+    ).sort("_id", 1).limit(limit)
+    return await cursor.to_list(length=limit)
+
+
+async def save_replay_results(db, results: List[dict]) -> None:
+    if results:
+        await db.canary_replays.insert_many(results, ordered=False)
+
+
+async def save_replay_run(db, summary: dict) -> None:
+    await db.canary_replay_runs.insert_one(summary)
+
+
+async def get_last_replay_failure_at(db) -> Optional[datetime]:
+    doc = await db.canary_replay_runs.find_one(
+        {"success": False}, sort=[("created_at", -1)], projection={"created_at": 1}
+    )
+    return doc["created_at"] if doc else None
@@ -0,0 +1,57 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.schemas.decision_context_snapshot import DecisionContextSnapshot
+
+
+def _snapshot_id(user_id: str, track_id: str) -> str:
+    return f"{user_id}:{track_id}"
+
+
+async def get_decision_snapshot(
+    db,
+    user_id: str,
+    track_id: str,
+    session=None
+) -> Optional[DecisionContextSnapshot]:
+    doc = await db.decision_context_snapshots.find_one(
+        {"_id": _snapshot_id(user_id, track_id)},
+        session=session
+    )
+    if not doc:
+        return None
+
+    doc.pop("_id")
+    return DecisionContextSnapshot(**doc)
+
+
+async def save_decision_snapshot(
+    db,
+    snapshot: DecisionContextSnapshot,
+    session=None
+):
+    snapshot.updated_at = datetime.now(timezone.utc)
+    data = snapshot.model_dump()
+
+    await db.decision_context_snapshots.replace_one(
+        {"_id": _snapshot_id(snapshot.user_id, snapshot.track_id)},
+        data,
+        upsert=True,
+        session=session
+    )
+
+
+async def delete_decision_snapshots(
+    db,
+    user_id: str,
+    session=None
+):
+    """
+    Drops every track's snapshot for the user. Called by skill_vector
+    writes that do not fold into the snapshot; get_decision_context then
+    rebuilds live until the next submission reseeds it.
+    """
+    await db.decision_context_snapshots.delete_many(
+        {"user_id": user_id},
+        session=session
+    )
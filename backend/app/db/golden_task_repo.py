@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+
+async def save_golden_runs(db, runs: List[dict]) -> None:
+    if runs:
+        await db.golden_task_runs.insert_many(runs, ordered=False)
+
+
+async def get_golden_baseline_runs(db, runs_per_task: int) -> Dict[str, List[List[float]]]:
+    """
+    task_id -> sample lists of its latest passing runs, oldest first.
+    """
+    pipeline = [
+        {"$match": {"passed_check": True}},
+        {"$sort": {"created_at": -1}},
+        {"$group": {"_id": "$task_id", "runs": {"$push": "$samples"}}},
+        {"$project": {"runs": {"$slice": ["$runs", runs_per_task]}}},
+    ]
+    cursor = db.golden_task_runs.aggregate(pipeline)
+    return {
+        doc["_id"]: list(reversed(doc["runs"]))
+        async for doc in cursor
+    }
+
+
+async def get_golden_run_span(db) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    (first run at, last failed run at); either is None when absent.
+    """
+    first = await db.golden_task_runs.find_one({}, sort=[("created_at", 1)], projection={"created_at": 1})
+    failed = await db.golden_task_runs.find_one(
+        {"passed_check": False}, sort=[("created_at", -1)], projection={"created_at": 1}
+    )
+    return (
+        first["created_at"] if first else None,
+        failed["created_at"] if failed else None,
+    )
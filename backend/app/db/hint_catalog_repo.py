@@ -0,0 +1,33 @@
+from datetime import datetime, timezone
+from typing import Dict, Tuple
+
+HintKey = Tuple[str, str, str]  # (skill, difficulty, level bucket)
+
+
+def _hint_id(prompt_version: str, key: HintKey) -> str:
+    skill, difficulty, bucket = key
+    return f"{prompt_version}:{skill}:{difficulty}:{bucket}"
+
+
+async def get_hint_catalog(db, prompt_version: str) -> Dict[HintKey, str]:
+    cursor = db.hint_catalog.find({"prompt_version": prompt_version})
+    return {
+        (doc["skill"], doc["difficulty"], doc["level_bucket"]): doc["hint"]
+        async for doc in cursor
+    }
+
+
+async def upsert_hint(db, prompt_version: str, key: HintKey, hint: str):
+    skill, difficulty, bucket = key
+    await db.hint_catalog.replace_one(
+        {"_id": _hint_id(prompt_version, key)},
+        {
+            "prompt_version": prompt_version,
+            "skill": skill,
+            "difficulty": difficulty,
+            "level_bucket": bucket,
+            "hint": hint,
+            "generated_at": datetime.now(timezone.utc),
+        },
+        upsert=True,
+    )
@@ -0,0 +1,47 @@
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from pymongo.errors import DuplicateKeyError
+
+from app.core.config import settings
+
+
+def _record_id(scope: str, user_id: str, key: str) -> str:
+    return f"{scope}:{user_id}:{key}"
+
+
+async def ensure_idempotency_indexes(db) -> None:
+    await db.idempotency_keys.create_index("created_at", expireAfterSeconds=settings.IDEMPOTENCY_TTL_SECONDS)
+
+
+async def get_idempotency_record(db, scope: str, user_id: str, key: str) -> Optional[dict]:
+    return await db.idempotency_keys.find_one({"_id": _record_id(scope, user_id, key)})
+
+
+async def save_idempotency_record(
+    db,
+    scope: str,
+    user_id: str,
+    key: str,
+    request_hash: str,
+    response: Any,
+    session=None,
+) -> None:
+    """
+    Stores the response of a completed request. Outside a transaction a
+    record already stored under the key (a concurrent retry that finished
+    first) is kept; inside one the duplicate aborts the transaction.
+    """
+    try:
+        await db.idempotency_keys.insert_one(
+            {
+                "_id": _record_id(scope, user_id, key),
+                "request_hash": request_hash,
+                "response": response,
+                "created_at": datetime.now(timezone.utc),
+            },
+            session=session,
+        )
+    except DuplicateKeyError:
+        if session is not None:
+            raise
@@ -0,0 +1,38 @@
+import logging
+
+from app.core.config import settings
+from app.db.idempotency_repo import ensure_idempotency_indexes
+from app.db.skill_update_journal_repo import ensure_skill_journal_indexes
+from app.db.submission_lease_repo import ensure_submission_lease_indexes
+from app.db.task_submission_repo import ensure_task_submission_indexes
+
+logger = logging.getLogger(__name__)
+
+
+async def ensure_indexes(db) -> None:
+    """
+    Creates the indexes the request paths rely on (idempotent).
+
+    The unique task_submissions index is the only duplicate-submission
+    check, so failing to build it fails startup (existing duplicates are
+    removed with scripts/dedupe_task_submissions.py). Any other failure is
+    logged per collection and does not block startup.
+    """
+    try:
+        await ensure_task_submission_indexes(db)
+    except Exception as e:
+        logger.critical(f"Failed to create the unique task_submissions index: {e}")
+        raise
+
+    setups = {
+        "skill_update_journal": ensure_skill_journal_indexes,
+        "idempotency_keys": ensure_idempotency_indexes,
+    }
+    if settings.SUBMISSION_LEASE_ENABLED:
+        setups["submission_leases"] = ensure_submission_lease_indexes
+
+    for collection, setup in setups.items():
+        try:
+            await setup(db)
+        except Exception as e:
+            logger.error(f"Failed to create indexes on {collection}: {e}")
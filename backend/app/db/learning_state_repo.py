@@ -1,13 +1,17 @@
 from datetime import datetime
 from bson import ObjectId
 from fastapi import HTTPException, status
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+from pymongo import UpdateOne
 
 from app.schemas.learning_state import (
     UserLearningState,
     SkillEntry,
 )
-from app.db.skill_registry_repo import skill_exists
+from app.db.skill_registry_repo import skill_exists, missing_skills
+from app.db.decision_context_repo import delete_decision_snapshots
+from app.domain.skill_vector_columns import SkillVectorColumns
 
 
 # -------------------------------
@@ -47,6 +51,7 @@ async def create_user_learning_state(
 
     result = await db.user_learning_state.insert_one(doc)
     doc["_id"] = result.inserted_id
+    await delete_decision_snapshots(db, user_id)
     return doc
 
 
@@ -70,6 +75,43 @@ async def get_user_learning_state(db, user_id: str, session=None) -> UserLearnin
     return UserLearningState(**doc)
 
 
+async def get_user_learning_states(db, user_ids: List[str], session=None) -> Dict[str, UserLearningState]:
+    """
+    Learning states of many users in one query, keyed by user id.
+    Users without a learning state are absent from the result.
+    """
+    cursor = db.user_learning_state.find(
+        {"user_id": {"$in": [ObjectId(user_id) for user_id in user_ids]}},
+        session=session
+    )
+
+    states = {}
+    async for doc in cursor:
+        doc["user_id"] = str(doc["user_id"])
+        states[doc["user_id"]] = UserLearningState(**doc)
+    return states
+
+
+async def get_skill_vector_columns(db, user_id: str, session=None) -> SkillVectorColumns:
+    """
+    Level/confidence columns only; projects the skill_vector and skips
+    building the nested SkillEntry models.
+    """
+    doc = await db.user_learning_state.find_one(
+        {"user_id": ObjectId(user_id)},
+        {"skill_vector": 1},
+        session=session
+    )
+
+    if not doc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User learning state not found",
+        )
+
+    return SkillVectorColumns.from_document(doc.get("skill_vector") or {})
+
+
 # -------------------------------
 # ADD OR UPDATE A SKILL ENTRY
 # (used by SkillVector update engine)
@@ -106,6 +148,44 @@ async def add_or_update_skill(
             detail="User learning state not found",
         )
 
+    await delete_decision_snapshots(db, user_id)
+
+
+async def add_or_update_skills(
+    db,
+    user_id: str,
+    skills: Dict[str, dict],
+):
+    """
+    add_or_update_skill for several skills in one update; every skill id
+    is checked against the registry before anything is written.
+    """
+    missing = await missing_skills(db, skills)
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Skills not found in registry: {', '.join(sorted(missing))}",
+        )
+
+    update_payload: Dict[str, Any] = {
+        f"skill_vector.{skill_id}": SkillEntry(**skill_data).dict()
+        for skill_id, skill_data in skills.items()
+    }
+    update_payload["updated_at"] = datetime.utcnow()
+
+    result = await db.user_learning_state.update_one(
+        {"user_id": ObjectId(user_id)},
+        {"$set": update_payload},
+    )
+
+    if result.matched_count == 0:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User learning state not found",
+        )
+
+    await delete_decision_snapshots(db, user_id)
+
 
 # -------------------------------
 # APPLY MULTIPLE SKILL UPDATES
@@ -139,6 +219,32 @@ async def apply_skill_vector_updates(
         )
 
 
+async def bulk_apply_skill_vector_updates(
+    db,
+    updates: Dict[str, dict[str, SkillEntry]],
+    session=None
+) -> int:
+    """
+    apply_skill_vector_updates for many users in one bulk_write
+    (user_id -> updated skills). Returns the number of users matched.
+    """
+    if not updates:
+        return 0
+
+    now = datetime.utcnow()
+    ops = []
+    for user_id, updated_skills in updates.items():
+        update_payload: Dict[str, Any] = {
+            f"skill_vector.{skill_id}": entry.model_dump()
+            for skill_id, entry in updated_skills.items()
+        }
+        update_payload["updated_at"] = now
+        ops.append(UpdateOne({"user_id": ObjectId(user_id)}, {"$set": update_payload}))
+
+    result = await db.user_learning_state.bulk_write(ops, ordered=False, session=session)
+    return result.matched_count
+
+
 # -------------------------------
 # TASK TRACKING
 # -------------------------------
@@ -193,4 +299,7 @@ async def update_user_learning_state(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User learning state not found",
         )
+
+    if any(key == "skill_vector" or key.startswith("skill_vector.") for key in update_data):
+        await delete_decision_snapshots(db, user_id)
     return result
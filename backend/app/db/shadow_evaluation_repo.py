@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import List
+
+
+async def save_shadow_evaluation(db, doc: dict) -> None:
+    await db.shadow_evaluations.insert_one(doc)
+
+
+async def get_shadow_summary(db, since: datetime) -> List[dict]:
+    """
+    Live vs candidate agreement per (question type, candidate prompt
+    version, candidate model) since `since`.
+    """
+    pipeline = [
+        {"$match": {"created_at": {"$gte": since}}},
+        {"$group": {
+            "_id": {
+                "question_type": "$question_type",
+                "prompt_version": "$shadow.prompt_version",
+                "model_name": "$shadow.model_name",
+            },
+            "count": {"$sum": 1},
+            "mean_delta": {"$avg": "$delta"},
+            "mean_abs_delta": {"$avg": {"$abs": "$delta"}},
+            "std_delta": {"$stdDevPop": "$delta"},
+            "pass_agreement": {"$avg": {"$cond": ["$passed_agrees", 1, 0]}},
+            "live_mean_score": {"$avg": "$live.score"},
+            "shadow_mean_score": {"$avg": "$shadow.score"},
+        }},
+        {"$sort": {"_id.question_type": 1, "_id.prompt_version": 1}},
+    ]
+    rows = await db.shadow_evaluations.aggregate(pipeline).to_list(length=None)
+    return [{**row.pop("_id"), **row} for row in rows]
@@ -1,19 +1,88 @@
-from typing import List
+import asyncio
+import time
+from typing import Iterable, List, Optional, Set
+
+from app.core.config import settings
+
+
+class SkillRegistryCache:
+    """
+    In-memory set of registered skill ids. Reloaded on a TTL so skills
+    registered by other processes show up; ids missing from the set are
+    confirmed against Mongo before being rejected.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._ids: Set[str] = set()
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def is_stale(self) -> bool:
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl_seconds
+
+    async def load(self, db) -> int:
+        ids = {doc["_id"] async for doc in db.skill_registry.find({}, {"_id": 1})}
+        self._ids = ids
+        self._loaded_at = time.monotonic()
+        return len(ids)
+
+    async def ids(self, db) -> Set[str]:
+        if self.is_stale():
+            async with self._lock:
+                # Concurrent callers wait for one reload
+                if self.is_stale():
+                    await self.load(db)
+        return self._ids
+
+    def add(self, skill_id: str) -> None:
+        self._ids.add(skill_id)
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+
+skill_registry = SkillRegistryCache(ttl_seconds=settings.SKILL_REGISTRY_REFRESH_SECONDS)
+
+
+async def load_skill_registry(db) -> int:
+    return await skill_registry.load(db)
+
 
 async def get_all_skills(db) -> List[str]:
-    skills = await db.skill_registry.find().to_list(length=100)
-    return [s["_id"] for s in skills]
+    return sorted(await skill_registry.ids(db))
+
 
 async def skill_exists(db, skill_id: str) -> bool:
-    return await db.skill_registry.find_one({"_id": skill_id}) is not None
+    return not await missing_skills(db, [skill_id])
+
+
+async def missing_skills(db, skill_ids: Iterable[str]) -> Set[str]:
+    """
+    Skill ids not in the registry, checked in one pass. Ids the cached set
+    does not know are confirmed with a single query.
+    """
+    missing = set(skill_ids) - await skill_registry.ids(db)
+    if not missing:
+        return missing
+
+    async for doc in db.skill_registry.find({"_id": {"$in": list(missing)}}, {"_id": 1}):
+        skill_registry.add(doc["_id"])
+        missing.discard(doc["_id"])
+    return missing
+
 
 async def add_skill(db, skill_id: str):
-    return await db.skill_registry.insert_one({"_id": skill_id})
+    result = await db.skill_registry.insert_one({"_id": skill_id})
+    skill_registry.add(skill_id)
+    return result
 
 
 async def deprecate_skill(db, skill_id: str):
     # Set active: false, deprecated: true
-    return await db.skill_registry.update_one(
+    result = await db.skill_registry.update_one(
         {"_id": skill_id},
         {"$set": {"active": False, "deprecated": True}}
     )
+    skill_registry.invalidate()
+    return result
@@ -0,0 +1,54 @@
+from datetime import datetime, timezone
+from typing import List
+
+from pymongo import ASCENDING
+
+from app.schemas.skill_update_journal import SkillUpdateJournalEntry
+
+# Entry lifecycle: pending -> claimed (by one replay) -> deleted once applied
+PENDING = "pending"
+CLAIMED = "claimed"
+
+
+async def ensure_skill_journal_indexes(db) -> None:
+    await db.skill_update_journal.create_index([("status", ASCENDING), ("_id", ASCENDING)])
+
+
+async def append_skill_journal(db, entries: List[SkillUpdateJournalEntry], session=None) -> None:
+    if entries:
+        await db.skill_update_journal.insert_many(
+            [{**entry.model_dump(), "status": PENDING} for entry in entries],
+            session=session,
+        )
+
+
+async def claim_journal_batch(db, replay_id: str, limit: int, stale_before: datetime) -> List[dict]:
+    """
+    Claims the oldest `limit` claimable entries for one replay, in
+    insertion order. Entries claimed by a replay that died before
+    `stale_before` are claimable again.
+    """
+    claimable = {"$or": [
+        {"status": PENDING},
+        {"status": CLAIMED, "claimed_at": {"$lt": stale_before}},
+    ]}
+
+    cursor = db.skill_update_journal.find(claimable, projection={"_id": 1}).sort("_id", 1).limit(limit)
+    ids = [doc["_id"] async for doc in cursor]
+    if not ids:
+        return []
+
+    await db.skill_update_journal.update_many(
+        {"_id": {"$in": ids}, **claimable},
+        {"$set": {"status": CLAIMED, "replay_id": replay_id, "claimed_at": datetime.now(timezone.utc)}},
+    )
+    cursor = db.skill_update_journal.find({"replay_id": replay_id, "status": CLAIMED}).sort("_id", 1)
+    return await cursor.to_list(length=None)
+
+
+async def delete_journal_entries(db, ids: list, session=None) -> None:
+    await db.skill_update_journal.delete_many({"_id": {"$in": ids}}, session=session)
+
+
+async def count_pending_journal(db) -> int:
+    return await db.skill_update_journal.count_documents({"status": {"$in": [PENDING, CLAIMED]}})
@@ -0,0 +1,30 @@
+from datetime import datetime, timedelta, timezone
+
+from pymongo.errors import DuplicateKeyError
+
+
+async def ensure_submission_lease_indexes(db) -> None:
+    # Expired leases are reclaimed on acquire; TTL only garbage-collects them
+    await db.submission_leases.create_index("expires_at", expireAfterSeconds=0)
+
+
+async def acquire_submission_lease(db, user_id: str, owner: str, ttl_seconds: float) -> bool:
+    """
+    Takes the user's submission lease unless another node holds a live one.
+    One upsert: matches only an expired lease, so a live lease makes the
+    insert collide on _id.
+    """
+    now = datetime.now(timezone.utc)
+    try:
+        await db.submission_leases.update_one(
+            {"_id": user_id, "expires_at": {"$lte": now}},
+            {"$set": {"owner": owner, "expires_at": now + timedelta(seconds=ttl_seconds)}},
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        return False
+    return True
+
+
+async def release_submission_lease(db, user_id: str, owner: str) -> None:
+    await db.submission_leases.delete_one({"_id": user_id, "owner": owner})
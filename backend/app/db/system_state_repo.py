@@ -0,0 +1,31 @@
+from typing import Optional
+
+from pymongo import ReturnDocument
+
+# Single cluster-wide document holding the current SystemStatus
+SYSTEM_STATE_ID = "system_status"
+
+
+async def get_system_state(db) -> Optional[dict]:
+    return await db.system_state.find_one({"_id": SYSTEM_STATE_ID})
+
+
+async def save_system_state(db, fields: dict) -> dict:
+    """
+    Writes a new status and bumps the version counter; returns the stored
+    document. Last writer wins; readers order updates by version.
+    """
+    return await db.system_state.find_one_and_update(
+        {"_id": SYSTEM_STATE_ID},
+        {"$set": fields, "$inc": {"version": 1}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+
+
+def watch_system_state(db):
+    """Change stream of the status document (replica sets only)."""
+    return db.system_state.watch(
+        [{"$match": {"documentKey._id": SYSTEM_STATE_ID}}],
+        full_document="updateLookup",
+    )
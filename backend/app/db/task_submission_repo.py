@@ -1,8 +1,21 @@
 from datetime import datetime, timezone
 from bson import ObjectId
+from pymongo import ASCENDING
+from pymongo.errors import DuplicateKeyError
+from app.core.exceptions import DuplicateSubmissionError
 from app.schemas.task_submission import TaskSubmission
 
 
+async def ensure_task_submission_indexes(db):
+    # One submission per task instance; enforced here instead of a pre-read.
+    # Fails on existing duplicates: scripts/dedupe_task_submissions.py
+    await db.task_submissions.create_index(
+        [("user_id", ASCENDING), ("slot_id", ASCENDING), ("task_instance_id", ASCENDING)],
+        unique=True,
+        name="unique_submission",
+    )
+
+
 class TaskSubmissionRepo:
     def __init__(self, db):
         self.collection = db.task_submissions
@@ -21,7 +34,12 @@ class TaskSubmissionRepo:
     async def create_submission(self, data: dict, session=None) -> TaskSubmission:
         data["created_at"] = datetime.now(timezone.utc)
 
-        result = await self.collection.insert_one(data, session=session)
+        try:
+            result = await self.collection.insert_one(data, session=session)
+        except DuplicateKeyError:
+            raise DuplicateSubmissionError(
+                f"Submission already exists for task instance {data.get('task_instance_id')}"
+            )
 
         saved = await self.collection.find_one(
             {"_id": result.inserted_id},
@@ -105,8 +123,8 @@ class TaskSubmissionRepo:
             {"$match": match_stage},
             {"$group": {
                 "_id": None,
-                "avg_score": {"$avg": "$score"},
-                "std_dev": {"$stdDevPop": "$score"},
+                "avg_score": {"$avg": "$evaluation.score"},
+                "std_dev": {"$stdDevPop": "$evaluation.score"},
                 "count": {"$sum": 1}
             }}
         ]
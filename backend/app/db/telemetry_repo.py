@@ -0,0 +1,130 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pymongo import UpdateOne
+from pymongo.errors import OperationFailure
+
+from app.domain.score_distribution import ScoreDistribution
+
+logger = logging.getLogger(__name__)
+
+# collection -> time-series options (records are append-only, queried by time)
+TELEMETRY_COLLECTIONS = {
+    "evaluation_telemetry": {"timeField": "created_at", "metaField": "user_id", "granularity": "minutes"},
+    "skill_update_telemetry": {"timeField": "created_at", "metaField": "user_id", "granularity": "minutes"},
+    "decision_traces": {"timeField": "created_at", "metaField": "user_id", "granularity": "minutes"},
+}
+
+SCORE_ROLLUP_COLLECTION = "evaluation_score_rollups"
+
+# Segment dimensions of a rollup document, besides the hour
+ROLLUP_DIMENSIONS = ("skill", "difficulty", "prompt_version")
+
+RollupKey = Tuple[datetime, Optional[str], Optional[str], Optional[str]]  # (hour, *ROLLUP_DIMENSIONS)
+
+
+def rollup_hour(ts: datetime) -> datetime:
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def _rollup_id(key: RollupKey) -> str:
+    hour, *segment = key
+    return "|".join([hour.strftime("%Y-%m-%dT%H")] + [value or "-" for value in segment])
+
+
+async def ensure_telemetry_collections(db) -> None:
+    """
+    Creates the telemetry collections as time-series collections. Servers
+    without time-series support (< 5.0) fall back to regular collections.
+    """
+    existing = set(await db.list_collection_names())
+
+    for name, timeseries in TELEMETRY_COLLECTIONS.items():
+        if name in existing:
+            continue
+        try:
+            await db.create_collection(name, timeseries=timeseries)
+        except OperationFailure as e:
+            logger.warning(f"Time-series collection {name} unavailable ({e}); using a regular collection.")
+            await db[name].create_index("created_at")
+
+    await db[SCORE_ROLLUP_COLLECTION].create_index([("hour", 1)] + [(d, 1) for d in ROLLUP_DIMENSIONS])
+
+
+async def insert_telemetry(db, collection: str, docs: List[dict]) -> None:
+    if docs:
+        await db[collection].insert_many(docs, ordered=False)
+
+
+async def apply_score_rollups(db, rollups: Dict[RollupKey, ScoreDistribution]) -> None:
+    """
+    Folds per-(hour, skill, difficulty, prompt_version) partial
+    distributions into the rollup documents with $inc upserts.
+    """
+    if not rollups:
+        return
+
+    ops = []
+    for key, distribution in rollups.items():
+        hour, *segment = key
+        ops.append(UpdateOne(
+            {"_id": _rollup_id(key)},
+            {
+                "$setOnInsert": {"hour": hour, **dict(zip(ROLLUP_DIMENSIONS, segment))},
+                "$inc": distribution.to_increments(),
+            },
+            upsert=True,
+        ))
+
+    await db[SCORE_ROLLUP_COLLECTION].bulk_write(ops, ordered=False)
+
+
+async def get_score_distributions(
+    db,
+    since: datetime,
+    until: Optional[datetime] = None,
+    group_by: Sequence[str] = (),
+    **filters: Optional[str],
+) -> Dict[tuple, ScoreDistribution]:
+    """
+    Merges the hourly rollups in [since, until) into one ScoreDistribution
+    per `group_by` segment (a single `()` key when not grouping). Keyword
+    filters restrict any of ROLLUP_DIMENSIONS, e.g. skill="arrays".
+    """
+    hour_range = {"$gte": rollup_hour(since)}
+    if until is not None:
+        hour_range["$lt"] = until
+
+    query = {"hour": hour_range}
+    for dimension, value in filters.items():
+        if dimension not in ROLLUP_DIMENSIONS:
+            raise ValueError(f"Unknown rollup dimension: {dimension}")
+        if value is not None:
+            query[dimension] = value
+
+    merged: Dict[tuple, ScoreDistribution] = {}
+    async for doc in db[SCORE_ROLLUP_COLLECTION].find(query):
+        segment = tuple(doc.get(dimension) for dimension in group_by)
+        merged.setdefault(segment, ScoreDistribution()).merge_document(doc)
+    return merged
+
+
+async def get_score_stats(
+    db,
+    hours: int = 24,
+    skill: Optional[str] = None,
+    difficulty: Optional[str] = None,
+    prompt_version: Optional[str] = None,
+) -> dict:
+    """
+    Score distribution over the last `hours`, read from the hourly rollups.
+    """
+    since = datetime.now(timezone.utc) - timedelta(hours=hours)
+    merged = await get_score_distributions(
+        db, since, skill=skill, difficulty=difficulty, prompt_version=prompt_version
+    )
+    distribution = merged.get(())
+    return distribution.to_stats() if distribution else {}
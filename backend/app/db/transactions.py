@@ -0,0 +1,87 @@
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable, TypeVar
+
+from pymongo.errors import PyMongoError
+
+from app.core.config import settings
+from app.db.base import get_client
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+TRANSIENT_TRANSACTION_ERROR = "TransientTransactionError"
+UNKNOWN_COMMIT_RESULT = "UnknownTransactionCommitResult"
+
+
+def is_transient(error: BaseException) -> bool:
+    return isinstance(error, PyMongoError) and (
+        error.has_error_label(TRANSIENT_TRANSACTION_ERROR)
+        or error.has_error_label(UNKNOWN_COMMIT_RESULT)
+    )
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff for the given (1-based) attempt."""
+    ceiling = min(
+        settings.TRANSACTION_BACKOFF_MAX_SECONDS,
+        settings.TRANSACTION_BACKOFF_BASE_SECONDS * 2 ** (attempt - 1),
+    )
+    return random.uniform(0, ceiling)
+
+
+async def run_transaction(
+    fn: Callable[..., Awaitable[T]],
+    max_attempts: int = settings.TRANSACTION_MAX_ATTEMPTS,
+    client=None,
+) -> T:
+    """
+    Runs `fn(session)` in a transaction and commits it, following the
+    driver's retry rules: the whole transaction is retried on
+    TransientTransactionError, only the commit on
+    UnknownTransactionCommitResult (the writes may already be durable).
+    Both back off with jitter; any other error aborts and propagates.
+    """
+    client = client or get_client()
+    async with await client.start_session() as session:
+        attempt = 0
+        while True:
+            attempt += 1
+            session.start_transaction()
+            try:
+                result = await fn(session)
+            except BaseException as e:
+                if session.in_transaction:
+                    await session.abort_transaction()
+                if attempt < max_attempts and isinstance(e, PyMongoError) and e.has_error_label(TRANSIENT_TRANSACTION_ERROR):
+                    logger.info(f"Transient transaction error (attempt {attempt}), retrying: {e}")
+                    await asyncio.sleep(backoff_delay(attempt))
+                    continue
+                raise
+
+            try:
+                await _commit_with_retry(session, max_attempts)
+            except PyMongoError as e:
+                if attempt < max_attempts and e.has_error_label(TRANSIENT_TRANSACTION_ERROR):
+                    logger.info(f"Transient commit error (attempt {attempt}), retrying transaction: {e}")
+                    await asyncio.sleep(backoff_delay(attempt))
+                    continue
+                raise
+            return result
+
+
+async def _commit_with_retry(session, max_attempts: int) -> None:
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            await session.commit_transaction()
+            return
+        except PyMongoError as e:
+            if attempt < max_attempts and e.has_error_label(UNKNOWN_COMMIT_RESULT):
+                logger.info(f"Unknown commit result (attempt {attempt}), retrying commit: {e}")
+                await asyncio.sleep(backoff_delay(attempt))
+                continue
+            raise
@@ -1,4 +1,9 @@
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
+from typing import Any, Optional, Tuple
+
+from app.core.config import settings
 
 from app.schemas.roadmap_state import RoadmapState
 from app.domain.roadmap_validator import (
@@ -14,9 +19,88 @@ def ensure_utc(dt):
     return dt
 
 
+class RoadmapCache:
+    """
+    Per-process LRU of deserialized active roadmaps, keyed by user and
+    tagged with the document `_id` and version they were loaded at (a
+    regenerated roadmap is a new document starting again at version 1).
+    Entries are shared instances loaded from Mongo: they are only served
+    to read-only callers, after a probe confirms they are current.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Any, int, RoadmapState]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+        # Moving averages of a full load and of a version probe
+        self._load_seconds: Optional[float] = None
+        self._probe_seconds: Optional[float] = None
+
+    def get(self, user_id: str, doc_id: Any, version: int) -> Optional[RoadmapState]:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[:2] != (doc_id, version):
+            return None
+        self._entries.move_to_end(user_id)
+        return entry[2]
+
+    def put(self, user_id: str, doc_id: Any, version: int, roadmap: RoadmapState) -> None:
+        if self.max_size <= 0:
+            return
+        entry = self._entries.get(user_id)
+        if entry is not None and entry[0] == doc_id and entry[1] > version:
+            # A slower read finishing after a newer one
+            return
+        self._entries[user_id] = (doc_id, version, roadmap)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @staticmethod
+    def _average(current: Optional[float], sample: float) -> float:
+        return sample if current is None else 0.9 * current + 0.1 * sample
+
+    def record_hit(self, probe_seconds: float) -> None:
+        self.hits += 1
+        self._probe_seconds = self._average(self._probe_seconds, probe_seconds)
+        if self._load_seconds is not None:
+            self.saved_seconds += max(0.0, self._load_seconds - probe_seconds)
+
+    def record_miss(self, probe_seconds: float, load_seconds: float) -> None:
+        self.misses += 1
+        self._probe_seconds = self._average(self._probe_seconds, probe_seconds)
+        self._load_seconds = self._average(self._load_seconds, load_seconds)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "saved_ms": round(self.saved_seconds * 1000, 3),
+            "avg_load_ms": round((self._load_seconds or 0.0) * 1000, 3),
+            "avg_probe_ms": round((self._probe_seconds or 0.0) * 1000, 3),
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+roadmap_cache = RoadmapCache(max_size=settings.ROADMAP_CACHE_MAX_SIZE)
+
+
 class UserRoadmapRepo:
-    def __init__(self, db):
+    def __init__(self, db, cache: Optional[RoadmapCache] = None):
         self.collection = db.user_roadmaps
+        self.cache = cache or roadmap_cache
 
     # ---------- Internal helpers ----------
 
@@ -33,23 +117,19 @@ class UserRoadmapRepo:
         data["generated_at"] = ensure_utc(data.get("generated_at"))
         data["last_evaluated_at"] = ensure_utc(data.get("last_evaluated_at"))
 
-        return RoadmapState(**data)
+        roadmap = RoadmapState.model_validate(data)
+        # Every persisted roadmap passed validation on write
+        roadmap.trust_baseline()
+        return roadmap
 
     def _to_persistence(self, roadmap: RoadmapState, *, is_new: bool) -> dict:
         """
         Domain → Mongo
         """
+        # BSON-ready in one pass (TaskSlot serializes flags as a list)
         data = roadmap.model_dump()
         data["user_id"] = str(data["user_id"])
 
-        # FIX: Convert sets to lists for MongoDB (specifically TaskSlot.flags)
-        if "phases" in data:
-            for phase in data["phases"]:
-                if "slots" in phase:
-                    for slot in phase["slots"]:
-                        if "flags" in slot and isinstance(slot["flags"], set):
-                            slot["flags"] = list(slot["flags"])
-
         if is_new:
             data["is_active"] = True
 
@@ -57,28 +137,62 @@ class UserRoadmapRepo:
 
     # ---------- Public API ----------
 
-    async def get_user_roadmap(self, user_id: str, session=None) -> RoadmapState | None:
-        doc = await self.collection.find_one(
+    async def _find_active(self, user_id: str, projection=None, session=None) -> Optional[dict]:
+        return await self.collection.find_one(
             {"user_id": str(user_id), "is_active": True},
+            projection,
             session=session
         )
 
+    async def get_user_roadmap(self, user_id: str, session=None) -> RoadmapState | None:
+        doc = await self._find_active(user_id, session=session)
+
         if not doc:
             return None
 
         return self._to_domain(doc)
 
+    async def get_user_roadmap_readonly(self, user_id: str) -> RoadmapState | None:
+        """
+        Active roadmap for callers that do not modify it. May return the
+        cached instance shared with other requests, so the result must not
+        be mutated; a projection on `_id` and `version` confirms it is current
+        first. Anything that writes the roadmap back uses get_user_roadmap.
+        """
+        user_id = str(user_id)
+        started = time.perf_counter()
+        probe = await self._find_active(user_id, {"_id": 1, "version": 1})
+        probed = time.perf_counter()
+
+        if not probe:
+            self.cache.invalidate(user_id)
+            return None
+
+        roadmap = self.cache.get(user_id, probe["_id"], probe["version"])
+        if roadmap is not None:
+            self.cache.record_hit(probed - started)
+            return roadmap
+
+        doc = await self._find_active(user_id)
+        roadmap = self._to_domain(doc) if doc else None
+        self.cache.record_miss(probed - started, time.perf_counter() - probed)
+        if roadmap is None:
+            return None
+        self.cache.put(user_id, doc["_id"], roadmap.version, roadmap)
+        return roadmap
+
     async def create_roadmap(self, roadmap: RoadmapState, session=None) -> None:
-        # 🔒 HARD GATE
+        # 🔒 HARD GATE (full pass unless the caller already validated it)
         validate_roadmap_state(roadmap)
 
         await self.collection.insert_one(
             self._to_persistence(roadmap, is_new=True),
             session=session
         )
+        self.cache.invalidate(str(roadmap.user_id))
 
     async def update_roadmap(self, roadmap: RoadmapState, expected_version: int, session=None) -> None:
-        # 🔒 HARD GATE
+        # 🔒 HARD GATE (incremental: only what changed since the last pass)
         validate_roadmap_state(roadmap)
 
         # Prepare data, excluding version (handled by $inc)
@@ -109,7 +223,12 @@ class UserRoadmapRepo:
             raise ConcurrencyError(
                 f"Roadmap update failed. Version mismatch (expected {expected_version})."
             )
-        
+
+        # Keep the instance in step with the stored document. The caller
+        # still owns it, so the next read-only load re-caches from Mongo.
+        roadmap.version = expected_version + 1
+        self.cache.invalidate(str(roadmap.user_id))
+
     async def get_latest_roadmap(self, user_id: str, session=None) -> RoadmapState | None:
         doc = await self.collection.find_one(
             {"user_id": str(user_id)},
@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional, Literal
+from typing import List, Dict, Optional, Literal, Tuple, Union
 from pydantic import BaseModel, Field
 from datetime import datetime, timedelta
 import statistics
@@ -6,6 +6,8 @@ import statistics
 from app.schemas.learning_state import SkillEntry
 from app.schemas.skill_history import SkillHistory
 from app.schemas.task_submission import TaskSubmission
+from app.schemas.decision_context_snapshot import DecisionContextSnapshot, SnapshotSkill
+from app.domain.skill_vector_columns import SkillVectorColumns
 
 class InvariantScore(BaseModel):
     invariant_id: str
@@ -44,63 +46,159 @@ def derive_stability(volatility: float, velocity: float) -> Literal["stable", "u
 def build_decision_context(
     user_id: str,
     track_id: str,
-    skill_vector: Dict[str, SkillEntry],
+    skill_vector: Union[Dict[str, SkillEntry], SkillVectorColumns],
     history: List[SkillHistory],
     submissions: List[TaskSubmission],
     lookback_window: int = 5
 ) -> DecisionContext:
     """
     Transforms raw skill data and history into an actionable DecisionContext.
+    Only level/confidence are read, so SkillVectorColumns works as well.
     """
-    invariant_scores: List[InvariantScore] = []
-    all_scores: Dict[str, float] = {}
-    
-    # 1. Group history by skill to calculate velocity and volatility
-    skill_series: Dict[str, List[float]] = {}
-    for h in history:
-        if h.skill not in skill_series:
-            skill_series[h.skill] = []
-        skill_series[h.skill].append(float(h.new_level) / 100.0 if h.new_level > 1 else h.new_level)
+    if not isinstance(skill_vector, SkillVectorColumns):
+        skill_vector = SkillVectorColumns.from_entries(skill_vector)
 
-    total_velocity = 0.0
-    velocity_count = 0
+    # 1. Group history by skill to calculate velocity and volatility
+    skill_series = _group_history(history)
 
-    for skill_id, entry in skill_vector.items():
-        all_scores[skill_id] = entry.level
+    skill_signals = []
+    for skill_id, level, confidence in skill_vector:
         recent_scores = skill_series.get(skill_id, [])[-lookback_window:]
         
         # Calculate volatility (STDEV)
         volatility = statistics.stdev(recent_scores) if len(recent_scores) > 1 else 0.0
         
         # Calculate velocity (Mean Delta)
-        velocity = 0.0
+        velocity = None
         if len(recent_scores) > 1:
             deltas = [recent_scores[i] - recent_scores[i-1] for i in range(1, len(recent_scores))]
             velocity = statistics.mean(deltas)
+
+        skill_signals.append((skill_id, level, confidence, volatility, velocity))
+
+    # 1.5 Extract Recent Probes (Fatigue)
+    recent_templates = []
+    if submissions:
+         # submissions are sorted latest first in repo
+        recent_templates = [s.task_instance_id for s in submissions[:lookback_window]]
+
+    return _assemble_context(user_id, track_id, skill_signals, recent_templates)
+
+
+def build_decision_context_from_snapshot(snapshot: DecisionContextSnapshot) -> DecisionContext:
+    """
+    Same DecisionContext as build_decision_context, read from the
+    write-maintained snapshot instead of raw history. Nothing records
+    skill_history, so volatility and velocity are the values
+    build_decision_context derives from an empty history.
+    """
+    skill_signals = [
+        (skill_id, stats.level, stats.confidence, 0.0, None)
+        for skill_id, stats in snapshot.skills.items()
+    ]
+
+    return _assemble_context(
+        snapshot.user_id,
+        snapshot.track_id,
+        skill_signals,
+        list(snapshot.recent_template_ids),
+    )
+
+
+def build_decision_snapshot(
+    user_id: str,
+    track_id: str,
+    skill_vector: Dict[str, SkillEntry],
+    submissions: List[TaskSubmission],
+    lookback_window: int = 5
+) -> DecisionContextSnapshot:
+    """
+    Seeds a snapshot for users who predate snapshots.
+    """
+    snapshot = DecisionContextSnapshot(user_id=user_id, track_id=track_id)
+
+    for skill_id, entry in skill_vector.items():
+        snapshot.skills[skill_id] = SnapshotSkill(level=entry.level, confidence=entry.confidence)
+
+    # submissions are sorted latest first in repo
+    snapshot.recent_template_ids = [s.task_instance_id for s in submissions[:lookback_window]]
+    return snapshot
+
+
+def update_decision_snapshot(
+    snapshot: DecisionContextSnapshot,
+    skill_vector: Dict[str, SkillEntry],
+    task_instance_id: str,
+    lookback_window: int = 5
+) -> None:
+    """
+    Folds one evaluated submission into the snapshot: every skill's
+    level/confidence is synced and the task instance becomes the most
+    recent template.
+    """
+    for skill_id, entry in skill_vector.items():
+        stats = snapshot.skills.get(skill_id)
+        if stats is None:
+            stats = snapshot.skills[skill_id] = SnapshotSkill()
+
+        stats.level = entry.level
+        stats.confidence = entry.confidence
+
+    # Already listed when a journaled (frozen-time) update is replayed
+    if task_instance_id not in snapshot.recent_template_ids:
+        snapshot.recent_template_ids = ([task_instance_id] + snapshot.recent_template_ids)[:lookback_window]
+
+
+def _group_history(history: List[SkillHistory]) -> Dict[str, List[float]]:
+    skill_series: Dict[str, List[float]] = {}
+    for h in history:
+        if h.skill not in skill_series:
+            skill_series[h.skill] = []
+        skill_series[h.skill].append(float(h.new_level) / 100.0 if h.new_level > 1 else h.new_level)
+    return skill_series
+
+
+def _assemble_context(
+    user_id: str,
+    track_id: str,
+    skill_signals: List[Tuple[str, float, float, float, Optional[float]]],
+    recent_templates: List[str],
+) -> DecisionContext:
+    """
+    Shared tail of context building: (skill, level, confidence, volatility,
+    velocity) per skill -> pressure, categorization and overall metrics.
+    A velocity of None means too little history to measure one.
+    """
+    invariant_scores: List[InvariantScore] = []
+    all_scores: Dict[str, float] = {}
+
+    total_velocity = 0.0
+    velocity_count = 0
+
+    for skill_id, level, confidence, volatility, velocity in skill_signals:
+        all_scores[skill_id] = level
+
+        if velocity is not None:
             total_velocity += velocity
             velocity_count += 1
+        else:
+            velocity = 0.0
         
         # Calculate Invariant Pressure (V4)
         # Pressure = (1.0 - score) * importance * volatility
         # We assume importance = 1.0 for now, but volatility is a multiplier.
         # High volatility on a low score = Urgent Pressure.
-        pressure = (1.0 - entry.level) * (1.0 + volatility)
+        pressure = (1.0 - level) * (1.0 + volatility)
 
         invariant_scores.append(InvariantScore(
             invariant_id=skill_id,
-            score=entry.level,
-            confidence=entry.confidence,
+            score=level,
+            confidence=confidence,
             volatility=volatility,
             stability=derive_stability(volatility, velocity),
             pressure=pressure
         ))
 
-    # 1.5 Extract Recent Probes (Fatigue)
-    recent_templates = []
-    if submissions:
-         # submissions are sorted latest first in repo
-        recent_templates = [s.task_instance_id for s in submissions[:lookback_window]]
-
     # 2. Categorize Invariants
     # Sorted by score ascending
     sorted_invariants = sorted(invariant_scores, key=lambda x: x.score)
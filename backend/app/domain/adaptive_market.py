@@ -1,7 +1,9 @@
 from typing import List, Tuple, Optional, Set, Dict
+import numpy as np
 from app.schemas.task_template import TaskTemplate
 from app.domain.adaptive_control import DecisionContext
-from app.domain.task_template_loader import get_all_templates
+from app.domain.probe_features import ProbeFeatures
+from app.domain.task_template_loader import get_probe_features
 from app.schemas.market_decision import MarketDecision, TradeRationale
 
 class AdaptiveMarket:
@@ -13,74 +15,134 @@ class AdaptiveMarket:
     def build_global_probe_pool(self) -> List[TaskTemplate]:
         """
         Scans ALL available templates across the curriculum.
+        The returned list is the registry's own and must not be mutated.
         """
-        return get_all_templates()
+        return get_probe_features().templates
 
-    def rank_probes(
-        self, 
-        probes: List[TaskTemplate], 
-        context: DecisionContext
-    ) -> List[Tuple[float, TaskTemplate, str, Dict]]:
+    def _features_for(self, probes: List[TaskTemplate]) -> ProbeFeatures:
         """
-        Scores probes and returns (score, template, source_slot, metrics).
+        Reuses the registry's precomputed features when ranking the global
+        pool; any other list (tests, callers passing a subset) is featurized
+        on the fly.
         """
-        ranked_probes: List[Tuple[float, TaskTemplate, str, Dict]] = []
-        
-        # 1. Identify critical targets
+        registry_features = get_probe_features()
+        if probes is registry_features.templates:
+            return registry_features
+        return ProbeFeatures(probes)
+
+    def _score(self, features: ProbeFeatures, context: DecisionContext) -> np.ndarray:
+        """
+        V4 scoring over the whole pool at once. Terms are accumulated in the
+        same order as the per-template rules so scores are bit-identical.
+        """
+        global_bottleneck = context.global_bottleneck
+        weak_invariant_ids = {inv.invariant_id for inv in context.weakest_invariants}
+
+        # A. Global Bottleneck Targeting
+        if global_bottleneck:
+            is_bottleneck = features.has_skill(global_bottleneck)
+        else:
+            is_bottleneck = np.zeros(len(features), dtype=bool)
+
+        # B. Weak Invariant Targeting (only when A did not apply)
+        is_weak = features.has_any_skill(weak_invariant_ids) & ~is_bottleneck
+
+        scores = np.zeros(len(features), dtype=np.float64)
+        scores += np.where(is_bottleneck, 10.0, 0.0)
+        scores += np.where(is_bottleneck & features.role("diagnostic"), 2.0, 0.0)  # Diagnose first
+        scores += np.where(is_weak, 5.0, 0.0)
+
+        # C. Invariant Intersections
+        scores += features.invariant_hits(weak_invariant_ids) * 1.5
+
+        # D. Role Arbitration & Cost
+        scores -= features.probe_cost * 0.5
+
+        # F. Fatigue Penalty
+        if context.recent_template_ids:
+            fatigued = np.isin(features.template_ids, list(set(context.recent_template_ids)))
+            scores -= np.where(fatigued, 20.0, 0.0)
+
+        return scores
+
+    def _top_rows(self, scores: np.ndarray, top_k: Optional[int]) -> np.ndarray:
+        """
+        Rows with a positive score, best first. Ties keep pool order, matching
+        a stable descending sort. With top_k, argpartition narrows the
+        candidates before sorting.
+        """
+        rows = np.flatnonzero(scores > 0)
+        if top_k is not None and top_k < len(rows):
+            if top_k <= 0:
+                return rows[:0]
+            part = np.argpartition(-scores[rows], top_k - 1)[:top_k]
+            # Keep everything tied with the k-th score so tie-breaking stays stable
+            kth_score = scores[rows[part]].min()
+            rows = rows[scores[rows] >= kth_score]
+        order = np.lexsort((rows, -scores[rows]))
+        rows = rows[order]
+        return rows if top_k is None else rows[:top_k]
+
+    def _rationale_notes(
+        self,
+        template: TaskTemplate,
+        context: DecisionContext,
+        pressure_map: Dict[str, float],
+        weak_invariant_ids: Set[str],
+        recent_ids: Set[str],
+    ) -> Dict:
+        rationale_notes = {}
         global_bottleneck = context.global_bottleneck
+        if global_bottleneck and template.skill == global_bottleneck:
+            rationale_notes['target'] = global_bottleneck
+            rationale_notes['pressure'] = pressure_map.get(global_bottleneck, 0.0)
+        elif template.skill in weak_invariant_ids:
+            rationale_notes['target'] = template.skill
+            rationale_notes['pressure'] = pressure_map.get(template.skill, 0.0)
+        if template.task_template_id in recent_ids:
+            rationale_notes['fatigue'] = True
+        return rationale_notes
+
+    def _ranked_entries(
+        self,
+        features: ProbeFeatures,
+        scores: np.ndarray,
+        rows: np.ndarray,
+        context: DecisionContext,
+    ) -> List[Tuple[float, TaskTemplate, str, Dict]]:
         weak_invariant_ids = {inv.invariant_id for inv in context.weakest_invariants}
         recent_ids = set(context.recent_template_ids)
-        
+
         # Pre-calculate pressures for fast lookup
         pressure_map = {inv.invariant_id: inv.pressure for inv in context.weakest_invariants}
-        if global_bottleneck:
+        if context.global_bottleneck:
             # Check unstable list too if not in weakest
             for inv in context.unstable_invariants:
                 pressure_map[inv.invariant_id] = inv.pressure
-        
-        for template in probes:
-            score = 0.0
-            rationale_notes = {}
-            
-            # --- V4 Scoring Logic ---
-            
-            # A. Global Bottleneck Targeting
-            if global_bottleneck and template.skill == global_bottleneck:
-                base_val = 10.0
-                score += base_val
-                rationale_notes['target'] = global_bottleneck
-                rationale_notes['pressure'] = pressure_map.get(global_bottleneck, 0.0)
-                
-                if template.role == "diagnostic":
-                    score += 2.0  # Diagnose first
-
-            # B. Weak Invariant Targeting
-            elif template.skill in weak_invariant_ids:
-                score += 5.0
-                rationale_notes['target'] = template.skill
-                rationale_notes['pressure'] = pressure_map.get(template.skill, 0.0)
-            
-            # C. Invariant Intersections
-            intersection = set(template.invariant_targets).intersection(weak_invariant_ids)
-            if intersection:
-                bonus = len(intersection) * 1.5
-                score += bonus
-                
-            # D. Role Arbitration & Cost
-            score -= (template.probe_cost * 0.5)
-            
-            # F. Fatigue Penalty
-            if template.task_template_id in recent_ids:
-                score -= 20.0
-                rationale_notes['fatigue'] = True
-
-            if score > 0:
-                ranked_probes.append((score, template, template.slot_id or "global", rationale_notes))
 
-        # Sort by score descending
-        ranked_probes.sort(key=lambda x: x[0], reverse=True)
+        ranked_probes = []
+        for row in rows:
+            template = features.templates[row]
+            notes = self._rationale_notes(template, context, pressure_map, weak_invariant_ids, recent_ids)
+            ranked_probes.append((float(scores[row]), template, template.slot_id or "global", notes))
         return ranked_probes
 
+    def rank_probes(
+        self, 
+        probes: List[TaskTemplate], 
+        context: DecisionContext,
+        top_k: Optional[int] = None
+    ) -> List[Tuple[float, TaskTemplate, str, Dict]]:
+        """
+        Scores probes and returns (score, template, source_slot, metrics),
+        best first. Only probes with a positive score are returned; top_k
+        limits the result to the k best.
+        """
+        features = self._features_for(probes)
+        scores = self._score(features, context)
+        rows = self._top_rows(scores, top_k)
+        return self._ranked_entries(features, scores, rows, context)
+
     def select_optimal_probe(
         self, 
         context: DecisionContext, 
@@ -89,12 +151,14 @@ class AdaptiveMarket:
         """
         Returns the single best probe payload with economic justification.
         """
-        all_templates = self.build_global_probe_pool()
-        ranked = self.rank_probes(all_templates, context)
-        
-        if not ranked:
+        features = self._features_for(self.build_global_probe_pool())
+        scores = self._score(features, context)
+        candidate_count = int(np.count_nonzero(scores > 0))
+
+        if not candidate_count:
             return None
-            
+
+        ranked = self._ranked_entries(features, scores, self._top_rows(scores, 1), context)
         best_score, best_template, source_slot, metrics = ranked[0]
         
         # Start Threshold
@@ -107,7 +171,7 @@ class AdaptiveMarket:
                 volatility=context.noise_level,
                 probe_cost=best_template.probe_cost,
                 rank_score=best_score,
-                rejected_alternatives_count=len(ranked) - 1,
+                rejected_alternatives_count=candidate_count - 1,
                 market_phase="global_intervention" if source_slot != current_slot_id else "local_optimization"
             )
             
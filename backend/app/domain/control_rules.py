@@ -11,15 +11,23 @@ class ControlRules:
         """
         NORMAL -> DAMPENED
         - Global std dev > threshold
+        - OR any sampled skill/difficulty/prompt segment std dev > threshold
         - OR confidence avg < 0.6
+        - OR canary replays disagree with stored scores
         """
         global_std_dev = metrics.get("global_std_dev", 0.0)
+        segment_std_dev_max = metrics.get("segment_std_dev_max", 0.0)
         confidence_avg = metrics.get("confidence_avg", 1.0)
+        canary_mean_abs_delta = metrics.get("canary_mean_abs_delta", 0.0)
         
         if global_std_dev > 0.3: # Threshold example
             return True
+        if segment_std_dev_max > 0.3:
+            return True
         if confidence_avg < 0.6:
             return True
+        if canary_mean_abs_delta > 0.15:
+            return True
         return False
 
     @staticmethod
@@ -28,12 +36,16 @@ class ControlRules:
         DAMPENED -> SAFE_MODE
         - Golden task failure
         - Directional drift persists N times
+        - Canary replays drift in one direction
         """
         golden_task_failure = metrics.get("golden_task_failure", False)
         directional_drift_count = metrics.get("directional_drift_count", 0)
+        canary_directional_drift = metrics.get("canary_directional_drift", False)
         
         if golden_task_failure:
             return True
+        if canary_directional_drift:
+            return True
         if directional_drift_count >= 3: # N times example
             return True
         return False
@@ -49,8 +61,9 @@ class ControlRules:
         calibration_runs = metrics.get("successful_calibration_runs", 0)
         golden_tasks_stable = metrics.get("golden_tasks_stable", False)
         drift_free_hours = metrics.get("drift_free_hours", 0)
+        canary_replay_failure = metrics.get("canary_replay_failure", False)
         
-        if calibration_runs >= 3 and golden_tasks_stable and drift_free_hours >= 24:
+        if calibration_runs >= 3 and golden_tasks_stable and drift_free_hours >= 24 and not canary_replay_failure:
             return True
         return False
 
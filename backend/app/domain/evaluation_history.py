@@ -1,5 +1,14 @@
-from datetime import datetime
+import math
+import sys
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Iterator, List
+
 from pydantic import BaseModel
+from pydantic_core import core_schema
+
+MAX_EVALUATION_HISTORY = 10
+
 
 class EvaluationSnapshot(BaseModel):
     submission_id: str
@@ -7,3 +16,238 @@ class EvaluationSnapshot(BaseModel):
     confidence: float
     is_partial_credit: bool
     evaluated_at: datetime
+
+
+def _pack(values: array) -> bytes:
+    # Stored little-endian regardless of host
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+class EvaluationHistory:
+    """
+    Last MAX_EVALUATION_HISTORY evaluations of a slot, stored column-wise
+    (parallel arrays) instead of as a list of EvaluationSnapshot models.
+
+    Once full it is a ring buffer: a new evaluation overwrites the oldest
+    in place. Running sum / sum of squares of the scores make
+    `score_variance()` O(1) for drift checks; they are re-summed from the
+    buffer each time it wraps so float error cannot build up.
+
+    Persisted as packed little-endian arrays (oldest first); JSON output
+    and the legacy stored format are a list of EvaluationSnapshot dicts.
+    """
+
+    __slots__ = (
+        "_submission_ids", "_scores", "_confidences", "_partial_credit", "_evaluated_at",
+        "_head", "_score_sum", "_score_sumsq",
+    )
+
+    def __init__(self):
+        self._submission_ids: List[str] = []
+        self._scores = array("d")
+        self._confidences = array("d")
+        self._partial_credit = array("b")
+        self._evaluated_at = array("d")  # POSIX timestamps (UTC)
+        self._head = 0  # oldest entry once the buffer is full
+        self._score_sum = 0.0
+        self._score_sumsq = 0.0
+
+    # ---------- Mutation ----------
+
+    def append(self, snapshot: EvaluationSnapshot) -> None:
+        evaluated_at = snapshot.evaluated_at
+        if evaluated_at.tzinfo is None:
+            evaluated_at = evaluated_at.replace(tzinfo=timezone.utc)
+
+        row = (
+            snapshot.submission_id,
+            snapshot.score,
+            snapshot.confidence,
+            1 if snapshot.is_partial_credit else 0,
+            evaluated_at.timestamp(),
+        )
+
+        if len(self._scores) < MAX_EVALUATION_HISTORY:
+            for column, value in zip(self._columns(), row):
+                column.append(value)
+            self._score_sum += snapshot.score
+            self._score_sumsq += snapshot.score * snapshot.score
+            return
+
+        head = self._head
+        evicted = self._scores[head]
+        for column, value in zip(self._columns(), row):
+            column[head] = value
+
+        self._head = (head + 1) % MAX_EVALUATION_HISTORY
+        if self._head == 0:
+            self._resum()
+        else:
+            self._score_sum += snapshot.score - evicted
+            self._score_sumsq += snapshot.score * snapshot.score - evicted * evicted
+
+    def _columns(self):
+        return (self._submission_ids, self._scores, self._confidences, self._partial_credit, self._evaluated_at)
+
+    def _resum(self) -> None:
+        self._score_sum = math.fsum(self._scores)
+        self._score_sumsq = math.fsum(score * score for score in self._scores)
+
+    def _ordered(self, column):
+        # Oldest first
+        head = self._head
+        return column[head:] + column[:head] if head else column[:]
+
+    # ---------- Read access ----------
+
+    @property
+    def submission_ids(self) -> List[str]:
+        return self._ordered(self._submission_ids)
+
+    @property
+    def scores(self) -> array:
+        return self._ordered(self._scores)
+
+    @property
+    def confidences(self) -> array:
+        return self._ordered(self._confidences)
+
+    @property
+    def partial_credit(self) -> array:
+        return self._ordered(self._partial_credit)
+
+    @property
+    def evaluated_at(self) -> array:
+        return self._ordered(self._evaluated_at)
+
+    def first_score(self) -> float:
+        return self._scores[self._head]
+
+    def last_score(self) -> float:
+        return self._scores[self._head - 1]
+
+    def last_confidence(self) -> float:
+        return self._confidences[self._head - 1]
+
+    def score_mean(self) -> float:
+        return self._score_sum / len(self._scores)
+
+    def score_variance(self) -> float:
+        """
+        Population variance of the scores (statistics.pvariance), O(1).
+        """
+        n = len(self._scores)
+        mean = self._score_sum / n
+        return max(self._score_sumsq / n - mean * mean, 0.0)
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __bool__(self) -> bool:
+        return len(self._scores) > 0
+
+    def __getitem__(self, index: int) -> EvaluationSnapshot:
+        n = len(self._scores)
+        if not -n <= index < n:
+            raise IndexError("evaluation history index out of range")
+        i = (self._head + index) % n
+        return EvaluationSnapshot(
+            submission_id=self._submission_ids[i],
+            score=self._scores[i],
+            confidence=self._confidences[i],
+            is_partial_credit=bool(self._partial_credit[i]),
+            evaluated_at=datetime.fromtimestamp(self._evaluated_at[i], tz=timezone.utc),
+        )
+
+    def __iter__(self) -> Iterator[EvaluationSnapshot]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, EvaluationHistory):
+            return NotImplemented
+        return all(
+            self._ordered(mine) == other._ordered(theirs)
+            for mine, theirs in zip(self._columns(), other._columns())
+        )
+
+    def __repr__(self) -> str:
+        return f"EvaluationHistory(scores={list(self.scores)})"
+
+    # ---------- (De)serialization ----------
+
+    def to_document(self) -> dict:
+        return {
+            "submission_ids": self.submission_ids,
+            "scores": _pack(self.scores),
+            "confidences": _pack(self.confidences),
+            "partial_credit": _pack(self.partial_credit),
+            "evaluated_at": _pack(self.evaluated_at),
+        }
+
+    @classmethod
+    def from_document(cls, doc: dict) -> "EvaluationHistory":
+        keep = -MAX_EVALUATION_HISTORY
+        history = cls()
+        history._submission_ids = list(doc["submission_ids"])[keep:]
+        history._scores = _unpack("d", doc["scores"])[keep:]
+        history._confidences = _unpack("d", doc["confidences"])[keep:]
+        history._partial_credit = _unpack("b", doc["partial_credit"])[keep:]
+        history._evaluated_at = _unpack("d", doc["evaluated_at"])[keep:]
+        history._resum()
+        return history
+
+    @classmethod
+    def from_snapshots(cls, snapshots) -> "EvaluationHistory":
+        history = cls()
+        for snapshot in snapshots:
+            if not isinstance(snapshot, EvaluationSnapshot):
+                snapshot = EvaluationSnapshot.model_validate(snapshot)
+            history.append(snapshot)
+        return history
+
+    def to_list(self) -> List[dict]:
+        return [snapshot.model_dump() for snapshot in self]
+
+    @classmethod
+    def _validate(cls, value: Any) -> "EvaluationHistory":
+        if isinstance(value, EvaluationHistory):
+            return value
+        if value is None:
+            return cls()
+        if isinstance(value, dict):
+            return cls.from_document(value)
+        if isinstance(value, (list, tuple)):
+            # Legacy stored format: list of EvaluationSnapshot dicts
+            return cls.from_snapshots(value)
+        raise ValueError(f"Cannot build EvaluationHistory from {type(value).__name__}")
+
+    @staticmethod
+    def _serialize(value: "EvaluationHistory", info) -> Any:
+        if info.mode == "json":
+            return value.to_list()
+        return value.to_document()
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source, handler):
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls._serialize, info_arg=True
+            ),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema, handler):
+        return handler(core_schema.list_schema(EvaluationSnapshot.__pydantic_core_schema__))
@@ -0,0 +1,43 @@
+import statistics
+from collections import deque
+from typing import Iterable, List, Tuple
+
+from app.domain.golden_tasks import GoldenTask
+
+# Below this many pooled samples a task is still checked against expected_score
+MIN_BASELINE_SAMPLES = 6
+
+
+class GoldenBaseline:
+    """
+    Historical score distribution of one golden task: the samples of its
+    last `max_runs` passing calibration runs.
+    """
+
+    def __init__(self, max_runs: int, runs: Iterable[List[float]] = ()):
+        self.runs = deque(runs, maxlen=max_runs)
+
+    def add_run(self, samples: List[float]) -> None:
+        self.runs.append(list(samples))
+
+    @property
+    def samples(self) -> List[float]:
+        return [score for run in self.runs for score in run]
+
+    def check(self, task: GoldenTask, samples: List[float]) -> Tuple[float, float, float, str]:
+        """
+        Returns (drift, allowed, reference, source). drift is the signed gap
+        between this run's mean and the reference; the run passes while
+        |drift| <= allowed. With enough history the reference is the
+        baseline mean and the allowance widens to 3 baseline std-devs
+        (never below the task tolerance).
+        """
+        current = statistics.fmean(samples)
+        history = self.samples
+
+        if len(history) >= MIN_BASELINE_SAMPLES:
+            reference = statistics.fmean(history)
+            allowed = max(task.tolerance, 3 * statistics.pstdev(history))
+            return current - reference, allowed, reference, "baseline"
+
+        return current - task.expected_score, task.tolerance, task.expected_score, "expected"
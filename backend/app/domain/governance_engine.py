@@ -1,48 +1,137 @@
-from typing import Dict, Union
-from app.schemas.roadmap_state import RoadmapState, TaskSlot
-from app.schemas.curriculum import Curriculum, SlotDefinition
+import hashlib
+import json
+from typing import Callable, Dict, FrozenSet, Optional, Set, Union
+from app.schemas.roadmap_state import RoadmapState, GovernanceFingerprint
+from app.schemas.curriculum import Curriculum, SlotGovernancePolicy
 from app.domain.adaptive_control import DecisionContext
 
+ScorePredicate = Callable[[Dict[str, float]], bool]
+
+TERMINAL_SLOT_STATUSES = {"completed", "skipped", "failed"}
+
+
+class CompiledSlotPolicy:
+    """
+    A slot's governance policy with every threshold parsed once into a
+    predicate closure over DecisionContext.all_scores.
+    """
+
+    __slots__ = (
+        "skip_if",
+        "reinforce_if",
+        "promote_if",
+        "entry_requirements",
+        "has_entry_requirements",
+        "dependencies",
+    )
+
+    def __init__(self, policy: SlotGovernancePolicy):
+        self.skip_if = _compile_requirements(policy.skip_if)
+        self.reinforce_if = _compile_requirements(policy.reinforce_if, require_tracked_skill=True)
+        self.promote_if = _compile_requirements(policy.promote_if)
+        self.entry_requirements = _compile_requirements(policy.entry_requirements)
+        self.has_entry_requirements = bool(policy.entry_requirements)
+        self.dependencies: FrozenSet[str] = frozenset(
+            list(policy.skip_if)
+            + list(policy.reinforce_if)
+            + list(policy.promote_if)
+            + list(policy.entry_requirements)
+        )
+
+
+class CompiledGovernance:
+    """
+    All slot policies of a curriculum, compiled at curriculum load.
+    `policy_hash` identifies the policies' content, so roadmaps governed
+    under an older curriculum get a full pass.
+    """
+
+    def __init__(self, curriculum: Curriculum):
+        self.track_id = curriculum.track_id
+        self.policy_hash = _policy_hash(curriculum)
+        self.policies: Dict[str, CompiledSlotPolicy] = {
+            slot_def.id: CompiledSlotPolicy(slot_def.governance)
+            for phase in curriculum.phases
+            for slot_def in phase.slots
+        }
+        self.dependencies: FrozenSet[str] = frozenset().union(
+            *(p.dependencies for p in self.policies.values())
+        )
+
+    def get_policy(self, slot_id: str) -> CompiledSlotPolicy:
+        try:
+            return self.policies[slot_id]
+        except KeyError:
+            raise ValueError(f"Slot definition {slot_id} not found in curriculum {self.track_id}")
+
+
+def compile_governance(curriculum: Curriculum) -> CompiledGovernance:
+    return CompiledGovernance(curriculum)
+
+
 def apply_governance_to_roadmap(
     roadmap: RoadmapState,
     curriculum: Curriculum,
-    context: DecisionContext
+    context: DecisionContext,
+    governance: Optional[CompiledGovernance] = None,
 ):
     """
     Scans the roadmap and applies skip/reinforce/promote rules based on DecisionContext.
     Moves the roadmap from linear to skill-governed.
+
+    Incremental: only slots whose dependent skills changed since the last pass
+    (per roadmap.governance_fingerprint), or whose status changed since then,
+    are re-evaluated. A change of the compiled policies re-evaluates every slot.
     """
+    if governance is None:
+        governance = compile_governance(curriculum)
+
+    scores = context.all_scores
+    current_scores = {skill: scores.get(skill) for skill in governance.dependencies}
+    changed_skills = _changed_skills(roadmap.governance_fingerprint, current_scores, governance.policy_hash)
+    previous_statuses = (
+        roadmap.governance_fingerprint.slot_statuses
+        if roadmap.governance_fingerprint is not None
+        else {}
+    )
+
     for phase in roadmap.phases:
         for slot in phase.slots:
             # We don't apply governance to already completed or skipped slots
-            if slot.status in ["completed", "skipped", "failed"]:
+            if slot.status in TERMINAL_SLOT_STATUSES:
                 continue
-                
-            slot_def = curriculum.get_slot_definition(slot.slot_id)
-            policy = slot_def.governance
-            
+
+            policy = governance.get_policy(slot.slot_id)
+
+            if (
+                changed_skills is not None
+                and previous_statuses.get(slot.slot_id) == slot.status
+                and not (policy.dependencies & changed_skills)
+            ):
+                continue
+
             # 1. Check Skip conditions (Top Priority)
-            if _meets_policy(policy.skip_if, context):
+            if policy.skip_if(scores):
                 slot.status = "skipped"
                 slot.user_message = "Automatically skipped based on your current skill level."
                 continue
 
             # 2. Check Reinforcement conditions
-            if _meets_policy(policy.reinforce_if, context, require_tracked_skill=True):
+            if policy.reinforce_if(scores):
                 slot.status = "reinforcement_required"
                 slot.user_message = "This skill needs reinforcement before you proceed."
                 continue
-                
+
             # 3. Check Promotion conditions
-            if _meets_policy(policy.promote_if, context):
+            if policy.promote_if(scores):
                 # Mark as available but with a 'fast_track' flag for the orchestrator
                 slot.status = "available"
                 slot.flags.add("fast_track")
                 slot.user_message = "You've been fast-tracked for this skill!"
-            
+
             # 4. Check Entry requirements for locked slots
-            has_reqs = bool(policy.entry_requirements)
-            meets_reqs = _meets_policy(policy.entry_requirements, context)
+            has_reqs = policy.has_entry_requirements
+            meets_reqs = policy.entry_requirements(scores)
 
             if slot.status == "locked" and slot.locked_reason == "requirements_not_met":
                 if not has_reqs or meets_reqs:
@@ -54,41 +143,94 @@ def apply_governance_to_roadmap(
                     slot.status = "locked"
                     slot.locked_reason = "requirements_not_met"
 
-def _evaluate_threshold(score: float, threshold: Union[float, str]) -> bool:
+    roadmap.governance_fingerprint = GovernanceFingerprint(
+        policy_hash=governance.policy_hash,
+        scores=current_scores,
+        slot_statuses={
+            slot.slot_id: slot.status
+            for phase in roadmap.phases
+            for slot in phase.slots
+        },
+    )
+
+
+def _changed_skills(
+    fingerprint: Optional[GovernanceFingerprint],
+    current_scores: Dict[str, Optional[float]],
+    policy_hash: str,
+) -> Optional[Set[str]]:
+    """
+    Skills whose score (or tracked-ness) differs from the last pass.
+    None means there is no usable fingerprint (none yet, or taken under
+    other policies) and every slot must be evaluated.
+    """
+    if fingerprint is None or fingerprint.policy_hash != policy_hash:
+        return None
+    return {
+        skill
+        for skill, score in current_scores.items()
+        if skill not in fingerprint.scores or fingerprint.scores[skill] != score
+    }
+
+
+def _policy_hash(curriculum: Curriculum) -> str:
+    policies = {
+        slot_def.id: slot_def.governance.model_dump()
+        for phase in curriculum.phases
+        for slot_def in phase.slots
+    }
+    canonical = json.dumps(policies, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _compile_threshold(threshold: Union[float, str]) -> Callable[[float], bool]:
     if isinstance(threshold, (float, int)):
-        return score >= threshold
-    
+        limit = float(threshold)
+        return lambda score: score >= limit
+
     threshold_str = str(threshold).strip()
     try:
         if threshold_str.startswith(">="):
-            return score >= float(threshold_str[2:])
+            limit = float(threshold_str[2:])
+            return lambda score: score >= limit
         elif threshold_str.startswith(">"):
-            return score > float(threshold_str[1:])
+            limit = float(threshold_str[1:])
+            return lambda score: score > limit
         elif threshold_str.startswith("<="):
-            return score <= float(threshold_str[2:])
+            limit = float(threshold_str[2:])
+            return lambda score: score <= limit
         elif threshold_str.startswith("<"):
-            return score < float(threshold_str[1:])
+            limit = float(threshold_str[1:])
+            return lambda score: score < limit
         else:
-            return score >= float(threshold_str)
+            limit = float(threshold_str)
+            return lambda score: score >= limit
     except ValueError:
-        return False
+        return lambda score: False
 
-def _meets_policy(
-    requirements: Dict[str, Union[float, str]], 
-    context: DecisionContext,
+
+def _compile_requirements(
+    requirements: Dict[str, Union[float, str]],
     require_tracked_skill: bool = False
-) -> bool:
+) -> ScorePredicate:
     """
-    Checks if the user's current scores in DecisionContext meet ALL of the required thresholds.
+    Compiles a requirement map into a predicate that checks if the user's
+    current scores meet ALL of the required thresholds.
     """
     if not requirements:
-        return False
-        
-    for skill_id, threshold in requirements.items():
-        if require_tracked_skill and skill_id not in context.all_scores:
-            return False
-
-        user_score = context.all_scores.get(skill_id, 0.0)
-        if not _evaluate_threshold(user_score, threshold):
-            return False
-    return True
+        return lambda scores: False
+
+    checks = [
+        (skill_id, _compile_threshold(threshold))
+        for skill_id, threshold in requirements.items()
+    ]
+
+    def predicate(scores: Dict[str, float]) -> bool:
+        for skill_id, check in checks:
+            if require_tracked_skill and skill_id not in scores:
+                return False
+            if not check(scores.get(skill_id, 0.0)):
+                return False
+        return True
+
+    return predicate
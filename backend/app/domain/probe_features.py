@@ -0,0 +1,78 @@
+# app/domain/probe_features.py
+
+from typing import Dict, List, Sequence
+import numpy as np
+
+from app.schemas.task_template import TaskTemplate
+
+PROBE_ROLES = ("diagnostic", "reinforcement", "stretch", "proof")
+
+
+class ProbeFeatures:
+    """
+    Column-oriented view of a probe pool, built once per registry so that
+    AdaptiveMarket can score every template with a few array operations.
+
+    Row i of every matrix describes templates[i]. The templates list is
+    shared with the registry and must not be mutated.
+    """
+
+    __slots__ = (
+        "templates",
+        "template_ids",
+        "skill_index",
+        "invariant_index",
+        "skill_onehot",
+        "invariant_incidence",
+        "role_flags",
+        "probe_cost",
+    )
+
+    def __init__(self, templates: Sequence[TaskTemplate]):
+        self.templates: List[TaskTemplate] = list(templates)
+        n = len(self.templates)
+
+        skills = sorted({t.skill for t in self.templates})
+        invariants = sorted({inv for t in self.templates for inv in t.invariant_targets})
+        self.skill_index: Dict[str, int] = {s: i for i, s in enumerate(skills)}
+        self.invariant_index: Dict[str, int] = {inv: i for i, inv in enumerate(invariants)}
+
+        self.template_ids = np.array([t.task_template_id for t in self.templates], dtype=object)
+        self.skill_onehot = np.zeros((n, len(skills)), dtype=bool)
+        self.invariant_incidence = np.zeros((n, len(invariants)), dtype=np.float64)
+        self.role_flags = np.zeros((n, len(PROBE_ROLES)), dtype=bool)
+        self.probe_cost = np.empty(n, dtype=np.float64)
+
+        for row, t in enumerate(self.templates):
+            self.skill_onehot[row, self.skill_index[t.skill]] = True
+            for inv in t.invariant_targets:
+                self.invariant_incidence[row, self.invariant_index[inv]] = 1.0
+            self.role_flags[row, PROBE_ROLES.index(t.role)] = True
+            self.probe_cost[row] = t.probe_cost
+
+    def __len__(self) -> int:
+        return len(self.templates)
+
+    def has_skill(self, skill: str) -> np.ndarray:
+        col = self.skill_index.get(skill)
+        if col is None:
+            return np.zeros(len(self), dtype=bool)
+        return self.skill_onehot[:, col]
+
+    def has_any_skill(self, skills) -> np.ndarray:
+        cols = [self.skill_index[s] for s in skills if s in self.skill_index]
+        if not cols:
+            return np.zeros(len(self), dtype=bool)
+        return self.skill_onehot[:, cols].any(axis=1)
+
+    def invariant_hits(self, invariants) -> np.ndarray:
+        """
+        Number of distinct invariant_targets per template found in `invariants`.
+        """
+        cols = [self.invariant_index[i] for i in invariants if i in self.invariant_index]
+        if not cols:
+            return np.zeros(len(self), dtype=np.float64)
+        return self.invariant_incidence[:, cols].sum(axis=1)
+
+    def role(self, role: str) -> np.ndarray:
+        return self.role_flags[:, PROBE_ROLES.index(role)]
@@ -0,0 +1,85 @@
+# app/domain/registry_snapshot.py
+
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from app.schemas.curriculum import Curriculum
+from app.schemas.task_template import TaskTemplate
+
+# Bump whenever the pickled model layout changes (fields or private attrs)
+SNAPSHOT_FORMAT = 2
+
+
+class RegistrySnapshot:
+    """
+    Compiled, already-validated view of the curriculum and every TaskTemplate.
+
+    Built once (by the master process or a deploy step) and written to a single
+    read-only file. Workers unpickle it, which skips YAML parsing and Pydantic
+    validation entirely. This only shortens startup: every worker still holds
+    its own copy of the objects. To share the registry's memory between
+    workers, preload it in the master instead (PRELOAD_TEMPLATE_REGISTRY).
+    """
+
+    __slots__ = ("templates", "curricula")
+
+    def __init__(self, templates: List[TaskTemplate], curricula: Dict[str, Curriculum]):
+        self.templates = templates
+        self.curricula = curricula
+
+
+def write_snapshot(
+    path: Path,
+    templates: Iterable[TaskTemplate],
+    curricula: Dict[str, Curriculum],
+) -> None:
+    """
+    Atomically writes the snapshot so concurrently spawning workers never
+    observe a half-written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "format": SNAPSHOT_FORMAT,
+        "templates": list(templates),
+        "curricula": dict(curricula),
+    }
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def read_snapshot(path: Path) -> Optional[RegistrySnapshot]:
+    """
+    Returns None when the snapshot is missing or was written by an
+    incompatible build, so callers can fall back to the YAML sources.
+    """
+    if not path.exists() or path.stat().st_size == 0:
+        return None
+
+    with open(path, "rb") as f:
+        payload = pickle.load(f)
+
+    if payload.get("format") != SNAPSHOT_FORMAT:
+        return None
+
+    return RegistrySnapshot(payload["templates"], payload["curricula"])
+
+
+def is_stale(path: Path, sources: Iterable[Path]) -> bool:
+    """
+    A snapshot is stale if any curriculum/task YAML is newer than it.
+    """
+    if not path.exists():
+        return True
+    built_at = path.stat().st_mtime
+    return any(src.stat().st_mtime > built_at for src in sources)
@@ -1,4 +1,6 @@
-from app.schemas.roadmap_state import RoadmapState
+from typing import Literal, Set
+
+from app.schemas.roadmap_state import RoadmapState, PhaseState, TaskSlot
 
 
 class RoadmapValidationError(Exception):
@@ -6,12 +8,76 @@ class RoadmapValidationError(Exception):
     pass
 
 
-def validate_roadmap_state(roadmap: RoadmapState) -> None:
+VALID_SLOT_STATUSES = {
+    "locked",
+    "available",
+    "in_progress",
+    "completed",
+    "failed",
+    "remediation_required",
+    "skipped",
+    "reinforcement_required",
+}
+
+
+def validate_roadmap_state(
+    roadmap: RoadmapState,
+    mode: Literal["incremental", "full"] = "incremental",
+) -> None:
     """
     Strict validation of roadmap integrity and lifecycle rules.
     This function enforces STATE MACHINE correctness, not just structure.
+
+    "incremental" re-checks only the phases and slots changed since the last
+    successful validation (falling back to "full" when the roadmap's
+    baseline was never validated or its structure changed). "full" walks
+    everything and is used for reads, creation and migrations.
     """
+    changes = roadmap.changes_since_validation() if mode == "incremental" else None
+
+    if changes is not None:
+        dirty_slots, dirty_phases = changes
+        try:
+            touched_phase_ids = set(dirty_phases)
+            for slot_id in dirty_slots:
+                touched_phase_ids.add(roadmap.get_phase_for_slot(slot_id).phase_id)
+            in_progress = roadmap.in_progress_slot_ids()
+        except ValueError:
+            # A dirty slot was renamed; positions can no longer be trusted
+            changes = None
+
+    if changes is None:
+        _validate_full(roadmap)
+        roadmap.track_changes()
+        return
+
+    _validate_roadmap_fields(roadmap)
+
+    for phase in roadmap.phases:
+        if phase.phase_id in touched_phase_ids:
+            _validate_phase(phase)
+
+    _validate_in_progress_count(len(in_progress))
+    _validate_status_semantics(roadmap)
+
+    roadmap.commit_validation(in_progress)
+
+
+def _validate_full(roadmap: RoadmapState) -> None:
+    _validate_roadmap_fields(roadmap)
+
+    in_progress_count = 0
+    for phase in roadmap.phases:
+        in_progress_count += _validate_phase(phase)
 
+    _validate_in_progress_count(in_progress_count)
+    _validate_status_semantics(roadmap)
+
+
+def _validate_roadmap_fields(roadmap: RoadmapState) -> None:
+    """
+    Roadmap-level invariants; O(phases), checked on every pass.
+    """
     # ─────────────────────────────────────────────
     # 1️⃣ Identity & basic invariants
     # ─────────────────────────────────────────────
@@ -70,76 +136,82 @@ def validate_roadmap_state(roadmap: RoadmapState) -> None:
                 "current_phase does not match active phase"
             )
 
+
+def _validate_slot(slot: TaskSlot) -> bool:
+    """
+    Checks a single slot; returns whether it is in progress.
+    """
+    # Valid slot status
+    if slot.status not in VALID_SLOT_STATUSES:
+        raise RoadmapValidationError(
+            f"Invalid slot status {slot.status}"
+        )
+
+    # active_task_instance_id rules
+    if slot.status == "in_progress":
+        if not slot.active_task_instance_id:
+            raise RoadmapValidationError(
+                f"Slot {slot.slot_id} in_progress without active_task_instance_id"
+            )
+        return True
+
+    if slot.active_task_instance_id is not None:
+        raise RoadmapValidationError(
+            f"Slot {slot.slot_id} has illegal active_task_instance_id"
+        )
+    return False
+
+
+def _validate_phase(phase: PhaseState) -> int:
+    """
+    Slot lifecycle, uniqueness and phase <-> slot consistency for one
+    phase; returns its number of in_progress slots.
+    """
     # ─────────────────────────────────────────────
     # 4️⃣ Slot lifecycle & uniqueness rules
     # ─────────────────────────────────────────────
-    valid_slot_statuses = {
-        "locked",
-        "available",
-        "in_progress",
-        "completed",
-        "failed",
-        "remediation_required",
-        "skipped",
-        "reinforcement_required",
-    }
-
     in_progress_count = 0
+    slot_ids: Set[str] = set()
 
-    for phase in roadmap.phases:
-        slot_ids = set()
+    for slot in phase.slots:
+        # Duplicate slot IDs
+        if slot.slot_id in slot_ids:
+            raise RoadmapValidationError(
+                f"Duplicate slot_id {slot.slot_id}"
+            )
+        slot_ids.add(slot.slot_id)
+
+        if _validate_slot(slot):
+            in_progress_count += 1
+
+    # ─────────────────────────────────────────
+    # 5️⃣ Phase ↔ slot consistency
+    # ─────────────────────────────────────────
+    if phase.phase_status == "locked":
+        if not phase.locked_reason:
+            raise RoadmapValidationError(
+                f"Phase {phase.phase_id} locked but missing locked_reason"
+            )
 
         for slot in phase.slots:
-            # Duplicate slot IDs
-            if slot.slot_id in slot_ids:
+            if slot.status != "locked":
                 raise RoadmapValidationError(
-                    f"Duplicate slot_id {slot.slot_id}"
+                    f"Locked phase {phase.phase_id} contains non-locked slot"
                 )
-            slot_ids.add(slot.slot_id)
 
-            # Valid slot status
-            if slot.status not in valid_slot_statuses:
-                raise RoadmapValidationError(
-                    f"Invalid slot status {slot.status}"
-                )
+    if phase.phase_status == "active":
+        if not any(
+            slot.status in {"available", "in_progress", "remediation_required"}
+            for slot in phase.slots
+        ):
+            raise RoadmapValidationError(
+                f"Active phase {phase.phase_id} has no actionable slots"
+            )
 
-            # active_task_instance_id rules
-            if slot.status == "in_progress":
-                if not slot.active_task_instance_id:
-                    raise RoadmapValidationError(
-                        f"Slot {slot.slot_id} in_progress without active_task_instance_id"
-                    )
-                in_progress_count += 1
-            else:
-                if slot.active_task_instance_id is not None:
-                    raise RoadmapValidationError(
-                        f"Slot {slot.slot_id} has illegal active_task_instance_id"
-                    )
-
-        # ─────────────────────────────────────────
-        # 5️⃣ Phase ↔ slot consistency
-        # ─────────────────────────────────────────
-        if phase.phase_status == "locked":
-            if not phase.locked_reason:
-                raise RoadmapValidationError(
-                    f"Phase {phase.phase_id} locked but missing locked_reason"
-                )
+    return in_progress_count
 
-            for slot in phase.slots:
-                if slot.status != "locked":
-                    raise RoadmapValidationError(
-                        f"Locked phase {phase.phase_id} contains non-locked slot"
-                    )
-
-        if phase.phase_status == "active":
-            if not any(
-                slot.status in {"available", "in_progress", "remediation_required"}
-                for slot in phase.slots
-            ):
-                raise RoadmapValidationError(
-                    f"Active phase {phase.phase_id} has no actionable slots"
-                )
 
+def _validate_in_progress_count(in_progress_count: int) -> None:
     # ─────────────────────────────────────────────
     # 6️⃣ Cross-roadmap slot constraints
     # ─────────────────────────────────────────────
@@ -148,6 +220,8 @@ def validate_roadmap_state(roadmap: RoadmapState) -> None:
             "Multiple in_progress slots across roadmap"
         )
 
+
+def _validate_status_semantics(roadmap: RoadmapState) -> None:
     # ─────────────────────────────────────────────
     # 7️⃣ Roadmap status semantics
     # ─────────────────────────────────────────────
@@ -161,6 +235,3 @@ def validate_roadmap_state(roadmap: RoadmapState) -> None:
             raise RoadmapValidationError(
                 "Completed roadmap contains active phase"
             )
-
-    # ✅ All invariants satisfied
-    return
@@ -0,0 +1,89 @@
+import math
+from typing import List, Optional
+
+# Fixed-width histogram over [0, 1]; bin i covers [i / N, (i + 1) / N)
+HISTOGRAM_BINS = 20
+
+
+def histogram_bin(score: float) -> int:
+    return min(max(int(score * HISTOGRAM_BINS), 0), HISTOGRAM_BINS - 1)
+
+
+class ScoreDistribution:
+    """
+    Mergeable summary of a set of evaluation scores: count, sum, sum of
+    squares, confidence sum and a fixed-bin histogram. Rollup documents
+    store exactly these fields, so any window is answered by merging the
+    rollups it covers.
+    """
+
+    __slots__ = ("count", "score_sum", "score_sumsq", "confidence_sum", "histogram")
+
+    def __init__(self):
+        self.count = 0
+        self.score_sum = 0.0
+        self.score_sumsq = 0.0
+        self.confidence_sum = 0.0
+        self.histogram: List[int] = [0] * HISTOGRAM_BINS
+
+    def add(self, score: float, confidence: float) -> None:
+        self.count += 1
+        self.score_sum += score
+        self.score_sumsq += score * score
+        self.confidence_sum += confidence
+        self.histogram[histogram_bin(score)] += 1
+
+    def merge_document(self, doc: dict) -> None:
+        self.count += doc.get("count", 0)
+        self.score_sum += doc.get("score_sum", 0.0)
+        self.score_sumsq += doc.get("score_sumsq", 0.0)
+        self.confidence_sum += doc.get("confidence_sum", 0.0)
+        for key, n in (doc.get("histogram") or {}).items():
+            self.histogram[int(key)] += n
+
+    def to_increments(self) -> dict:
+        """
+        $inc payload for a rollup document (histogram bins as dotted keys).
+        """
+        increments = {
+            "count": self.count,
+            "score_sum": self.score_sum,
+            "score_sumsq": self.score_sumsq,
+            "confidence_sum": self.confidence_sum,
+        }
+        for i, n in enumerate(self.histogram):
+            if n:
+                increments[f"histogram.{i}"] = n
+        return increments
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Histogram estimate (linear within the bin).
+        """
+        if self.count == 0:
+            return None
+
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.histogram):
+            if n and seen + n >= target:
+                return (i + (target - seen) / n) / HISTOGRAM_BINS
+            seen += n
+        return 1.0
+
+    def to_stats(self) -> dict:
+        if self.count == 0:
+            return {}
+
+        mean = self.score_sum / self.count
+        return {
+            "avg_score": mean,
+            "std_dev": math.sqrt(max(self.score_sumsq / self.count - mean * mean, 0.0)),
+            "confidence_avg": self.confidence_sum / self.count,
+            "count": self.count,
+            "p10": self.quantile(0.1),
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "histogram": list(self.histogram),
+        }
+
@@ -0,0 +1,52 @@
+from array import array
+from typing import Dict, Iterator, List, Tuple
+
+from app.schemas.learning_state import SkillEntry
+
+
+class SkillVectorColumns:
+    """
+    Read-side view of a user's skill_vector holding only what adaptive
+    control needs: skill ids with parallel level / confidence arrays.
+    Built straight from the raw Mongo sub-document, skipping the nested
+    SkillEntry / EvidenceSummary / SourceMix / DecayInfo models.
+    """
+
+    __slots__ = ("skills", "levels", "confidences")
+
+    def __init__(self):
+        self.skills: List[str] = []
+        self.levels = array("d")
+        self.confidences = array("d")
+
+    def _add(self, skill_id: str, level: float, confidence: float) -> None:
+        self.skills.append(skill_id)
+        self.levels.append(level)
+        self.confidences.append(confidence)
+
+    @classmethod
+    def from_entries(cls, skill_vector: Dict[str, SkillEntry]) -> "SkillVectorColumns":
+        columns = cls()
+        for skill_id, entry in skill_vector.items():
+            columns._add(skill_id, entry.level, entry.confidence)
+        return columns
+
+    @classmethod
+    def from_document(cls, skill_vector: Dict[str, dict]) -> "SkillVectorColumns":
+        """
+        From a raw `skill_vector` sub-document (SkillEntry defaults apply).
+        """
+        columns = cls()
+        for skill_id, entry in skill_vector.items():
+            columns._add(
+                skill_id,
+                float(entry.get("level", 0.0)),
+                float(entry.get("confidence", 0.0)),
+            )
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def __iter__(self) -> Iterator[Tuple[str, float, float]]:
+        return zip(self.skills, self.levels, self.confidences)
@@ -3,10 +3,12 @@ from datetime import datetime, timezone
 from app.schemas.learning_state import UserLearningState, SkillEntry, EvidenceSummary, SourceMix
 from app.schemas.task_instance import TaskInstance
 from app.schemas.ai_evaluation import AIEvaluationResult
+from app.schemas.skill_update_telemetry import SkillUpdateTelemetry
+from app.schemas.skill_update_journal import SkillUpdateJournalEntry
 
 from app.ai.skill_delta import compute_skill_deltas
 from app.ai.skill_vector_engine import apply_skill_deltas
-from typing import Set
+from typing import Dict, List, Optional, Set
 from app.services.evaluation_consistency import apply_stability_penalty
 from app.core.system_status import system_status
 import logging
@@ -20,26 +22,74 @@ def apply_skill_vector_update(
     task_instance: TaskInstance,
     task_template,
     flags: Set[str] = set(),
-) -> None:
+    evaluation_id: str = "",
+    journal: Optional[List[SkillUpdateJournalEntry]] = None,
+) -> List[SkillUpdateTelemetry]:
     """
     Domain-level SkillVector mutation.
+    Returns one SkillUpdateTelemetry per updated skill (delta breakdown).
+    While the system is FROZEN the deltas are not applied; if `journal`
+    is given, they are appended to it for replay after unfreeze.
     """
-    
-    # V2.5: Emergency Safe Mode
-    if system_status.is_frozen:
-        logger.warning("System is in SAFE MODE. Skill updates are frozen.")
-        return
 
     # ================================
     # 1. Compute deltas
     # ================================
-    deltas = compute_skill_deltas(
+    raw_deltas = compute_skill_deltas(
         evaluation=evaluation,
         difficulty=task_instance.difficulty,
         skill=task_template.skill,
         question_type=task_template.question_type,
     )
 
+    # V2.5: Emergency Safe Mode
+    if system_status.is_frozen:
+        logger.warning("System is in SAFE MODE. Skill updates are frozen.")
+        if journal is not None:
+            journal.append(SkillUpdateJournalEntry(
+                user_id=learning_state.user_id,
+                evaluation_id=evaluation_id,
+                task_instance_id=task_instance.task_instance_id,
+                raw_deltas=raw_deltas,
+                flags=sorted(flags),
+                score=evaluation.score,
+                confidence=evaluation.confidence,
+                prompt_version=evaluation.prompt_version,
+                created_at=datetime.now(timezone.utc),
+            ))
+        return []
+
+    return apply_raw_skill_deltas(
+        learning_state=learning_state,
+        raw_deltas=raw_deltas,
+        flags=flags,
+        score=evaluation.score,
+        confidence=evaluation.confidence,
+        prompt_version=evaluation.prompt_version,
+        event_id=task_instance.task_instance_id,
+        evaluation_id=evaluation_id,
+    )
+
+
+def apply_raw_skill_deltas(
+    *,
+    learning_state: UserLearningState,
+    raw_deltas: Dict[str, float],
+    flags: Set[str],
+    score: float,
+    confidence: float,
+    prompt_version: Optional[str],
+    event_id: str,
+    evaluation_id: str = "",
+) -> List[SkillUpdateTelemetry]:
+    """
+    Applies the current update policy (stability penalty, global
+    dampening, evaluator compatibility, minimum progress) to
+    policy-free deltas and mutates the SkillVector. Shared by live
+    evaluations and the replay of the frozen-time journal.
+    """
+    deltas = dict(raw_deltas)
+
     # V2.4: Apply Stability Penalty
     for skill, delta in deltas.items():
         deltas[skill] = apply_stability_penalty(delta, flags)
@@ -50,8 +100,10 @@ def apply_skill_vector_update(
         for skill in deltas:
             deltas[skill] *= dampening
 
+    dampened_deltas = dict(deltas)
+
     # V2.5.3.1: Evaluator Compatibility Check
-    current_prompt_version = evaluation.prompt_version
+    current_prompt_version = prompt_version
     
     # V2.5.6: Minimum Progress Guarantee
     MIN_POSITIVE_DELTA = 0.01
@@ -100,8 +152,8 @@ def apply_skill_vector_update(
                 last_updated=now,
                 evidence_summary=EvidenceSummary(
                     total_events=1,
-                    weighted_score=evaluation.score,
-                    last_event_id=task_instance.task_instance_id,
+                    weighted_score=score,
+                    last_event_id=event_id,
                     last_prompt_version=current_prompt_version # V2.5.3.1
                 ),
                 source_mix=SourceMix(
@@ -124,8 +176,8 @@ def apply_skill_vector_update(
             entry.evidence_summary.last_prompt_version = current_prompt_version # V2.5.3.1
             
             entry.evidence_summary.total_events += 1
-            entry.evidence_summary.weighted_score += evaluation.score
-            entry.evidence_summary.last_event_id = task_instance.task_instance_id
+            entry.evidence_summary.weighted_score += score
+            entry.evidence_summary.last_event_id = event_id
 
             # Update Confidence (Simple heuristic: grows with exposure)
             # Cap at 1.0, increment by 0.05 per interaction
@@ -141,3 +193,23 @@ def apply_skill_vector_update(
             entry.source_mix.priors = (1 - alpha) * entry.source_mix.priors
             entry.source_mix.assessments = (1 - alpha) * entry.source_mix.assessments
             entry.source_mix.projects = (1 - alpha) * entry.source_mix.projects
+
+    # ================================
+    # 5. Telemetry
+    # ================================
+    stability = apply_stability_penalty(1.0, flags)
+    return [
+        SkillUpdateTelemetry(
+            user_id=learning_state.user_id,
+            skill=skill,
+            raw_delta=raw_deltas[skill],
+            dampened_delta=dampened_deltas[skill],
+            final_delta=updated_levels[skill] - current_levels.get(skill, 0.0),
+            stability_factor=stability,
+            confidence_weight=confidence,
+            safe_mode_active=system_status.status.mode == "SAFE_MODE",
+            evaluation_id=evaluation_id,
+            created_at=now,
+        )
+        for skill in deltas
+    ]
@@ -1,35 +1,114 @@
 # app/domain/task_template_loader.py
 
-from typing import Dict, List
+import gc
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
 from app.schemas.task_template import TaskTemplate
-from app.services.task_factory import TaskFactory, TASK_DIR
+from app.domain.probe_features import ProbeFeatures
+from app.services.task_factory import TaskFactory, TASK_DIR, ROOT_DIR
+from app.services.curriculum_service import CurriculumService, CURRICULUM_DIR
+from app.domain.registry_snapshot import read_snapshot, write_snapshot, is_stale
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
 
 _DYNAMIC_TEMPLATE_CACHE: Dict[str, TaskTemplate] = {}
+_PROBE_FEATURES: Optional[ProbeFeatures] = None
 _LOADED = False
 
 
-def _ensure_loaded():
-    """
-    Lazily loads all available task templates from YAML files via TaskFactory
-    into the local cache.
-    """
-    global _LOADED
-    if _LOADED:
-        return
+def _snapshot_path() -> Optional[Path]:
+    if not settings.TEMPLATE_REGISTRY_SNAPSHOT:
+        return None
+    path = Path(settings.TEMPLATE_REGISTRY_SNAPSHOT)
+    return path if path.is_absolute() else ROOT_DIR / path
+
+
+def _source_files() -> List[Path]:
+    sources = list(CURRICULUM_DIR.glob("*.yaml"))
+    if TASK_DIR.exists():
+        sources.extend(TASK_DIR.rglob("*.yaml"))
+    return sources
 
+
+def _load_from_yaml() -> None:
     # Iterate over all YAML files in the task directory (recursively)
     if TASK_DIR.exists():
         for file_path in TASK_DIR.rglob("*.yaml"):
-            # Use relative path stem or specific logic if nested
-            skill_name = file_path.stem
             templates = TaskFactory.load_tasks_from_file(file_path)
-            
+
             for template in templates:
                 _DYNAMIC_TEMPLATE_CACHE[template.task_template_id] = template
 
+
+def _load_from_snapshot(path: Path) -> None:
+    """
+    Hydrates the registry from the compiled snapshot, (re)building it first
+    if it is missing or older than the YAML sources.
+    """
+    snapshot = None if is_stale(path, _source_files()) else read_snapshot(path)
+
+    if snapshot is None:
+        _load_from_yaml()
+        curricula = {
+            track_id: CurriculumService.get_curriculum(track_id)
+            for track_id in CurriculumService.available_tracks()
+        }
+        write_snapshot(path, _DYNAMIC_TEMPLATE_CACHE.values(), curricula)
+        logger.info(f"Template registry snapshot written to {path}")
+        return
+
+    for template in snapshot.templates:
+        _DYNAMIC_TEMPLATE_CACHE[template.task_template_id] = template
+    CurriculumService.prime(snapshot.curricula)
+
+
+def _ensure_loaded():
+    """
+    Lazily loads all available task templates from YAML files via TaskFactory
+    into the local cache. When TEMPLATE_REGISTRY_SNAPSHOT is configured, the
+    compiled snapshot is used instead of re-parsing the YAML in every worker.
+    """
+    global _LOADED, _PROBE_FEATURES
+    if _LOADED:
+        return
+
+    path = _snapshot_path()
+    if path is not None:
+        try:
+            _load_from_snapshot(path)
+        except Exception as e:
+            logger.error(f"Template registry snapshot unusable ({e}); loading YAML")
+            _DYNAMIC_TEMPLATE_CACHE.clear()
+            _load_from_yaml()
+    else:
+        _load_from_yaml()
+
+    # Feature matrix for AdaptiveMarket scoring, built once per registry
+    _PROBE_FEATURES = ProbeFeatures(_DYNAMIC_TEMPLATE_CACHE.values())
     _LOADED = True
 
 
+def preload_registry() -> None:
+    """
+    Loads the registry and every curriculum in the master process, then
+    freezes them out of the garbage collector.
+
+    Under a pre-forking server (gunicorn --preload) workers inherit these
+    objects copy-on-write. gc.freeze() keeps the collector from touching
+    their headers after fork, so the pages stay shared instead of being
+    copied into every worker.
+    """
+    _ensure_loaded()
+    for track_id in CurriculumService.available_tracks():
+        CurriculumService.get_curriculum(track_id)
+
+    gc.collect()
+    gc.freeze()
+    logger.info(f"Preloaded {len(_DYNAMIC_TEMPLATE_CACHE)} task templates for shared workers")
+
+
 def get_task_template(task_template_id: str) -> TaskTemplate:
     """
     Retrieves a single task template by its unique ID.
@@ -49,3 +128,11 @@ def get_all_templates() -> List[TaskTemplate]:
     """
     _ensure_loaded()
     return list(_DYNAMIC_TEMPLATE_CACHE.values())
+
+
+def get_probe_features() -> ProbeFeatures:
+    """
+    Returns the precomputed feature matrix over every loaded template.
+    """
+    _ensure_loaded()
+    return _PROBE_FEATURES
@@ -16,7 +16,13 @@ from app.api.system_control import router as system_control_router
 from app.core.config import settings
 from app.core.logging import setup_logging
 from app.core.limiter import limiter
-from app.domain.task_template_loader import _ensure_loaded
+from app.domain.task_template_loader import _ensure_loaded, preload_registry
+from app.services.hint_service import load_hint_catalog
+from app.core.system_status import system_status
+from app.services.telemetry_service import telemetry_writer
+from app.db.telemetry_repo import ensure_telemetry_collections
+from app.db.indexes import ensure_indexes
+from app.db.skill_registry_repo import load_skill_registry
 from fastapi.responses import JSONResponse
 from fastapi import Request, status
 from slowapi import _rate_limit_exceeded_handler
@@ -34,6 +40,11 @@ import logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# Under a pre-forking server this runs once in the master, so every worker
+# shares the same registry pages instead of building its own copy.
+if settings.PRELOAD_TEMPLATE_REGISTRY:
+    preload_registry()
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
@@ -46,10 +57,43 @@ async def lifespan(app: FastAPI):
         logger.info("Task templates loaded successfully.")
     except Exception as e:
         logger.error(f"Failed to load task templates: {e}")
+
+    # Precomputed slot hints (scripts/build_hint_catalog.py)
+    try:
+        count = await load_hint_catalog(app.state.db)
+        logger.info(f"Loaded {count} precomputed hints.")
+    except Exception as e:
+        logger.error(f"Failed to load hint catalog: {e}")
+
+    # Registered skill ids (validates skill writes without a query each)
+    try:
+        count = await load_skill_registry(app.state.db)
+        logger.info(f"Loaded {count} registered skills.")
+    except Exception as e:
+        logger.error(f"Failed to load skill registry: {e}")
+
+    # Evaluation telemetry (time-series collections + buffered writer)
+    try:
+        await ensure_telemetry_collections(app.state.db)
+    except Exception as e:
+        logger.error(f"Failed to prepare telemetry collections: {e}")
+    telemetry_writer.start(app.state.db)
+
+    # Unique submissions (required: startup fails without it), journal,
+    # idempotency keys, leases
+    await ensure_indexes(app.state.db)
+
+    # Cluster-wide system status (cached locally, kept in sync in the background)
+    try:
+        await system_status.start(app.state.db)
+    except Exception as e:
+        logger.error(f"Failed to load system status: {e}")
         
     yield
     # Shutdown
     logger.info("Shutting down application...")
+    await system_status.stop()
+    await telemetry_writer.stop()
     close_client()
 
 app = FastAPI(title="SkillForge AI Backend",lifespan=lifespan)
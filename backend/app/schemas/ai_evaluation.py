@@ -20,3 +20,6 @@ class AIEvaluationResult(BaseModel):
     model_version: str = "0.0.0"
     prompt_version: str = "1.0"
     temperature: float = 0.0
+
+    # Evaluator score before integrity penalties (hint use, speed); what replays compare against
+    raw_score: Optional[float] = None
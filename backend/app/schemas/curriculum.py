@@ -1,5 +1,5 @@
 from typing import List, Optional, Literal, Dict, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 class SlotMasteryPolicy(BaseModel):
     pass_score: float = 0.6
@@ -49,10 +49,20 @@ class Curriculum(BaseModel):
     description: Optional[str] = None
     phases: List[PhaseDefinition]
 
+    # Curricula are immutable once loaded, so the index is built once
+    _slot_index: Optional[Dict[str, SlotDefinition]] = PrivateAttr(default=None)
+
     def get_slot_definition(self, slot_id: str) -> SlotDefinition:
         """Helper to find a slot definition by ID across all phases."""
-        for phase in self.phases:
-            for slot in phase.slots:
-                if slot.id == slot_id:
-                    return slot
+        index = self._slot_index
+        if index is None:
+            index = {}
+            for phase in self.phases:
+                for slot in phase.slots:
+                    index.setdefault(slot.id, slot)
+            self._slot_index = index
+
+        slot = index.get(slot_id)
+        if slot is not None:
+            return slot
         raise ValueError(f"Slot definition {slot_id} not found in curriculum {self.track_id}")
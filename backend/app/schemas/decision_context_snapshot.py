@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+from datetime import datetime
+
+
+class SnapshotSkill(BaseModel):
+    """
+    Level/confidence of one skill as of the last folded submission.
+    """
+    level: float = 0.0
+    confidence: float = 0.0
+
+
+class DecisionContextSnapshot(BaseModel):
+    """
+    Persisted, write-maintained input to DecisionContext for one user/track.
+    Updated in the same transaction as the skill vector.
+    """
+    user_id: str
+    track_id: str
+    skills: Dict[str, SnapshotSkill] = Field(default_factory=dict)
+    recent_template_ids: List[str] = Field(default_factory=list)  # latest first
+    updated_at: Optional[datetime] = None
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 from pydantic import BaseModel
 
 class EvaluationTelemetry(BaseModel):
@@ -6,6 +7,8 @@ class EvaluationTelemetry(BaseModel):
     user_id: str
     slot_id: str
     task_instance_id: str
+    skill: Optional[str] = None
+    difficulty: Optional[str] = None
 
     score: float
     confidence: float
@@ -1,9 +1,9 @@
-from pydantic import BaseModel, Field
-from typing import List, Literal, Optional, Set
+from pydantic import BaseModel, Field, PrivateAttr, field_serializer
+from typing import Dict, List, Literal, Optional, Set, Tuple
 from datetime import datetime
 
 from app.schemas.task_instance import TaskInstance
-from app.domain.evaluation_history import EvaluationSnapshot
+from app.domain.evaluation_history import EvaluationHistory
 
 
 class TaskSlot(BaseModel):
@@ -32,11 +32,27 @@ class TaskSlot(BaseModel):
     user_message: Optional[str] = None
 
     # V2.4: Evaluation Consistency
-    evaluation_history: List[EvaluationSnapshot] = []
+    evaluation_history: EvaluationHistory = Field(default_factory=EvaluationHistory)
     flags: Set[str] = set()
 
     model_config = {"populate_by_name": True}
 
+    # Owning roadmap's dirty-slot set (incremental validation)
+    _tracker: Optional[Set[str]] = PrivateAttr(default=None)
+
+    def __setattr__(self, name, value):
+        tracker = self.__pydantic_private__.get("_tracker") if self.__pydantic_private__ else None
+        if tracker is not None and name == "slot_id":
+            tracker.add(self.slot_id)
+        super().__setattr__(name, value)
+        if tracker is not None and not name.startswith("_"):
+            tracker.add(self.slot_id)
+
+    @field_serializer("flags")
+    def _serialize_flags(self, flags: Set[str]) -> List[str]:
+        # BSON has no set type; emit a list during the dump itself
+        return sorted(flags)
+
 
 class PhaseState(BaseModel):
     phase_id: str
@@ -47,6 +63,27 @@ class PhaseState(BaseModel):
 
     model_config = {"extra": "forbid"}
 
+    # Owning roadmap's dirty-phase set (incremental validation)
+    _tracker: Optional[Set[str]] = PrivateAttr(default=None)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        tracker = self.__pydantic_private__.get("_tracker") if self.__pydantic_private__ else None
+        if tracker is not None and not name.startswith("_"):
+            tracker.add(self.phase_id)
+
+
+class GovernanceFingerprint(BaseModel):
+    """
+    Inputs seen by the last governance pass over this roadmap.
+    A slot is only re-evaluated when one of its dependent skills or its own
+    status has changed since then, or when the curriculum's governance
+    policies (policy_hash) have.
+    """
+    policy_hash: Optional[str] = None
+    scores: Dict[str, Optional[float]] = Field(default_factory=dict)  # None = skill not tracked yet
+    slot_statuses: Dict[str, str] = Field(default_factory=dict)
+
 
 class RoadmapState(BaseModel):
     user_id: str
@@ -67,24 +104,174 @@ class RoadmapState(BaseModel):
     generated_at: datetime
     last_evaluated_at: datetime
 
+    # Incremental governance
+    governance_fingerprint: Optional[GovernanceFingerprint] = None
+
+    # Lazily built lookup indexes. Entries are positions, verified on every
+    # hit; a stale or missing entry triggers a rebuild, so structural
+    # changes (phases/slots/instances added, removed or reordered) never
+    # need explicit invalidation.
+    _slot_index: Optional[Dict[str, Tuple[int, int]]] = PrivateAttr(default=None)
+    _instance_index: Optional[Dict[str, int]] = PrivateAttr(default=None)
+    # Hot-path reads go through __pydantic_private__ directly; pydantic's
+    # private-attribute __getattr__ costs more than the lookup itself.
+
+    # Change tracking for incremental validation (see roadmap_validator).
+    # Slots/phases report field assignments into the dirty sets; the
+    # baseline describes the roadmap as of the last validated state.
+    _dirty_slots: Set[str] = PrivateAttr(default_factory=set)
+    _dirty_phases: Set[str] = PrivateAttr(default_factory=set)
+    _baseline_in_progress: Set[str] = PrivateAttr(default_factory=set)
+    _baseline_shape: Optional[Tuple[int, ...]] = PrivateAttr(default=None)
+    _baseline_valid: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, __context) -> None:
+        self.track_changes(validated=False)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name == "phases":
+            # New phase/slot objects are not wired; force a full pass
+            self._baseline_shape = None
+
     # ==========================
-    # Slot lookup
+    # Change tracking
     # ==========================
-    def get_slot(self, slot_id: str) -> TaskSlot:
+    def _shape(self) -> Tuple[int, ...]:
+        return tuple(len(phase.slots) for phase in self.phases)
+
+    def track_changes(self, validated: bool = True) -> None:
+        """
+        Wires every phase/slot to the dirty sets and resets the baseline to
+        the current state. validated=True records that this state passed
+        full validation.
+        """
+        dirty_slots = self._dirty_slots
+        dirty_phases = self._dirty_phases
+        dirty_slots.clear()
+        dirty_phases.clear()
+
+        # Runs on every load: write the private dicts directly instead of
+        # going through pydantic's __setattr__ once per slot
+        in_progress = set()
         for phase in self.phases:
+            phase.__pydantic_private__["_tracker"] = dirty_phases
             for slot in phase.slots:
-                if slot.slot_id == slot_id:
-                    return slot
+                slot.__pydantic_private__["_tracker"] = dirty_slots
+                if slot.status == "in_progress":
+                    in_progress.add(slot.slot_id)
+        self._baseline_in_progress = in_progress
+        self._baseline_shape = self._shape()
+        self._baseline_valid = validated
+
+    def trust_baseline(self) -> None:
+        """
+        Marks the current state as already validated (e.g. just loaded from
+        storage, where every write passed validation).
+        """
+        self._baseline_valid = True
+
+    def changes_since_validation(self) -> Optional[Tuple[Set[str], Set[str]]]:
+        """
+        (dirty slot ids, dirty phase ids) since the last validated state, or
+        None when changes cannot be tracked incrementally.
+        """
+        if not self._baseline_valid or self._baseline_shape != self._shape():
+            return None
+        return self._dirty_slots, self._dirty_phases
+
+    def in_progress_slot_ids(self) -> Set[str]:
+        """
+        In-progress slots derived from the baseline plus dirty slots only.
+        """
+        dirty = self._dirty_slots
+        in_progress = self._baseline_in_progress - dirty
+        for slot_id in dirty:
+            if self.get_slot(slot_id).status == "in_progress":
+                in_progress.add(slot_id)
+        return in_progress
+
+    def commit_validation(self, in_progress: Set[str]) -> None:
+        self._baseline_in_progress = in_progress
+        self._dirty_slots.clear()
+        self._dirty_phases.clear()
+        self._baseline_valid = True
+
+    # ==========================
+    # Slot lookup
+    # ==========================
+    def _rebuild_slot_index(self) -> Dict[str, Tuple[int, int]]:
+        index: Dict[str, Tuple[int, int]] = {}
+        for phase_idx, phase in enumerate(self.phases):
+            for slot_idx, slot in enumerate(phase.slots):
+                index.setdefault(slot.slot_id, (phase_idx, slot_idx))
+        self._slot_index = index
+        return index
+
+    def _slot_position(self, slot_id: str) -> Tuple[int, int]:
+        index = self.__pydantic_private__.get("_slot_index")
+        if index is None:
+            index = self._rebuild_slot_index()
+
+        for attempt in range(2):
+            position = index.get(slot_id)
+            if position is not None:
+                phase_idx, slot_idx = position
+                if (
+                    phase_idx < len(self.phases)
+                    and slot_idx < len(self.phases[phase_idx].slots)
+                    and self.phases[phase_idx].slots[slot_idx].slot_id == slot_id
+                ):
+                    return position
+            if attempt == 0:
+                index = self._rebuild_slot_index()
+
         raise ValueError(f"Slot with id {slot_id} not found")
 
+    def get_slot(self, slot_id: str) -> TaskSlot:
+        phase_idx, slot_idx = self._slot_position(slot_id)
+        return self.phases[phase_idx].slots[slot_idx]
+
+    def get_phase_for_slot(self, slot_id: str) -> PhaseState:
+        phase_idx, _ = self._slot_position(slot_id)
+        return self.phases[phase_idx]
+
     # ==========================
     # TaskInstance lookup
     # ==========================
+    def _rebuild_instance_index(self) -> Dict[str, int]:
+        index: Dict[str, int] = {}
+        for position, ti in enumerate(self.task_instances):
+            index.setdefault(ti.task_instance_id, position)
+        self._instance_index = index
+        return index
+
     def get_task_instance(self, task_instance_id: str) -> TaskInstance:
-        for ti in self.task_instances:
-            if ti.task_instance_id == task_instance_id:
-                return ti
+        index = self.__pydantic_private__.get("_instance_index")
+        if index is None:
+            index = self._rebuild_instance_index()
+
+        for attempt in range(2):
+            position = index.get(task_instance_id)
+            if (
+                position is not None
+                and position < len(self.task_instances)
+                and self.task_instances[position].task_instance_id == task_instance_id
+            ):
+                return self.task_instances[position]
+            if attempt == 0:
+                index = self._rebuild_instance_index()
+
         raise ValueError(f"TaskInstance {task_instance_id} not found")
+
+    def add_task_instance(self, task_instance: TaskInstance) -> None:
+        self.task_instances.append(task_instance)
+        index = self.__pydantic_private__.get("_instance_index")
+        if index is not None:
+            index.setdefault(
+                task_instance.task_instance_id, len(self.task_instances) - 1
+            )
+
     def validate_state(self) -> None:
         # Example invariants (minimum)
         active_phases = [p for p in self.phases if p.phase_status == "active"]
@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+from pydantic import BaseModel
+
+class SkillUpdateJournalEntry(BaseModel):
+    """
+    Skill update deferred while the system was FROZEN. Holds the
+    policy-free deltas plus what the policy needs to apply them later.
+    """
+    user_id: str
+    evaluation_id: str
+    task_instance_id: str
+
+    raw_deltas: Dict[str, float]
+    flags: List[str]
+
+    score: float
+    confidence: float
+    prompt_version: Optional[str] = None
+
+    created_at: datetime
@@ -24,3 +24,8 @@ class TaskSubmission(BaseModel):
     # V2.2 Integrity Fields
     hint_used: bool = False
     time_spent_seconds: Optional[int] = None
+
+    # Denormalized task context (analytics, canary replay)
+    skill: Optional[str] = None
+    difficulty: Optional[str] = None
+    question_type: Optional[str] = None
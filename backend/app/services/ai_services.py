@@ -4,6 +4,9 @@ from app.schemas.roadmap_state import TaskSlot
 from app.ai.groq_client import get_groq_llm
 from langchain_core.prompts import ChatPromptTemplate
 
+# Bump whenever the hint prompt changes; the offline hint catalog is keyed by it
+HINT_PROMPT_VERSION = "1.0.0"
+
 class AIService:
     """
     Handles all AI-powered operations for SkillForgeAI.
@@ -18,9 +21,18 @@ class AIService:
         slot: TaskSlot,
         user_skill_vector: Dict[str, Any]
     ) -> str:
-        skill = slot.skill
-        difficulty = slot.difficulty
-        
+        return await self.generate_skill_hint(
+            skill=slot.skill,
+            difficulty=slot.difficulty,
+            user_level=user_skill_vector.get(slot.skill, 0.0),
+        )
+
+    async def generate_skill_hint(
+        self,
+        skill: str,
+        difficulty: str,
+        user_level: Any
+    ) -> str:
         # Create a concise prompt for a hint
         prompt = ChatPromptTemplate.from_template(
             "You are a helpful coding mentor. The user is about to start a task.\n"
@@ -31,8 +43,6 @@ class AIService:
             "Do NOT give the answer. Focus on concepts."
         )
         
-        user_level = user_skill_vector.get(skill, 0.0)
-        
         chain = prompt | self.llm
         response = await chain.ainvoke({
             "skill": skill,
@@ -1,18 +1,40 @@
 import asyncio
-from datetime import datetime
+from datetime import datetime, timezone
 from app.domain.control_rules import ControlRules
 from app.core.system_status import system_status
+from app.db.base import get_database
+from app.db.golden_task_repo import get_golden_run_span
+from app.db.canary_replay_repo import get_last_replay_failure_at
+from app.db.telemetry_repo import get_score_stats
+from app.services.calibration_service import CalibrationService
+from app.services.canary_replay_service import CanaryReplayEngine
+from app.services.skill_journal_service import replay_skill_journal
 
 class CalibrationScheduler:
     """
     V2.6.4 - Calibration Orchestration
     """
     
-    def __init__(self):
+    def __init__(self, db=None):
         self.is_running = False
+        self._db = db
+        self._calibration_service = None
+
+    @property
+    def db(self):
+        return self._db if self._db is not None else get_database()
+
+    @property
+    def calibration_service(self) -> CalibrationService:
+        # Created lazily: keeps its cached golden baselines across cycles
+        if self._calibration_service is None:
+            self._calibration_service = CalibrationService(self.db)
+        return self._calibration_service
         
     async def start(self):
         self.is_running = True
+        # Transitions made here must reach every API worker
+        await system_status.start(self.db)
         while self.is_running:
             await self.run_calibration_cycle()
             await asyncio.sleep(3600) # Run every hour
@@ -25,6 +47,10 @@ class CalibrationScheduler:
         
         # 1. Periodic golden task execution
         golden_results = await self.run_golden_tasks()
+
+        # 1.5 Replay skill updates journaled while frozen (no-op otherwise)
+        if not system_status.is_frozen:
+            await replay_skill_journal(self.db)
         
         # 2. Canary user replay
         canary_results = await self.run_canary_replay()
@@ -34,7 +60,12 @@ class CalibrationScheduler:
         
         # Add golden/canary results to metrics
         metrics["golden_task_failure"] = not golden_results["success"]
+        metrics["golden_tasks_stable"] = golden_results["success"]
         metrics["directional_drift_count"] = golden_results.get("drift_count", 0)
+        metrics["canary_replay_failure"] = not canary_results["success"]
+        if canary_results.get("count"):
+            metrics["canary_mean_abs_delta"] = canary_results["mean_abs_delta"]
+            metrics["canary_directional_drift"] = canary_results["directional_drift"]
         metrics["successful_calibration_runs"] = system_status.get_passes() # Using passes as proxy for now
         
         # 4. Status transitions
@@ -43,22 +74,49 @@ class CalibrationScheduler:
         print(f"[{datetime.utcnow()}] Calibration cycle complete. System Mode: {system_status.status.mode}")
 
     async def run_golden_tasks(self):
-        # Placeholder for actual golden task execution logic
-        # In a real implementation, this would call the evaluator with golden tasks
-        return {"success": True, "drift_count": 0}
+        report = await self.calibration_service.run_calibration()
+        return {
+            "success": report["failures"] == 0,
+            "drift_count": report["drift_count"],
+            "run_id": report["run_id"],
+        }
 
     async def run_canary_replay(self):
-        # Placeholder for canary replay
-        return {"success": True}
+        # Bounded, checkpointed re-evaluation of stored submissions
+        return await CanaryReplayEngine(self.db).run()
 
     async def analyze_score_distribution(self):
-        # Placeholder for analysis
-        # Would query EvaluationTelemetry
-        return {
-            "global_std_dev": 0.1,
-            "confidence_avg": 0.8,
-            "drift_free_hours": 24,
-            "golden_tasks_stable": True
-        }
+        """
+        Live score distribution (hourly telemetry rollups) plus how long
+        golden tasks and canary replays have been drift-free.
+        """
+        metrics = {}
+
+        stats = await get_score_stats(self.db, hours=24)
+        if stats:
+            metrics["global_std_dev"] = stats["std_dev"]
+            metrics["confidence_avg"] = stats["confidence_avg"]
+
+        # A skill/difficulty/prompt segment can drift while the global mix hides it
+        segments = await self.calibration_service.check_segmented_score_stats(hours=24)
+        metrics["segment_stats"] = segments
+        if segments:
+            metrics["segment_std_dev_max"] = max(s["std_dev"] for s in segments.values())
+
+        first_run_at, golden_failed_at = await get_golden_run_span(self.db)
+        canary_failed_at = await get_last_replay_failure_at(self.db)
+        failures = [t for t in (golden_failed_at, canary_failed_at) if t is not None]
+        drift_free_since = max(failures) if failures else first_run_at
+
+        metrics["drift_free_hours"] = (
+            (datetime.now(timezone.utc) - _aware(drift_free_since)).total_seconds() / 3600
+            if drift_free_since else 0
+        )
+        return metrics
+
+
+def _aware(dt: datetime) -> datetime:
+    # Mongo returns naive UTC datetimes
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
 
 calibration_scheduler = CalibrationScheduler()
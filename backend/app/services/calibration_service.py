@@ -1,71 +1,66 @@
+import asyncio
+import statistics
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
 from app.domain.golden_tasks import GOLDEN_TASKS, GoldenTask
+from app.domain.golden_baseline import GoldenBaseline
 from app.ai.evaluate_task import evaluate_task
+from app.ai.provider_limiter import provider_limiter
 from app.domain.task_context import TaskContext
+from app.core.config import settings
 from app.core.system_status import system_status
-from app.db.task_submission_repo import TaskSubmissionRepo
+from app.db.telemetry_repo import get_score_stats, get_score_distributions
+from app.db.golden_task_repo import save_golden_runs, get_golden_baseline_runs
 import logging
 
 logger = logging.getLogger(__name__)
 
 class CalibrationService:
-    def __init__(self, submission_repo: TaskSubmissionRepo):
-        self.submission_repo = submission_repo
+    def __init__(self, db):
+        self.db = db
+        # task_id -> baseline; loaded once, then extended in memory per run
+        self._baselines: Optional[Dict[str, GoldenBaseline]] = None
+
+    async def _get_baselines(self) -> Dict[str, GoldenBaseline]:
+        if self._baselines is None:
+            stored = await get_golden_baseline_runs(self.db, settings.GOLDEN_BASELINE_RUNS)
+            self._baselines = {
+                task.task_id: GoldenBaseline(settings.GOLDEN_BASELINE_RUNS, stored.get(task.task_id, []))
+                for task in GOLDEN_TASKS
+            }
+        return self._baselines
 
-    async def run_calibration(self) -> dict:
+    async def run_calibration(self, repeats: int = settings.GOLDEN_TASK_REPEATS) -> dict:
         """
-        Run all golden tasks and check for drift.
+        Run all golden tasks (each sampled `repeats` times, concurrently
+        under the provider limiter) and check them for drift against their
+        historical baseline distribution.
         Returns a report.
         """
-        results = []
-        failures = 0
-        
-        for task in GOLDEN_TASKS:
-            context = TaskContext(
-                task_instance_id=task.task_id,
-                skill=task.skill,
-                difficulty=task.difficulty,
-                question_type=task.question_type
-            )
-            
-            try:
-                eval_result = evaluate_task(context=context, payload=task.payload)
-                
-                # V2.5.1: Evaluator Fingerprint Check
-                if task.evaluator_fingerprint:
-                    current_fingerprint = f"{eval_result.model_name}:{eval_result.prompt_version}"
-                    if current_fingerprint != task.evaluator_fingerprint:
-                        logger.error(f"Fingerprint Mismatch for {task.task_id}. Expected {task.evaluator_fingerprint}, got {current_fingerprint}")
-                        failures += 1
-                        results.append({
-                            "task_id": task.task_id,
-                            "error": "Fingerprint Mismatch",
-                            "passed_check": False
-                        })
-                        continue
-
-                drift = abs(eval_result.score - task.expected_score)
-                passed_check = drift <= task.tolerance
-                
-                if not passed_check:
-                    failures += 1
-                    logger.error(f"Golden Task Failed: {task.task_id}. Expected {task.expected_score}, got {eval_result.score}")
-
-                results.append({
-                    "task_id": task.task_id,
-                    "expected": task.expected_score,
-                    "actual": eval_result.score,
-                    "drift": drift,
-                    "passed_check": passed_check
-                })
-                
-            except Exception as e:
-                logger.error(f"Error running golden task {task.task_id}: {e}")
-                failures += 1
-                results.append({
-                    "task_id": task.task_id,
-                    "error": str(e),
-                    "passed_check": False
-                })
+        baselines = await self._get_baselines()
+        run_id = uuid.uuid4().hex
+        now = datetime.now(timezone.utc)
+
+        results = await asyncio.gather(*(
+            self._run_golden_task(task, repeats, baselines[task.task_id])
+            for task in GOLDEN_TASKS
+        ))
+
+        failures = sum(1 for r in results if not r["passed_check"])
+        drift_count = sum(1 for r in results if r.get("directional_drift"))
+
+        # Persist every run, failed ones included (they date the last
+        # failure); only passing runs extend the baseline
+        runs = [{**r, "run_id": run_id, "created_at": now} for r in results]
+        try:
+            await save_golden_runs(self.db, runs)
+        except Exception as e:
+            logger.error(f"Failed to store golden task runs: {e}")
+        for r in results:
+            if r["passed_check"]:
+                baselines[r["task_id"]].add_run(r["samples"])
 
         # Decision Logic
         if failures > 0:
@@ -82,21 +77,76 @@ class CalibrationService:
                 logger.info(f"Calibration passed ({system_status.get_passes()}/3). System remains frozen.")
 
         return {
+            "run_id": run_id,
             "failures": failures,
+            "drift_count": drift_count,
             "frozen": system_status.is_frozen,
             "details": results
         }
 
+    async def _run_golden_task(self, task: GoldenTask, repeats: int, baseline: GoldenBaseline) -> dict:
+        context = TaskContext(
+            task_instance_id=task.task_id,
+            skill=task.skill,
+            difficulty=task.difficulty,
+            question_type=task.question_type
+        )
+
+        outcomes = await asyncio.gather(
+            *(
+                provider_limiter.run(
+                    evaluate_task,
+                    context=context,
+                    payload=task.payload,
+                    timeout=settings.GOLDEN_TASK_TIMEOUT_SECONDS,
+                )
+                for _ in range(repeats)
+            ),
+            return_exceptions=True,
+        )
+
+        errors = [o for o in outcomes if isinstance(o, BaseException)]
+        if errors:
+            e = errors[0]
+            error = "Timeout" if isinstance(e, asyncio.TimeoutError) else str(e)
+            logger.error(f"Error running golden task {task.task_id}: {error}")
+            return {"task_id": task.task_id, "error": error, "samples": [], "passed_check": False}
+
+        # V2.5.1: Evaluator Fingerprint Check
+        if task.evaluator_fingerprint:
+            for eval_result in outcomes:
+                current_fingerprint = f"{eval_result.model_name}:{eval_result.prompt_version}"
+                if current_fingerprint != task.evaluator_fingerprint:
+                    logger.error(f"Fingerprint Mismatch for {task.task_id}. Expected {task.evaluator_fingerprint}, got {current_fingerprint}")
+                    return {"task_id": task.task_id, "error": "Fingerprint Mismatch", "samples": [], "passed_check": False}
+
+        samples: List[float] = [o.score for o in outcomes]
+        drift, allowed, reference, source = baseline.check(task, samples)
+        passed_check = abs(drift) <= allowed
+
+        if not passed_check:
+            logger.error(f"Golden Task Failed: {task.task_id}. Reference ({source}) {reference:.3f}, got {statistics.fmean(samples):.3f}")
+
+        return {
+            "task_id": task.task_id,
+            "samples": samples,
+            "mean": statistics.fmean(samples),
+            "std_dev": statistics.pstdev(samples),
+            "reference": reference,
+            "reference_source": source,
+            "drift": drift,
+            "allowed_drift": allowed,
+            "directional_drift": drift < -allowed,
+            "passed_check": passed_check,
+            "fingerprint": f"{outcomes[0].model_name}:{outcomes[0].prompt_version}",
+        }
+
     async def check_global_score_stats(self):
         """
         Check for global score inflation.
-        V2.5.2.1: Segmented Stats (Example usage)
         """
-        # Global check
-        stats = await self.submission_repo.get_global_score_stats(hours=24)
-        
-        # Example Segmented Check (could be looped over critical segments)
-        # stats_python = await self.submission_repo.get_global_score_stats(hours=24, skill="python_basics")
+        # Global check (hourly rollups of evaluation telemetry)
+        stats = await get_score_stats(self.db, hours=24)
         
         if not stats:
             return
@@ -119,3 +169,31 @@ class CalibrationService:
             system_status.set_dampening(1.0)
             
         return stats
+
+    async def check_segmented_score_stats(self, hours: int = 24) -> dict:
+        """
+        V2.5.2.1: Segmented Stats
+        Per (skill, difficulty, prompt_version) distributions from one read
+        of the rollups, keyed "skill:difficulty:prompt_version". Segments
+        with too few samples are left out.
+        """
+        since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        segments = await get_score_distributions(
+            self.db, since, group_by=("skill", "difficulty", "prompt_version")
+        )
+
+        report = {}
+        for (skill, difficulty, prompt_version), distribution in segments.items():
+            stats = distribution.to_stats()
+            if stats["count"] < 10:
+                continue # Not enough data
+
+            segment = f"{skill}:{difficulty}:{prompt_version}"
+            if stats["avg_score"] > 0.85:
+                logger.warning(f"Average score high for {segment} ({stats['avg_score']:.2f}).")
+            elif stats["avg_score"] < 0.3:
+                logger.warning(f"Average score low for {segment} ({stats['avg_score']:.2f}).")
+
+            report[segment] = stats
+
+        return report
@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import statistics
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from app.ai.evaluate_task import evaluate_task
+from app.ai.provider_limiter import ProviderLimiter, provider_limiter
+from app.core.config import settings
+from app.db.canary_replay_repo import (
+    get_replay_checkpoint,
+    save_replay_checkpoint,
+    get_replay_candidates,
+    save_replay_results,
+    save_replay_run,
+)
+from app.domain.task_context import TaskContext
+
+logger = logging.getLogger(__name__)
+
+# |replay - stored| above this counts as a disagreement
+DISAGREEMENT_THRESHOLD = 0.2
+# Mean |delta| above which the replay run fails
+MAX_MEAN_ABS_DELTA = 0.15
+# Mean signed delta below -this means the evaluator got systematically harsher
+DIRECTIONAL_DRIFT_THRESHOLD = 0.1
+
+
+def summarize_deltas(deltas: List[float]) -> dict:
+    """
+    Score-delta distribution (replay - stored) of one replay run.
+    """
+    if not deltas:
+        return {"count": 0}
+
+    abs_deltas = sorted(abs(d) for d in deltas)
+    mean_delta = statistics.fmean(deltas)
+    return {
+        "count": len(deltas),
+        "mean_delta": mean_delta,
+        "mean_abs_delta": statistics.fmean(abs_deltas),
+        "std_delta": statistics.pstdev(deltas),
+        "p90_abs_delta": abs_deltas[min(int(0.9 * len(abs_deltas)), len(abs_deltas) - 1)],
+        "disagreement_rate": sum(1 for d in abs_deltas if d > DISAGREEMENT_THRESHOLD) / len(deltas),
+        "directional_drift": mean_delta < -DIRECTIONAL_DRIFT_THRESHOLD,
+    }
+
+
+class CanaryReplayEngine:
+    """
+    Re-evaluates stored submissions with the current evaluator stack and
+    measures how far the new scores move from the stored ones.
+
+    Each run walks task_submissions in _id order from a persisted
+    checkpoint (wrapping to the start once history is exhausted), so
+    successive runs sweep the whole history and an interrupted run
+    resumes where it stopped. A run is bounded by `budget` evaluations
+    and `max_seconds`, and paced to `rate_per_second` with at most
+    `concurrency` calls in flight, on top of the shared provider limiter,
+    so it never takes more than a sliver of provider capacity.
+    """
+
+    def __init__(
+        self,
+        db,
+        limiter: ProviderLimiter = provider_limiter,
+        budget: int = settings.CANARY_REPLAY_BUDGET,
+        concurrency: int = settings.CANARY_REPLAY_CONCURRENCY,
+        rate_per_second: float = settings.CANARY_REPLAY_RATE_PER_SECOND,
+        max_seconds: float = settings.CANARY_REPLAY_MAX_SECONDS,
+        timeout_seconds: float = settings.GOLDEN_TASK_TIMEOUT_SECONDS,
+    ):
+        self.db = db
+        self.limiter = limiter
+        self.budget = budget
+        self.concurrency = concurrency
+        self.rate_per_second = rate_per_second
+        self.max_seconds = max_seconds
+        self.timeout_seconds = timeout_seconds
+        self._next_start = 0.0
+
+    async def run(self) -> dict:
+        run_id = uuid.uuid4().hex
+        deadline = time.monotonic() + self.max_seconds
+
+        checkpoint = await get_replay_checkpoint(self.db)
+        candidates = await get_replay_candidates(self.db, checkpoint, self.budget)
+        if not candidates and checkpoint is not None:
+            # Reached the end of history; start the next sweep
+            candidates = await get_replay_candidates(self.db, None, self.budget)
+
+        deltas: List[float] = []
+        errors = 0
+
+        # `concurrency` replays in flight per chunk; results and the
+        # checkpoint are saved after every chunk
+        for start in range(0, len(candidates), self.concurrency):
+            if time.monotonic() >= deadline:
+                break
+
+            chunk = candidates[start:start + self.concurrency]
+            results = await asyncio.gather(*(self._replay(doc, run_id) for doc in chunk))
+
+            stored = [r for r in results if r is not None]
+            errors += len(results) - len(stored)
+            deltas.extend(r["delta"] for r in stored)
+
+            await save_replay_results(self.db, stored)
+            await save_replay_checkpoint(self.db, chunk[-1]["_id"], run_id)
+
+        summary = summarize_deltas(deltas)
+        summary.update({
+            "run_id": run_id,
+            "errors": errors,
+            "success": summary["count"] == 0 or (
+                summary["mean_abs_delta"] <= MAX_MEAN_ABS_DELTA and not summary["directional_drift"]
+            ),
+            "created_at": datetime.now(timezone.utc),
+        })
+        await save_replay_run(self.db, dict(summary))
+        return summary
+
+    async def _pace(self) -> None:
+        now = time.monotonic()
+        wait = self._next_start - now
+        self._next_start = max(now, self._next_start) + 1.0 / self.rate_per_second
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _replay(self, doc: dict, run_id: str) -> Optional[dict]:
+        stored = doc["evaluation"]
+        stored_score = stored.get("raw_score")
+        if stored_score is None:
+            stored_score = stored["score"]
+
+        context = TaskContext(
+            task_instance_id=doc["task_instance_id"],
+            skill=doc["skill"],
+            difficulty=doc["difficulty"],
+            question_type=doc["question_type"],
+        )
+
+        await self._pace()
+        try:
+            replayed = await self.limiter.run(
+                evaluate_task,
+                context=context,
+                payload=doc["payload"],
+                timeout=self.timeout_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"Canary replay of submission {doc['_id']} failed: {e!r}")
+            return None
+
+        return {
+            "run_id": run_id,
+            "submission_id": doc["_id"],
+            "skill": doc["skill"],
+            "difficulty": doc["difficulty"],
+            "stored_score": stored_score,
+            "replay_score": replayed.score,
+            "delta": replayed.score - stored_score,
+            "stored_prompt_version": stored.get("prompt_version"),
+            "replay_prompt_version": replayed.prompt_version,
+            "created_at": datetime.now(timezone.utc),
+        }
@@ -1,8 +1,9 @@
 import yaml
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from app.schemas.curriculum import Curriculum
 from app.core.config import settings
+from app.domain.governance_engine import CompiledGovernance, compile_governance
 
 # ROOT_DIR is the backend directory
 ROOT_DIR = Path(__file__).resolve().parent.parent.parent
@@ -10,6 +11,7 @@ CURRICULUM_DIR = ROOT_DIR / settings.CURRICULUM_ROOT
 
 class CurriculumService:
     _cache: Dict[str, Curriculum] = {}
+    _governance: Dict[str, CompiledGovernance] = {}
 
     @classmethod
     def get_curriculum(cls, track_id: str) -> Curriculum:
@@ -30,12 +32,40 @@ class CurriculumService:
             
             curriculum = Curriculum(**data)
             cls._cache[track_id] = curriculum
+            cls._governance[track_id] = compile_governance(curriculum)
             return curriculum
         except yaml.YAMLError as e:
              raise ValueError(f"Invalid YAML format for curriculum {track_id}: {str(e)}")
         except Exception as e:
             raise ValueError(f"Failed to parse curriculum {track_id}: {str(e)}")
 
+    @classmethod
+    def available_tracks(cls) -> List[str]:
+        """
+        Track ids for every curriculum YAML at the top of CURRICULUM_DIR.
+        """
+        return sorted(p.stem for p in CURRICULUM_DIR.glob("*.yaml"))
+
+    @classmethod
+    def prime(cls, curricula: Dict[str, Curriculum]) -> None:
+        """
+        Seeds the cache with curricula that were already validated elsewhere
+        (e.g. the compiled registry snapshot).
+        """
+        cls._cache.update(curricula)
+        for track_id, curriculum in curricula.items():
+            cls._governance[track_id] = compile_governance(curriculum)
+
+    @classmethod
+    def get_compiled_governance(cls, track_id: str) -> CompiledGovernance:
+        """
+        Governance policies compiled into predicates when the curriculum was loaded.
+        """
+        if track_id not in cls._governance:
+            cls.get_curriculum(track_id)
+        return cls._governance[track_id]
+
     @classmethod
     def clear_cache(cls):
         cls._cache = {}
+        cls._governance = {}
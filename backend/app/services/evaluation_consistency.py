@@ -1,25 +1,34 @@
 import statistics
-from typing import List, Set
-from app.domain.evaluation_history import EvaluationSnapshot
+from typing import Sequence, Set, Union
+from app.domain.evaluation_history import EvaluationHistory, MAX_EVALUATION_HISTORY
 
 MAX_SCORE_VARIANCE = 0.15
 
-def has_score_drift(scores: List[float]) -> bool:
+Scores = Union[EvaluationHistory, Sequence[float]]
+
+
+def _score_variance(scores: Scores) -> float:
+    if isinstance(scores, EvaluationHistory):
+        return scores.score_variance()  # O(1) running sums
+    return statistics.pvariance(scores)
+
+def has_score_drift(scores: Scores) -> bool:
     if len(scores) < 3:
         return False
-    return statistics.pvariance(scores) > MAX_SCORE_VARIANCE
+    return _score_variance(scores) > MAX_SCORE_VARIANCE
 
-def has_directional_drift(scores: List[float]) -> bool:
+def has_directional_drift(scores: Scores) -> bool:
     if len(scores) < 3:
         return False
+    if isinstance(scores, EvaluationHistory):
+        return scores.last_score() < scores.first_score() - 0.15
     return scores[-1] < scores[0] - 0.15
 
-def stability_factor(history: List[EvaluationSnapshot]) -> float:
+def stability_factor(history: Scores) -> float:
     if len(history) < 3:
         return 1.0
 
-    scores = [h.score for h in history]
-    variance = statistics.pvariance(scores)
+    variance = _score_variance(history)
 
     if variance < 0.05:
         return 1.0
@@ -39,9 +48,9 @@ def apply_stability_penalty(skill_delta: float, flags: Set[str]) -> float:
     return skill_delta
 
 def validate_evaluation_invariants(slot) -> None:
-    if slot.evaluation_history:
-        latest = slot.evaluation_history[-1]
-        assert 0.0 <= latest.score <= 1.0, "Score out of bounds"
-        assert 0.0 <= latest.confidence <= 1.0, "Confidence out of bounds"
+    history = slot.evaluation_history
+    if history:
+        assert 0.0 <= history.last_score() <= 1.0, "Score out of bounds"
+        assert 0.0 <= history.last_confidence() <= 1.0, "Confidence out of bounds"
     
-    assert len(slot.evaluation_history) <= 10, "History too long"
+    assert len(history) <= MAX_EVALUATION_HISTORY, "History too long"
@@ -1,19 +1,18 @@
 from datetime import datetime, timezone
+from typing import List, Optional, Tuple
 
 from app.schemas.ai_evaluation import AIEvaluationResult
 from app.schemas.task_instance import TaskInstance, TaskStatus
 from app.schemas.task_submission import TaskSubmission
 from app.schemas.roadmap_state import RoadmapState
 from app.schemas.learning_state import UserLearningState
+from app.schemas.skill_update_telemetry import SkillUpdateTelemetry
+from app.schemas.skill_update_journal import SkillUpdateJournalEntry
 
 from app.ai.evaluations import evaluate_task
 from app.domain.remediation_planner import build_remediation_plan
 from app.domain.remediation_applier import apply_remediation_plan
 from app.domain.remediation_unlocker import unlock_dependent_slots_after_remediation
-from app.domain.roadmap_validator import (
-    validate_roadmap_state,
-    RoadmapValidationError,
-)
 from app.domain.skill_vector_updater import apply_skill_vector_update
 from app.domain.remediation_constants import MAX_REMEDIATION_ATTEMPTS
 from app.services.curriculum_service import CurriculumService
@@ -71,6 +70,38 @@ def evaluate_with_double_pass(
     return first, False
 
 
+def _get_slot_def(slot_id: str):
+    # In a real app, track_id should be on the RoadmapState. 
+    # For V2 transition, we assume 'dsa'.
+    curriculum = CurriculumService.get_curriculum("dsa")
+    try:
+        return curriculum.get_slot_definition(slot_id)
+    except ValueError:
+        return None
+
+
+def evaluate_submission(
+    *,
+    task_instance: TaskInstance,
+    task_template,
+    submission_payload: dict,
+) -> Tuple[AIEvaluationResult, bool]:
+    """
+    The LLM step of a submission: (evaluation, double_pass_used).
+    Everything after it is deterministic, so the result can be re-applied
+    to a reloaded roadmap without calling the provider again.
+    """
+    slot_def = _get_slot_def(task_instance.slot_id)
+    pass_threshold = slot_def.mastery.pass_score if slot_def else 0.6
+
+    return evaluate_with_double_pass(
+        task_instance=task_instance,
+        task_template=task_template,
+        submission_payload=submission_payload,
+        pass_score=pass_threshold
+    )
+
+
 async def evaluate_submission_and_update_roadmap(
     *,
     submission: TaskSubmission,
@@ -78,6 +109,9 @@ async def evaluate_submission_and_update_roadmap(
     learning_state: UserLearningState,
     task_instance: TaskInstance,
     task_template,
+    skill_updates: Optional[List[SkillUpdateTelemetry]] = None,
+    deferred_skill_updates: Optional[List[SkillUpdateJournalEntry]] = None,
+    evaluated: Optional[Tuple[AIEvaluationResult, bool]] = None,
 ) -> AIEvaluationResult:
     """
     Single source of truth for:
@@ -88,22 +122,17 @@ async def evaluate_submission_and_update_roadmap(
     - Skill vector updates
 
     Must always leave roadmap in a VALID state.
+    If `skill_updates` is given, the per-skill delta telemetry is appended.
+    If `deferred_skill_updates` is given, updates withheld while the
+    system is FROZEN are appended for the caller to journal.
+    If `evaluated` (from evaluate_submission) is given, it is used instead
+    of calling the evaluator; it is copied, never mutated.
     """
 
     # ================================
     # 0. Load Policy
     # ================================
-    # In a real app, track_id should be on the RoadmapState. 
-    # For V2 transition, we assume 'dsa'.
-    curriculum = CurriculumService.get_curriculum("dsa")
-    
-    slot_def = None
-    for phase in curriculum.phases:
-        for s in phase.slots:
-            if s.id == task_instance.slot_id:
-                slot_def = s
-                break
-        if slot_def: break
+    slot_def = _get_slot_def(task_instance.slot_id)
 
     # ================================
     # 1. Run evaluation
@@ -112,17 +141,22 @@ async def evaluate_submission_and_update_roadmap(
     slot = roadmap.get_slot(task_instance.slot_id)
     pass_threshold = slot_def.mastery.pass_score if slot_def else 0.6
 
-    evaluation, double_pass = evaluate_with_double_pass(
-        task_instance=task_instance,
-        task_template=task_template,
-        submission_payload=submission.payload,
-        pass_score=pass_threshold
-    )
+    if evaluated is None:
+        evaluated = evaluate_with_double_pass(
+            task_instance=task_instance,
+            task_template=task_template,
+            submission_payload=submission.payload,
+            pass_score=pass_threshold
+        )
+    evaluation, double_pass = evaluated
+    # Mutated below (penalties, policy override); keep the cached result reusable
+    evaluation = evaluation.model_copy(deep=True)
     
     # ================================
     # 1.5 Apply Integrity Penalties (V2.2)
     # ================================
     final_score = evaluation.score
+    evaluation.raw_score = evaluation.score
     
     # V2.4: Evaluation Consistency & Drift Control
     # -------------------------------------------------
@@ -134,11 +168,7 @@ async def evaluate_submission_and_update_roadmap(
         is_partial_credit=evaluation.partial_credit > 0,
         evaluated_at=datetime.now(timezone.utc)
     )
-    slot.evaluation_history.append(snapshot)
-    
-    # Trim history
-    if len(slot.evaluation_history) > 10:
-        slot.evaluation_history = slot.evaluation_history[-10:]
+    slot.evaluation_history.append(snapshot)  # ring buffer of the last 10
 
     # 2. Check Flags
     slot.flags.clear()
@@ -146,12 +176,12 @@ async def evaluate_submission_and_update_roadmap(
     if double_pass:
         slot.flags.add("double_pass_used")
 
-    scores = [e.score for e in slot.evaluation_history]
-    if has_score_drift(scores) or has_directional_drift(scores):
+    history = slot.evaluation_history
+    if has_score_drift(history) or has_directional_drift(history):
         slot.flags.add("score_drift_detected")
 
     # 3. Confidence Decay
-    effective_conf = evaluation.confidence * stability_factor(slot.evaluation_history)
+    effective_conf = evaluation.confidence * stability_factor(history)
     evaluation.confidence = round(effective_conf, 2)
     
     if evaluation.confidence < 0.4:
@@ -310,26 +340,23 @@ async def evaluate_submission_and_update_roadmap(
     # ================================
     _resolve_active_phase(roadmap)
 
-    # ================================
-    # A9: HARD INVARIANT VALIDATION
-    # ================================
-    try:
-        validate_roadmap_state(roadmap)
-    except RoadmapValidationError as e:
-        raise RuntimeError(
-            f"Roadmap invariant violated after evaluation cycle: {e}"
-        )
+    # A9: Invariant validation is left to the caller (submit_task), which
+    # runs a single incremental pass over everything this cycle touched.
 
     # ================================
     # A10: Skill vector update
     # ================================
-    apply_skill_vector_update(
+    updates = apply_skill_vector_update(
         learning_state=learning_state,
         evaluation=evaluation,
         task_instance=task_instance,
         task_template=task_template,
         flags=slot.flags,
+        evaluation_id=submission.id,
+        journal=deferred_skill_updates,
     )
+    if skill_updates is not None:
+        skill_updates.extend(updates)
 
     return evaluation
 
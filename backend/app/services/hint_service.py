@@ -0,0 +1,147 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.db.hint_catalog_repo import HintKey, get_hint_catalog
+from app.services.ai_services import AIService, HINT_PROMPT_VERSION
+
+logger = logging.getLogger(__name__)
+
+HINT_PLACEHOLDER = "Your hint is being prepared. Fetch it again in a moment."
+
+# Upper bounds (exclusive) of the skill-level buckets hints are shared across
+LEVEL_BUCKETS = (
+    (0.3, "beginner"),
+    (0.7, "intermediate"),
+    (float("inf"), "advanced"),
+)
+
+
+def level_bucket(level: float) -> str:
+    for upper, name in LEVEL_BUCKETS:
+        if level < upper:
+            return name
+    return LEVEL_BUCKETS[-1][1]
+
+
+class HintCache:
+    """
+    LRU cache with a per-entry TTL.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[HintKey, Tuple[float, str]]" = OrderedDict()
+
+    def get(self, key: HintKey) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, hint = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return hint
+
+    def set(self, key: HintKey, hint: str) -> None:
+        self._entries[key] = (time.monotonic(), hint)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class HintService:
+    """
+    Serves slot hints without ever waiting on the LLM. Lookup order is the
+    offline catalog (scripts/build_hint_catalog.py), then the runtime cache,
+    then a background generation. Hints are shared per (skill, difficulty,
+    skill-level bucket); concurrent misses on the same key trigger a single
+    generation.
+    """
+
+    def __init__(self, ai_service: Optional[AIService] = None, cache: Optional[HintCache] = None):
+        self._ai_service = ai_service
+        self.cache = cache or HintCache(
+            max_size=settings.HINT_CACHE_MAX_SIZE,
+            ttl_seconds=settings.HINT_CACHE_TTL_SECONDS,
+        )
+        self._pending: Dict[HintKey, asyncio.Task] = {}
+        self._catalog: Dict[HintKey, str] = {}
+
+    def load_catalog(self, catalog: Dict[HintKey, str]) -> None:
+        self._catalog = dict(catalog)
+
+    @property
+    def ai_service(self) -> AIService:
+        if self._ai_service is None:
+            self._ai_service = AIService()
+        return self._ai_service
+
+    @staticmethod
+    def hint_key(skill: str, difficulty: str, level: float) -> HintKey:
+        return (skill, difficulty, level_bucket(level))
+
+    def get_hint(self, skill: str, difficulty: str, level: float) -> Tuple[str, str]:
+        """
+        Returns (hint, hint_status). On a miss the placeholder is returned
+        with status "pending" and generation is scheduled.
+        """
+        key = self.hint_key(skill, difficulty, level)
+        hint = self._catalog.get(key)
+        if hint is not None:
+            return hint, "ready"
+
+        hint = self.cache.get(key)
+        if hint is not None:
+            return hint, "ready"
+
+        self.prefetch(key)
+        return HINT_PLACEHOLDER, "pending"
+
+    def prefetch(self, key: HintKey) -> None:
+        if key in self._pending:
+            return
+
+        task = asyncio.create_task(self._generate(key))
+        self._pending[key] = task
+        task.add_done_callback(lambda _: self._pending.pop(key, None))
+
+    async def _generate(self, key: HintKey) -> None:
+        skill, difficulty, bucket = key
+        try:
+            hint = await self.ai_service.generate_skill_hint(
+                skill=skill,
+                difficulty=difficulty,
+                user_level=bucket,
+            )
+        except Exception as e:
+            # Leave the key uncached; the next request retries
+            logger.error(f"Hint generation failed for {key}: {e}")
+            return
+
+        self.cache.set(key, hint)
+
+
+hint_service = HintService()
+
+
+async def load_hint_catalog(db) -> int:
+    """
+    Loads the precomputed hints for the current prompt version into memory.
+    """
+    catalog = await get_hint_catalog(db, HINT_PROMPT_VERSION)
+    hint_service.load_catalog(catalog)
+    return len(catalog)
@@ -0,0 +1,35 @@
+import hashlib
+import json
+from typing import Any, Optional
+
+from fastapi import HTTPException
+
+from app.db.idempotency_repo import get_idempotency_record
+
+
+def request_fingerprint(**params: Any) -> str:
+    """Stable hash of the request parameters an idempotency key is bound to."""
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+async def get_stored_response(
+    db,
+    scope: str,
+    user_id: str,
+    key: Optional[str],
+    request_hash: str,
+) -> Optional[Any]:
+    """
+    Response stored for a retried request, or None if the key is unset or
+    unseen. Reusing a key for a different request is a client error.
+    """
+    if not key:
+        return None
+
+    record = await get_idempotency_record(db, scope, user_id, key)
+    if record is None:
+        return None
+    if record["request_hash"] != request_hash:
+        raise HTTPException(422, "Idempotency-Key was already used for a different request")
+    return record["response"]
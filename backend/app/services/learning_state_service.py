@@ -1,8 +1,14 @@
-from typing import Optional
-from app.db import learning_state_repo, skill_history_repo
+from typing import List, Optional
+from app.db import learning_state_repo, skill_history_repo, decision_context_repo
 from app.db.task_submission_repo import TaskSubmissionRepo
 from app.schemas.learning_state import UserLearningState
-from app.domain.adaptive_control import build_decision_context, DecisionContext
+from app.domain.adaptive_control import (
+    build_decision_context,
+    build_decision_context_from_snapshot,
+    build_decision_snapshot,
+    update_decision_snapshot,
+    DecisionContext,
+)
 from fastapi import HTTPException, status
 from datetime import datetime
 
@@ -23,7 +29,12 @@ async def update_learning_state(db, user_id: str, update_data: dict):
     return await get_learning_state(db, user_id)
 
 async def get_decision_context(db, user_id: str, track_id: str) -> DecisionContext:
-    state = await get_learning_state(db, user_id)
+    snapshot = await decision_context_repo.get_decision_snapshot(db, user_id, track_id)
+    if snapshot is not None:
+        return build_decision_context_from_snapshot(snapshot)
+
+    # No snapshot yet (user has not submitted since snapshots were introduced)
+    skill_columns = await learning_state_repo.get_skill_vector_columns(db, user_id)
     history = await skill_history_repo.get_skill_history_for_user(db, user_id)
     
     submission_repo = TaskSubmissionRepo(db)
@@ -32,7 +43,56 @@ async def get_decision_context(db, user_id: str, track_id: str) -> DecisionConte
     return build_decision_context(
         user_id=user_id,
         track_id=track_id,
-        skill_vector=state.skill_vector,
+        skill_vector=skill_columns,
         history=history,
         submissions=submissions
     )
+
+
+async def record_decision_snapshot(
+    db,
+    user_id: str,
+    track_id: str,
+    skill_vector,
+    task_instance_id: str,
+    session=None
+):
+    """
+    Folds an evaluated submission into the user's DecisionContext snapshot.
+    Meant to run inside the same transaction as apply_skill_vector_updates.
+    """
+    await record_decision_snapshot_events(
+        db, user_id, track_id, skill_vector, [task_instance_id], session=session
+    )
+
+
+async def record_decision_snapshot_events(
+    db,
+    user_id: str,
+    track_id: str,
+    skill_vector,
+    task_instance_ids: List[str],
+    session=None
+):
+    """
+    record_decision_snapshot for several task instances (oldest first)
+    whose skill updates are all reflected in `skill_vector`, with one
+    snapshot read and write.
+    """
+    snapshot = await decision_context_repo.get_decision_snapshot(db, user_id, track_id, session=session)
+    if snapshot is None:
+        # Seed from the submissions that precede these ones
+        submissions = await TaskSubmissionRepo(db).get_submissions_for_user(
+            user_id, limit=5, session=session
+        )
+        submissions = [s for s in submissions if s.task_instance_id not in task_instance_ids]
+        snapshot = build_decision_snapshot(
+            user_id=user_id,
+            track_id=track_id,
+            skill_vector=skill_vector,
+            submissions=submissions
+        )
+
+    for task_instance_id in task_instance_ids:
+        update_decision_snapshot(snapshot, skill_vector, task_instance_id)
+    await decision_context_repo.save_decision_snapshot(db, snapshot, session=session)
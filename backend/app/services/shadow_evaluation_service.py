@@ -0,0 +1,131 @@
+import logging
+import zlib
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+from app.ai.evaluate_coding import PROMPTS as CODING_PROMPTS, PROMPT_VERSION as CODING_PROMPT_VERSION
+from app.ai.evaluate_explanation import PROMPTS as EXPLANATION_PROMPTS, PROMPT_VERSION as EXPLANATION_PROMPT_VERSION
+from app.ai.evaluations import evaluate_task
+from app.ai.provider_limiter import ProviderLimiter, provider_limiter
+from app.core.config import settings
+from app.db.shadow_evaluation_repo import save_shadow_evaluation
+from app.schemas.ai_evaluation import AIEvaluationResult
+from app.schemas.task_instance import TaskInstance
+
+logger = logging.getLogger(__name__)
+
+# Prompt registries of the AI-graded task types; MCQs are never shadowed
+PROMPT_REGISTRIES = {
+    "coding": CODING_PROMPTS,
+    "explanation": EXPLANATION_PROMPTS,
+}
+
+LIVE_PROMPT_VERSIONS = {
+    "coding": CODING_PROMPT_VERSION,
+    "explanation": EXPLANATION_PROMPT_VERSION,
+}
+
+
+def shadow_candidate(question_type: str) -> Optional[Tuple[str, str]]:
+    """
+    (prompt_version, model) to shadow-evaluate `question_type` with, or
+    None when no candidate differing from the live configuration is set.
+    """
+    registry = PROMPT_REGISTRIES.get(question_type)
+    if registry is None:
+        return None
+
+    prompt_version = settings.SHADOW_PROMPT_VERSION or LIVE_PROMPT_VERSIONS[question_type]
+    model = settings.SHADOW_MODEL or settings.GROQ_MODEL
+
+    if prompt_version not in registry:
+        return None
+    if prompt_version == LIVE_PROMPT_VERSIONS[question_type] and model == settings.GROQ_MODEL:
+        return None
+    return prompt_version, model
+
+
+def should_shadow(submission_id: str, sample_rate: Optional[float] = None) -> bool:
+    """
+    Deterministic sample: a submission is either always or never in the
+    shadow set, so retries do not skew the comparison. `sample_rate`
+    defaults to the current SHADOW_EVAL_SAMPLE_RATE.
+    """
+    if sample_rate is None:
+        sample_rate = settings.SHADOW_EVAL_SAMPLE_RATE
+    if sample_rate <= 0.0:
+        return False
+    return zlib.crc32(submission_id.encode()) / 0xFFFFFFFF < sample_rate
+
+
+async def run_shadow_evaluation(
+    db,
+    *,
+    submission_id: str,
+    user_id: str,
+    task_instance: TaskInstance,
+    task_template,
+    payload: dict,
+    live: AIEvaluationResult,
+    limiter: ProviderLimiter = provider_limiter,
+) -> Optional[dict]:
+    """
+    Re-evaluates a live submission with the candidate prompt/model and
+    stores the paired result. Runs after the response is sent and never
+    touches roadmap or learning state; failures are logged and dropped.
+    """
+    candidate = shadow_candidate(task_template.question_type)
+    if candidate is None:
+        return None
+    prompt_version, model = candidate
+
+    try:
+        shadow = await limiter.run(
+            evaluate_task,
+            task_instance=task_instance,
+            task_template=task_template,
+            submission_payload=payload,
+            prompt_version=prompt_version,
+            model=model,
+            timeout=settings.GOLDEN_TASK_TIMEOUT_SECONDS,
+        )
+    except Exception as e:
+        # Includes unparseable candidate output: the evaluators raise rather
+        # than return a placeholder score, so no such pair is ever stored
+        logger.warning(f"Shadow evaluation of submission {submission_id} failed: {e!r}")
+        return None
+
+    # Compare against the evaluator's own score, before drift/stability penalties
+    live_score = live.raw_score if live.raw_score is not None else live.score
+    doc = {
+        "submission_id": submission_id,
+        "user_id": user_id,
+        "task_instance_id": task_instance.task_instance_id,
+        "skill": task_template.skill,
+        "difficulty": task_instance.difficulty,
+        "question_type": task_template.question_type,
+        "live": {
+            "score": live_score,
+            "passed": live.passed,
+            "confidence": live.confidence,
+            "prompt_version": live.prompt_version,
+            "model_name": live.model_name,
+        },
+        "shadow": {
+            "score": shadow.score,
+            "passed": shadow.passed,
+            "confidence": shadow.confidence,
+            "prompt_version": shadow.prompt_version,
+            "model_name": shadow.model_name,
+        },
+        "delta": shadow.score - live_score,
+        "passed_agrees": shadow.passed == live.passed,
+        "created_at": datetime.now(timezone.utc),
+    }
+
+    try:
+        await save_shadow_evaluation(db, doc)
+    except Exception as e:
+        logger.error(f"Saving shadow evaluation of submission {submission_id} failed: {e}")
+        return None
+    return doc
@@ -0,0 +1,106 @@
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from app.core.config import settings
+from app.core.system_status import system_status
+from app.db.learning_state_repo import get_user_learning_states, bulk_apply_skill_vector_updates
+from app.db.skill_update_journal_repo import claim_journal_batch, delete_journal_entries
+from app.db.transactions import run_transaction
+from app.domain.skill_vector_updater import apply_raw_skill_deltas
+from app.schemas.skill_update_journal import SkillUpdateJournalEntry
+from app.services.learning_state_service import record_decision_snapshot_events
+from app.services.telemetry_service import telemetry_writer
+
+logger = logging.getLogger(__name__)
+
+
+async def replay_skill_journal(
+    db,
+    batch_size: int = settings.SKILL_JOURNAL_REPLAY_BATCH_SIZE,
+    claim_timeout_seconds: float = settings.SKILL_JOURNAL_CLAIM_TIMEOUT_SECONDS,
+) -> dict:
+    """
+    Re-applies skill updates journaled while the system was FROZEN, under
+    the policy in force now (dampening, stability, prompt compatibility).
+
+    Entries are claimed in insertion order, one batch at a time. Each
+    batch runs in one transaction: it loads the affected learning states
+    in one query, folds every user's entries in order, writes back only
+    the journaled skills in one bulk_write, folds the entries into the
+    DecisionContext snapshots and deletes them from the journal. A live
+    submission committing in between makes the transaction conflict and
+    retry from a fresh read. Stops as soon as the system freezes again.
+    """
+    replay_id = uuid.uuid4().hex
+    replayed = 0
+    users = 0
+
+    while not system_status.is_frozen:
+        stale_before = datetime.now(timezone.utc) - timedelta(seconds=claim_timeout_seconds)
+        docs = await claim_journal_batch(db, replay_id, batch_size, stale_before)
+        if not docs:
+            break
+
+        by_user: Dict[str, List[SkillUpdateJournalEntry]] = {}
+        for doc in docs:
+            entry = SkillUpdateJournalEntry(**doc)
+            by_user.setdefault(entry.user_id, []).append(entry)
+
+        async def apply_batch(session):
+            states = await get_user_learning_states(db, list(by_user), session=session)
+            updates = {}
+            telemetry = []
+            for user_id, entries in by_user.items():
+                learning_state = states.get(user_id)
+                if learning_state is None:
+                    logger.warning(f"Dropping {len(entries)} journaled skill updates of unknown user {user_id}")
+                    continue
+
+                touched = set()
+                for entry in entries:
+                    telemetry.extend(apply_raw_skill_deltas(
+                        learning_state=learning_state,
+                        raw_deltas=entry.raw_deltas,
+                        flags=set(entry.flags),
+                        score=entry.score,
+                        confidence=entry.confidence,
+                        prompt_version=entry.prompt_version,
+                        event_id=entry.task_instance_id,
+                        evaluation_id=entry.evaluation_id,
+                    ))
+                    touched.update(entry.raw_deltas)
+                updates[user_id] = {
+                    skill: learning_state.skill_vector[skill]
+                    for skill in touched
+                    if skill in learning_state.skill_vector
+                }
+
+                await record_decision_snapshot_events(
+                    db,
+                    user_id,
+                    "dsa",
+                    learning_state.skill_vector,
+                    [entry.task_instance_id for entry in entries],
+                    session=session
+                )
+
+            await bulk_apply_skill_vector_updates(db, updates, session=session)
+            await delete_journal_entries(db, [doc["_id"] for doc in docs], session=session)
+            return updates, telemetry
+
+        try:
+            updates, telemetry = await run_transaction(apply_batch)
+        except Exception as e:
+            # Claimed entries are picked up again once the claim goes stale
+            logger.error(f"Skill journal replay {replay_id} failed after {replayed} entries: {e}")
+            break
+
+        telemetry_writer.record_skill_updates(telemetry)
+        replayed += len(docs)
+        users += len(updates)
+
+    if replayed:
+        logger.info(f"Skill journal replay {replay_id}: {replayed} updates for {users} users")
+    return {"replay_id": replay_id, "replayed": replayed, "users": users}
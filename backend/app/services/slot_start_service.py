@@ -52,6 +52,6 @@ def start_slot(
     slot.status = "in_progress"
     slot.question_type = task_template.question_type
     slot.active_task_instance_id = task_instance.task_instance_id
-    roadmap.task_instances.append(task_instance)
+    roadmap.add_task_instance(task_instance)
     
     return task_instance
@@ -1,6 +1,6 @@
 import yaml
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Optional
 from app.schemas.task_template import TaskTemplate
 from app.core.config import settings
 
@@ -9,23 +9,15 @@ ROOT_DIR = Path(__file__).resolve().parent.parent.parent
 TASK_DIR = ROOT_DIR / settings.CURRICULUM_TASKS_ROOT
 
 class TaskFactory:
-    _cache: Dict[str, List[TaskTemplate]] = {}
-
-    @classmethod
-    def load_tasks(cls, skill: str) -> List[TaskTemplate]:
-        if skill in cls._cache:
-            return cls._cache[skill]
-
-        file_path = TASK_DIR / f"{skill}.yaml"
-        return cls.load_tasks_from_file(file_path, skill)
+    """
+    Stateless YAML parser for task template files.
+    Templates are cached and looked up by id in task_template_loader, which is
+    the single registry for all callers.
+    """
 
     @classmethod
     def load_tasks_from_file(cls, file_path: Path, skill: Optional[str] = None) -> List[TaskTemplate]:
         skill = skill or file_path.stem
-        
-        if skill in cls._cache:
-            # We might want to reload if file changed, but for now cache is simple
-            return cls._cache[skill]
 
         if not file_path.exists():
             return []
@@ -59,32 +51,12 @@ class TaskFactory:
                         t_data["invariant_targets"] = mastery_signals
                         
                     templates.append(TaskTemplate(**t_data))
-                
-            cls._cache[skill] = templates
+
             return templates
         except Exception as e:
             print(f"Error loading tasks for skill {skill}: {e}")
             return []
 
-    @classmethod
-    def get_task(cls, skill: str, difficulty: str, variant: str = "standard") -> Optional[TaskTemplate]:
-        templates = cls.load_tasks(skill)
-        
-        # Simple matching strategy for now
-        candidates = [
-            t for t in templates 
-            if t.difficulty == difficulty and t.variant == variant
-        ]
-        
-        if not candidates:
-            # Fallback: if remediation requested but not found, try standard
-            if variant == "remediation":
-                return cls.get_task(skill, difficulty, "standard")
-            return None
-            
-        # In V2, we could rotate or pick based on user history here
-        return candidates[0]
-
     @classmethod
     def get_variant_for_strategy(cls, strategy: str) -> str:
         """
@@ -97,7 +69,3 @@ class TaskFactory:
             "easier_task": "easier"
         }
         return mapping.get(strategy, "standard")
-    
-    @classmethod
-    def clear_cache(cls):
-        cls._cache = {}
@@ -0,0 +1,202 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.db.telemetry_repo import insert_telemetry, apply_score_rollups, rollup_hour, RollupKey
+from app.domain.score_distribution import ScoreDistribution
+from app.schemas.ai_evaluation import AIEvaluationResult
+from app.schemas.decision_trace import DecisionTrace
+from app.schemas.evaluation_telemetry import EvaluationTelemetry
+from app.schemas.roadmap_state import TaskSlot
+from app.schemas.skill_update_telemetry import SkillUpdateTelemetry
+from app.schemas.task_instance import TaskInstance
+from app.services.evaluation_consistency import has_score_drift, has_directional_drift
+
+logger = logging.getLogger(__name__)
+
+
+class TelemetryWriter:
+    """
+    Buffers telemetry records in memory and writes them in batches with
+    insert_many, off the request path. A flush runs when `batch_size`
+    records are pending or every `flush_interval_seconds`. Telemetry is
+    best-effort: a failed flush is logged and dropped, and records beyond
+    `max_buffer` are dropped while the database is unreachable.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = settings.TELEMETRY_BATCH_SIZE,
+        flush_interval_seconds: float = settings.TELEMETRY_FLUSH_INTERVAL_SECONDS,
+        max_buffer: int = settings.TELEMETRY_MAX_BUFFER,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_buffer = max_buffer
+        self.dropped = 0
+
+        self._db = None
+        self._buffers: Dict[str, List[dict]] = {}
+        self._pending = 0
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._timer_task: Optional[asyncio.Task] = None
+
+    # ---------- Lifecycle ----------
+
+    def start(self, db) -> None:
+        self._db = db
+        if self._timer_task is None:
+            self._timer_task = asyncio.create_task(self._run_timer())
+
+    async def stop(self) -> None:
+        if self._timer_task is not None:
+            self._timer_task.cancel()
+            self._timer_task = None
+        await self.flush()
+
+    async def _run_timer(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            await self.flush()
+
+    # ---------- Recording (never blocks) ----------
+
+    def record(self, collection: str, record: BaseModel) -> None:
+        if self._pending >= self.max_buffer:
+            self.dropped += 1
+            return
+
+        self._buffers.setdefault(collection, []).append(record.model_dump())
+        self._pending += 1
+
+        if self._pending >= self.batch_size and self._db is not None:
+            self._schedule_flush()
+
+    def record_evaluation(self, telemetry: EvaluationTelemetry) -> None:
+        self.record("evaluation_telemetry", telemetry)
+
+    def record_skill_updates(self, updates: List[SkillUpdateTelemetry]) -> None:
+        for update in updates:
+            self.record("skill_update_telemetry", update)
+
+    def record_decision_trace(self, trace: DecisionTrace) -> None:
+        self.record("decision_traces", trace)
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self.flush())
+
+    # ---------- Flushing ----------
+
+    async def flush(self) -> None:
+        if self._db is None:
+            return
+
+        async with self._flush_lock:
+            buffers, self._buffers, self._pending = self._buffers, {}, 0
+
+            for collection, docs in buffers.items():
+                try:
+                    await insert_telemetry(self._db, collection, docs)
+                except Exception as e:
+                    self.dropped += len(docs)
+                    logger.error(f"Telemetry flush to {collection} failed ({len(docs)} records dropped): {e}")
+
+            try:
+                await apply_score_rollups(self._db, score_rollups(buffers.get("evaluation_telemetry", [])))
+            except Exception as e:
+                logger.error(f"Score rollup update failed: {e}")
+
+
+def score_rollups(docs: List[dict]) -> Dict[RollupKey, ScoreDistribution]:
+    """
+    Per-(hour, skill, difficulty, prompt_version) distributions of a batch
+    of evaluation telemetry documents.
+    """
+    rollups: Dict[RollupKey, ScoreDistribution] = {}
+    for doc in docs:
+        key = (rollup_hour(doc["created_at"]), doc.get("skill"), doc.get("difficulty"), doc["prompt_version"])
+        rollups.setdefault(key, ScoreDistribution()).add(doc["score"], doc["confidence"])
+    return rollups
+
+
+# ---------- Record builders ----------
+
+def build_evaluation_telemetry(
+    *,
+    evaluation_id: str,
+    user_id: str,
+    slot: TaskSlot,
+    task_instance: TaskInstance,
+    evaluation: AIEvaluationResult,
+    created_at: datetime,
+) -> EvaluationTelemetry:
+    history = slot.evaluation_history
+    return EvaluationTelemetry(
+        evaluation_id=evaluation_id,
+        user_id=user_id,
+        slot_id=slot.slot_id,
+        task_instance_id=task_instance.task_instance_id,
+        skill=task_instance.skill,
+        difficulty=task_instance.difficulty,
+        score=evaluation.score,
+        confidence=evaluation.confidence,
+        is_partial_credit=evaluation.partial_credit > 0,
+        model_name=evaluation.model_name,
+        model_version=evaluation.model_version,
+        prompt_version=evaluation.prompt_version,
+        temperature=evaluation.temperature,
+        double_pass_used="double_pass_used" in slot.flags,
+        score_drift_detected=has_score_drift(history),
+        directional_drift_detected=has_directional_drift(history),
+        low_confidence="low_confidence_evaluation" in slot.flags,
+        created_at=created_at,
+    )
+
+
+def build_decision_trace(
+    *,
+    decision_id: str,
+    user_id: str,
+    slot: TaskSlot,
+    evaluation: AIEvaluationResult,
+    created_at: datetime,
+) -> DecisionTrace:
+    rules = ["mastery_pass" if evaluation.passed else "mastery_fail"]
+
+    if slot.status == "failed":
+        outcome = "LOCKED"
+        rules.append("remediation_exhausted")
+    elif evaluation.passed:
+        outcome = "PASS"
+    elif slot.status == "remediation_required":
+        outcome = "REMEDIATION"
+    else:
+        outcome = "FAIL"
+
+    return DecisionTrace(
+        decision_id=decision_id,
+        user_id=user_id,
+        slot_id=slot.slot_id,
+        inputs={
+            "score": evaluation.score,
+            "confidence": evaluation.confidence,
+            "partial_credit": evaluation.partial_credit,
+            "history_scores": list(slot.evaluation_history.scores),
+            "remediation_step": slot.current_remediation_step,
+        },
+        rules_triggered=rules,
+        flags_set=sorted(slot.flags),
+        final_outcome=outcome,
+        user_message=slot.user_message or "",
+        internal_reasoning=evaluation.explanation or evaluation.feedback,
+        created_at=created_at,
+    )
+
+
+telemetry_writer = TelemetryWriter()
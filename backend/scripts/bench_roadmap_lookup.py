@@ -0,0 +1,105 @@
+import random
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add the parent directory to sys.path to allow importing from 'app'
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from app.schemas.roadmap_state import RoadmapState, PhaseState, TaskSlot
+from app.schemas.task_instance import TaskInstance
+
+
+def legacy_get_slot(roadmap, slot_id):
+    for phase in roadmap.phases:
+        for slot in phase.slots:
+            if slot.slot_id == slot_id:
+                return slot
+    raise ValueError(slot_id)
+
+
+def legacy_get_task_instance(roadmap, task_instance_id):
+    for ti in roadmap.task_instances:
+        if ti.task_instance_id == task_instance_id:
+            return ti
+    raise ValueError(task_instance_id)
+
+
+def large_roadmap(phases: int, slots_per_phase: int, instances: int) -> RoadmapState:
+    now = datetime.now(timezone.utc)
+    roadmap = RoadmapState(
+        user_id="bench",
+        goal="placement",
+        version=1,
+        status="active",
+        is_active=True,
+        current_phase="phase_0",
+        phases=[
+            PhaseState(
+                phase_id=f"phase_{p}",
+                name=f"Phase {p}",
+                phase_status="active" if p == 0 else "locked",
+                slots=[
+                    TaskSlot(slot_id=f"slot_{p}_{s}", skill="arrays", difficulty="easy", status="locked")
+                    for s in range(slots_per_phase)
+                ],
+            )
+            for p in range(phases)
+        ],
+        task_instances=[],
+        confidence_threshold=0.7,
+        generated_at=now,
+        last_evaluated_at=now,
+    )
+    for i in range(instances):
+        roadmap.add_task_instance(TaskInstance(
+            task_instance_id=f"inst_{i}",
+            skill="arrays",
+            slot_id=f"slot_0_{i % slots_per_phase}",
+            base_template_id="t",
+            task_template_id="t",
+            difficulty="easy",
+            started_at=now,
+        ))
+    return roadmap
+
+
+def main():
+    # Roughly the lookups of one submit_task: the slot, the instance, every
+    # unlock target and one per remediation action.
+    lookups_per_request = 20
+    rng = random.Random(1)
+
+    for phases, slots, instances in ((8, 10, 200), (40, 25, 2000), (100, 50, 10000)):
+        roadmap = large_roadmap(phases, slots, instances)
+        slot_ids = [f"slot_{rng.randrange(phases)}_{rng.randrange(slots)}" for _ in range(lookups_per_request)]
+        instance_ids = [f"inst_{rng.randrange(instances)}" for _ in range(lookups_per_request)]
+
+        for sid, iid in zip(slot_ids, instance_ids):
+            assert roadmap.get_slot(sid) is legacy_get_slot(roadmap, sid)
+            assert roadmap.get_task_instance(iid) is legacy_get_task_instance(roadmap, iid)
+
+        def legacy():
+            for sid, iid in zip(slot_ids, instance_ids):
+                legacy_get_slot(roadmap, sid)
+                legacy_get_task_instance(roadmap, iid)
+
+        def indexed():
+            for sid, iid in zip(slot_ids, instance_ids):
+                roadmap.get_slot(sid)
+                roadmap.get_task_instance(iid)
+
+        runs = 200
+        legacy_s = timeit.timeit(legacy, number=runs) / runs
+        indexed_s = timeit.timeit(indexed, number=runs) / runs
+
+        print(
+            f"{phases * slots:>6} slots {instances:>6} instances  "
+            f"legacy {legacy_s * 1e6:9.1f} us/request  indexed {indexed_s * 1e6:7.1f} us/request  "
+            f"speedup {legacy_s / indexed_s:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
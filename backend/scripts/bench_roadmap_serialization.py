@@ -0,0 +1,107 @@
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add the parent directory to sys.path to allow importing from 'app'
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from app.db.user_roadmap_repo import UserRoadmapRepo
+from app.domain.evaluation_history import EvaluationHistory, EvaluationSnapshot
+from app.schemas.roadmap_state import RoadmapState, PhaseState, TaskSlot
+from app.schemas.task_instance import TaskInstance, TaskStatus
+from app.services.roadmap_service import generate_v1_roadmap
+
+
+def realistic_document(instances_per_slot: int, history_per_slot: int) -> dict:
+    """
+    A persisted roadmap document after a user has worked through every slot.
+    """
+    now = datetime.now(timezone.utc)
+    roadmap = generate_v1_roadmap(user_id="bench", goal="placement")
+
+    for phase in roadmap.phases:
+        for slot in phase.slots:
+            slot.flags.update({"fast_track", "edge_case"})
+            slot.evaluation_history = EvaluationHistory.from_snapshots(
+                EvaluationSnapshot(
+                    submission_id=f"{slot.slot_id}_{i}",
+                    score=0.5,
+                    confidence=0.8,
+                    is_partial_credit=False,
+                    evaluated_at=now,
+                )
+                for i in range(history_per_slot)
+            )
+            for i in range(instances_per_slot):
+                roadmap.add_task_instance(TaskInstance(
+                    task_instance_id=f"{slot.slot_id}_{i}",
+                    skill=slot.skill,
+                    slot_id=slot.slot_id,
+                    base_template_id="t",
+                    task_template_id="t",
+                    difficulty=slot.difficulty,
+                    status=TaskStatus.COMPLETED,
+                    started_at=now,
+                    completed_at=now,
+                    evaluation_signals={"score": 0.5},
+                ))
+
+    repo = UserRoadmapRepo.__new__(UserRoadmapRepo)
+    return repo._to_persistence(roadmap, is_new=False)
+
+
+def construct_round_trip(doc: dict) -> dict:
+    """
+    Alternative that was measured: recursive model_construct (no validation).
+    Under pydantic v2 this runs in Python and is slower than pydantic-core
+    validation, so the repo keeps validating on load.
+    """
+    data = dict(doc)
+    data["phases"] = [
+        PhaseState.model_construct(**{
+            **phase,
+            "slots": [
+                TaskSlot.model_construct(**{
+                    **slot,
+                    "flags": set(slot["flags"]),
+                    "evaluation_history": EvaluationHistory.from_document(slot["evaluation_history"]),
+                })
+                for slot in phase["slots"]
+            ],
+        })
+        for phase in data["phases"]
+    ]
+    data["task_instances"] = [
+        TaskInstance.model_construct(**{**ti, "status": TaskStatus(ti["status"])})
+        for ti in data["task_instances"]
+    ]
+    roadmap = RoadmapState.model_construct(**data)
+    return roadmap.model_dump()
+
+
+def repo_round_trip(doc: dict) -> dict:
+    """
+    What every roadmap request pays: UserRoadmapRepo load + persistence dump.
+    """
+    repo = UserRoadmapRepo.__new__(UserRoadmapRepo)
+    return repo._to_persistence(UserRoadmapRepo._to_domain(doc), is_new=False)
+
+
+def main():
+    for instances, history in ((1, 1), (3, 5), (10, 20)):
+        doc = realistic_document(instances, history)
+        assert repo_round_trip(doc)["phases"] == construct_round_trip(doc)["phases"]
+
+        runs = 50
+        repo_s = timeit.timeit(lambda: repo_round_trip(doc), number=runs) / runs
+        construct_s = timeit.timeit(lambda: construct_round_trip(doc), number=runs) / runs
+
+        print(
+            f"{len(doc['task_instances']):>5} instances, {history:>2} history/slot  "
+            f"load+dump {1 / repo_s:6.0f} ops/s  (model_construct alternative {1 / construct_s:6.0f} ops/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add the parent directory to sys.path to allow importing from 'app'
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from app.db.base import get_database
+from app.db.hint_catalog_repo import get_hint_catalog, upsert_hint
+from app.services.ai_services import AIService, HINT_PROMPT_VERSION
+from app.services.curriculum_service import CurriculumService
+from app.services.hint_service import LEVEL_BUCKETS
+
+
+async def build_hint_catalog(track_id: str, force: bool, concurrency: int):
+    """
+    Generates a hint for every (skill, difficulty) used by the curriculum's
+    slots across every skill-level bucket, stored under the current
+    HINT_PROMPT_VERSION. Existing entries are kept unless --force is given,
+    so re-running after a partial failure only fills the gaps.
+    """
+    db = get_database()
+    curriculum = CurriculumService.get_curriculum(track_id)
+
+    keys = sorted({
+        (slot_def.skill, slot_def.difficulty, bucket)
+        for phase_def in curriculum.phases
+        for slot_def in phase_def.slots
+        for _, bucket in LEVEL_BUCKETS
+    })
+
+    existing = {} if force else await get_hint_catalog(db, HINT_PROMPT_VERSION)
+    missing = [key for key in keys if key not in existing]
+    print(f"{len(keys)} hint keys for '{track_id}' (prompt {HINT_PROMPT_VERSION}); {len(missing)} to generate")
+
+    ai_service = AIService()
+    semaphore = asyncio.Semaphore(concurrency)
+    failures = 0
+
+    async def generate(key):
+        nonlocal failures
+        skill, difficulty, bucket = key
+        async with semaphore:
+            try:
+                hint = await ai_service.generate_skill_hint(
+                    skill=skill,
+                    difficulty=difficulty,
+                    user_level=bucket,
+                )
+            except Exception as e:
+                failures += 1
+                print(f"Failed {key}: {e}")
+                return
+        await upsert_hint(db, HINT_PROMPT_VERSION, key, hint)
+        print(f"Stored {key}")
+
+    await asyncio.gather(*(generate(key) for key in missing))
+    print(f"Finished. Generated {len(missing) - failures}, failed {failures}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute slot hints into the hint_catalog collection.")
+    parser.add_argument("--track", default="dsa")
+    parser.add_argument("--force", action="store_true", help="Regenerate hints that already exist")
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    asyncio.run(build_hint_catalog(args.track, args.force, args.concurrency))
@@ -0,0 +1,44 @@
+import sys
+from pathlib import Path
+
+# Add the parent directory to sys.path to allow importing from 'app'
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from app.core.config import settings
+from app.domain.registry_snapshot import write_snapshot
+from app.services.curriculum_service import CurriculumService
+from app.services.task_factory import TaskFactory, TASK_DIR, ROOT_DIR
+
+
+def build_template_registry(output: Path) -> None:
+    """
+    Compiles every curriculum and TaskTemplate into the registry snapshot.
+    Run once per deploy (before workers start) so no worker has to parse or
+    validate the YAML sources itself.
+    """
+    templates = []
+    for file_path in sorted(TASK_DIR.rglob("*.yaml")):
+        templates.extend(TaskFactory.load_tasks_from_file(file_path))
+
+    curricula = {
+        track_id: CurriculumService.get_curriculum(track_id)
+        for track_id in CurriculumService.available_tracks()
+    }
+
+    write_snapshot(output, templates, curricula)
+    print(f"Wrote {len(templates)} templates and {len(curricula)} curricula to {output}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        target = Path(sys.argv[1])
+    elif settings.TEMPLATE_REGISTRY_SNAPSHOT:
+        target = Path(settings.TEMPLATE_REGISTRY_SNAPSHOT)
+    else:
+        print("Usage: build_template_registry.py <output path> (or set TEMPLATE_REGISTRY_SNAPSHOT)")
+        sys.exit(1)
+
+    if not target.is_absolute():
+        target = ROOT_DIR / target
+
+    build_template_registry(target)
@@ -0,0 +1,52 @@
+import asyncio
+import sys
+from pathlib import Path
+
+# Add the parent directory to sys.path to allow importing from 'app'
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from app.db.base import get_database
+
+
+async def dedupe_task_submissions(apply: bool = False):
+    """
+    Removes duplicate task submissions so the unique
+    (user_id, slot_id, task_instance_id) index can be built. The earliest
+    submission of each task instance is kept, as the pre-read check that
+    the index replaces would have rejected the later ones.
+
+    Dry run unless called with --apply.
+    """
+    db = get_database()
+    collection = db.task_submissions
+
+    pipeline = [
+        {"$sort": {"created_at": 1, "_id": 1}},
+        {"$group": {
+            "_id": {
+                "user_id": "$user_id",
+                "slot_id": "$slot_id",
+                "task_instance_id": "$task_instance_id",
+            },
+            "ids": {"$push": "$_id"},
+            "count": {"$sum": 1},
+        }},
+        {"$match": {"count": {"$gt": 1}}},
+    ]
+
+    groups = 0
+    removed = 0
+    async for group in collection.aggregate(pipeline, allowDiskUse=True):
+        groups += 1
+        duplicates = group["ids"][1:]
+        removed += len(duplicates)
+        print(f"{group['_id']}: keeping {group['ids'][0]}, removing {len(duplicates)}")
+        if apply:
+            await collection.delete_many({"_id": {"$in": duplicates}})
+
+    action = "Removed" if apply else "Would remove (pass --apply)"
+    print(f"Finished. {action} {removed} duplicate submissions across {groups} task instances.")
+
+
+if __name__ == "__main__":
+    asyncio.run(dedupe_task_submissions(apply="--apply" in sys.argv))
@@ -0,0 +1,149 @@
+import unittest
+from unittest.mock import patch
+
+from app.domain import adaptive_market
+from app.domain.adaptive_control import DecisionContext, InvariantScore
+from app.domain.adaptive_market import AdaptiveMarket
+from app.domain.probe_features import ProbeFeatures
+from app.schemas.task_template import TaskTemplate
+
+
+def _template(template_id, skill, role="diagnostic", cost=1.0, targets=(), slot_id=None):
+    return TaskTemplate(
+        id=template_id,
+        skill=skill,
+        type="mcq",
+        role=role,
+        probe_cost=cost,
+        invariant_targets=list(targets),
+        slot_id=slot_id,
+        prompt="p",
+    )
+
+
+def _invariant(skill, pressure):
+    return InvariantScore(
+        invariant_id=skill, score=0.3, confidence=0.5,
+        volatility=0.2, stability="unstable", pressure=pressure,
+    )
+
+
+def loop_rank_probes(probes, context):
+    """The per-template scoring loop rank_probes replaced."""
+    ranked_probes = []
+    global_bottleneck = context.global_bottleneck
+    weak_invariant_ids = {inv.invariant_id for inv in context.weakest_invariants}
+    recent_ids = set(context.recent_template_ids)
+
+    pressure_map = {inv.invariant_id: inv.pressure for inv in context.weakest_invariants}
+    if global_bottleneck:
+        for inv in context.unstable_invariants:
+            pressure_map[inv.invariant_id] = inv.pressure
+
+    for template in probes:
+        score = 0.0
+        rationale_notes = {}
+        if global_bottleneck and template.skill == global_bottleneck:
+            score += 10.0
+            rationale_notes['target'] = global_bottleneck
+            rationale_notes['pressure'] = pressure_map.get(global_bottleneck, 0.0)
+            if template.role == "diagnostic":
+                score += 2.0
+        elif template.skill in weak_invariant_ids:
+            score += 5.0
+            rationale_notes['target'] = template.skill
+            rationale_notes['pressure'] = pressure_map.get(template.skill, 0.0)
+
+        intersection = set(template.invariant_targets).intersection(weak_invariant_ids)
+        if intersection:
+            score += len(intersection) * 1.5
+
+        score -= (template.probe_cost * 0.5)
+
+        if template.task_template_id in recent_ids:
+            score -= 20.0
+            rationale_notes['fatigue'] = True
+
+        if score > 0:
+            ranked_probes.append((score, template, template.slot_id or "global", rationale_notes))
+
+    ranked_probes.sort(key=lambda x: x[0], reverse=True)
+    return ranked_probes
+
+
+# Fixed pool: tied scores in several places, a fatigued bottleneck probe,
+# diagnostic vs reinforcement on the bottleneck, intersections, and probes
+# whose cost drives them to zero or below.
+POOL = [
+    _template("arr-1", "arrays", role="reinforcement", slot_id="s1"),
+    _template("graph-diag", "graphs", targets=["graphs"], slot_id="s2"),
+    _template("arr-2", "arrays", role="reinforcement", slot_id="s3"),
+    _template("graph-fatigued", "graphs", slot_id="s2"),
+    _template("str-1", "strings", targets=["arrays", "recursion"]),
+    _template("graph-reinf", "graphs", role="reinforcement", cost=2.0),
+    _template("heap-1", "heaps", cost=2.0),
+    _template("rec-1", "recursion", cost=10.0),
+    _template("arr-3", "arrays", role="stretch", slot_id="s4"),
+    _template("dp-1", "dp", targets=["recursion"], cost=3.0),
+    _template("str-2", "strings", targets=["arrays", "recursion"]),
+]
+
+
+def _context(bottleneck="graphs", recent=("graph-fatigued", "arr-2")):
+    return DecisionContext(
+        user_id="u1",
+        track_id="dsa",
+        global_bottleneck=bottleneck,
+        weakest_invariants=[_invariant("arrays", 1.2), _invariant("recursion", 0.9)],
+        unstable_invariants=[_invariant("graphs", 2.5)],
+        recent_template_ids=list(recent),
+        noise_level=0.1,
+    )
+
+
+def _keys(ranked):
+    return [(score, t.task_template_id, slot, notes) for score, t, slot, notes in ranked]
+
+
+class TestAdaptiveMarket(unittest.TestCase):
+    def test_ranking_matches_loop(self):
+        market = AdaptiveMarket()
+        for context in (_context(), _context(bottleneck=None), _context(recent=())):
+            expected = _keys(loop_rank_probes(POOL, context))
+            self.assertEqual(_keys(market.rank_probes(POOL, context)), expected)
+            for k in (1, 2, 3, len(POOL)):
+                self.assertEqual(_keys(market.rank_probes(POOL, context, top_k=k)), expected[:k])
+
+    def test_ties_keep_pool_order(self):
+        ranked = _keys(AdaptiveMarket().rank_probes(POOL, _context()))
+        tied = [template_id for score, template_id, _, _ in ranked if score == 4.5]
+        self.assertEqual(tied, ["arr-1", "arr-3"])  # arr-2 is fatigued
+
+    def test_fatigue_and_bottleneck_branches(self):
+        ranked = {key[1]: key for key in _keys(AdaptiveMarket().rank_probes(POOL, _context()))}
+        self.assertEqual(ranked["graph-diag"][0], 11.5)      # bottleneck + diagnostic
+        self.assertEqual(ranked["graph-diag"][3], {"target": "graphs", "pressure": 2.5})
+        self.assertEqual(ranked["graph-reinf"][0], 9.0)      # bottleneck only
+        self.assertNotIn("graph-fatigued", ranked)           # 11.5 - 20
+        self.assertNotIn("rec-1", ranked)                    # cost outweighs weakness
+
+    def test_select_optimal_probe_matches_loop(self):
+        features = ProbeFeatures(POOL)
+        market = AdaptiveMarket()
+        with patch.object(adaptive_market, "get_probe_features", lambda: features):
+            # Without a bottleneck the best probe (4.5) stays under the threshold.
+            for context in (_context(), _context(bottleneck=None)):
+                expected = loop_rank_probes(POOL, context)
+                decision = market.select_optimal_probe(context, current_slot_id="s2")
+                best_score, best_template, source_slot, _ = expected[0]
+                if best_score <= 5.0:
+                    self.assertIsNone(decision)
+                    continue
+                self.assertIs(decision.selected_template, best_template)
+                self.assertEqual(decision.source_slot_id, source_slot)
+                self.assertEqual(decision.rationale.rank_score, best_score)
+                self.assertEqual(decision.rationale.rejected_alternatives_count, len(expected) - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from app.ai.provider_limiter import ProviderLimiter
+from app.schemas.ai_evaluation import AIEvaluationResult
+from app.services import canary_replay_service
+from app.services.canary_replay_service import CanaryReplayEngine, summarize_deltas
+
+
+class _FakeStore:
+    """In-memory stand-in for canary_replay_repo."""
+
+    def __init__(self, submissions):
+        self.submissions = submissions
+        self.checkpoint = None
+        self.results = []
+        self.runs = []
+
+    async def get_replay_checkpoint(self, db):
+        return self.checkpoint
+
+    async def save_replay_checkpoint(self, db, last_id, run_id):
+        self.checkpoint = last_id
+
+    async def get_replay_candidates(self, db, after_id, limit):
+        docs = [d for d in self.submissions if after_id is None or d["_id"] > after_id]
+        return docs[:limit]
+
+    async def save_replay_results(self, db, results):
+        self.results.extend(results)
+
+    async def save_replay_run(self, db, summary):
+        self.runs.append(summary)
+
+
+def _submission(i, stored_score):
+    return {
+        "_id": i,
+        "task_instance_id": f"t{i}",
+        "payload": {"text": "x", "replay_score": 0.5},
+        "skill": "recursion",
+        "difficulty": "easy",
+        "question_type": "explanation",
+        "evaluation": {"score": stored_score * 0.8, "raw_score": stored_score, "prompt_version": "1.0"},
+    }
+
+
+def _evaluate(*, context, payload):
+    return AIEvaluationResult(passed=True, score=payload["replay_score"], feedback="ok")
+
+
+class TestCanaryReplay(unittest.TestCase):
+    def _run(self, store, budget):
+        engine = CanaryReplayEngine(
+            db=None,
+            limiter=ProviderLimiter(max_concurrency=4),
+            budget=budget,
+            concurrency=2,
+            rate_per_second=1000,
+            max_seconds=60,
+            timeout_seconds=5,
+        )
+        patches = [
+            patch.object(canary_replay_service, name, getattr(store, name))
+            for name in (
+                "get_replay_checkpoint", "save_replay_checkpoint", "get_replay_candidates",
+                "save_replay_results", "save_replay_run",
+            )
+        ] + [patch.object(canary_replay_service, "evaluate_task", _evaluate)]
+        for p in patches:
+            p.start()
+        try:
+            return asyncio.run(engine.run())
+        finally:
+            for p in patches:
+                p.stop()
+
+    def test_runs_resume_from_checkpoint_and_wrap(self):
+        store = _FakeStore([_submission(i, 0.5) for i in range(5)])
+
+        first = self._run(store, budget=3)
+        self.assertEqual(first["count"], 3)
+        self.assertEqual(store.checkpoint, 2)
+
+        second = self._run(store, budget=3)
+        self.assertEqual(second["count"], 2)
+        self.assertEqual(store.checkpoint, 4)
+
+        third = self._run(store, budget=3)  # history exhausted: new sweep
+        self.assertEqual([r["submission_id"] for r in store.results[-3:]], [0, 1, 2])
+        self.assertTrue(third["success"])
+
+    def test_compares_against_raw_stored_score(self):
+        # Stored raw 0.9 (final 0.72 after a penalty); replay says 0.5
+        store = _FakeStore([_submission(i, 0.9) for i in range(4)])
+        summary = self._run(store, budget=10)
+
+        self.assertAlmostEqual(summary["mean_delta"], -0.4)
+        self.assertTrue(summary["directional_drift"])
+        self.assertFalse(summary["success"])
+
+    def test_summary(self):
+        summary = summarize_deltas([0.0, 0.1, -0.3, 0.0])
+        self.assertAlmostEqual(summary["mean_abs_delta"], 0.1)
+        self.assertEqual(summary["disagreement_rate"], 0.25)
+        self.assertEqual(summarize_deltas([]), {"count": 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+import asyncio
+import random
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from bson import ObjectId
+
+from app.db import learning_state_repo
+from app.domain.adaptive_control import (
+    build_decision_context,
+    build_decision_context_from_snapshot,
+    update_decision_snapshot,
+)
+from app.schemas.decision_context_snapshot import DecisionContextSnapshot
+from app.schemas.learning_state import SkillEntry, EvidenceSummary
+from app.services.learning_state_service import get_decision_context, record_decision_snapshot
+
+
+class _Submission:
+    def __init__(self, task_instance_id):
+        self.task_instance_id = task_instance_id
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self.docs = list(docs)
+
+    def sort(self, key, direction):
+        self.docs.sort(key=lambda d: d[key], reverse=direction < 0)
+        return self
+
+    def limit(self, n):
+        self.docs = self.docs[:n]
+        return self
+
+    async def to_list(self, length=None):
+        return self.docs[:length]
+
+    def __aiter__(self):
+        self._iter = iter(self.docs)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _Collection:
+    def __init__(self):
+        self.docs = []
+
+    def _match(self, query):
+        return [d for d in self.docs if all(d.get(k) == v for k, v in query.items())]
+
+    def find(self, query, projection=None, session=None):
+        return _Cursor(dict(d) for d in self._match(query))
+
+    async def find_one(self, query, projection=None, session=None):
+        found = self._match(query)
+        return dict(found[0]) if found else None
+
+    async def replace_one(self, query, doc, upsert=False, session=None):
+        self.docs = [d for d in self.docs if d["_id"] != query["_id"]]
+        self.docs.append({"_id": query["_id"], **doc})
+
+    async def update_one(self, query, update, session=None):
+        found = self._match(query)
+        for doc in found:
+            doc.update(update["$set"])
+        return SimpleNamespace(matched_count=len(found), modified_count=len(found))
+
+    async def delete_many(self, query, session=None):
+        matched = self._match(query)
+        self.docs = [d for d in self.docs if d not in matched]
+
+
+class _FakeDb:
+    def __init__(self):
+        self.decision_context_snapshots = _Collection()
+        self.skill_history = _Collection()
+        self.task_submissions = _Collection()
+        self.user_learning_state = _Collection()
+
+
+class TestDecisionContextSnapshot(unittest.TestCase):
+    def assertContextsClose(self, expected, actual):
+        self.assertEqual(expected.all_scores, actual.all_scores)
+        self.assertEqual(expected.global_bottleneck, actual.global_bottleneck)
+        self.assertEqual(expected.confidence_band, actual.confidence_band)
+        self.assertEqual(expected.risk_level, actual.risk_level)
+        self.assertEqual(expected.recent_template_ids, actual.recent_template_ids)
+        self.assertAlmostEqual(expected.learning_velocity, actual.learning_velocity, places=9)
+        self.assertAlmostEqual(expected.noise_level, actual.noise_level, places=9)
+        for field in ("weakest_invariants", "unstable_invariants", "dominant_invariants"):
+            exp, act = getattr(expected, field), getattr(actual, field)
+            self.assertEqual([i.invariant_id for i in exp], [i.invariant_id for i in act])
+            for e, a in zip(exp, act):
+                self.assertAlmostEqual(e.volatility, a.volatility, places=9)
+                self.assertAlmostEqual(e.pressure, a.pressure, places=9)
+                self.assertEqual(e.stability, a.stability)
+
+    def test_snapshot_matches_rebuild(self):
+        rng = random.Random(3)
+        skills = ["arrays", "hashing", "two_pointers", "recursion"]
+        skill_vector = {}
+        submissions = []
+        snapshot = DecisionContextSnapshot(user_id="u1", track_id="dsa")
+
+        for step in range(40):
+            task_instance_id = f"inst_{step}"
+            for skill in rng.sample(skills, k=rng.randint(1, 2)):
+                skill_vector[skill] = SkillEntry(
+                    level=rng.randint(2, 100) / 100.0,
+                    confidence=rng.random(),
+                    evidence_summary=EvidenceSummary(last_event_id=task_instance_id),
+                )
+            submissions.insert(0, _Submission(task_instance_id))
+
+            update_decision_snapshot(snapshot, skill_vector, task_instance_id)
+
+            expected = build_decision_context("u1", "dsa", skill_vector, [], submissions)
+            actual = build_decision_context_from_snapshot(snapshot)
+            self.assertContextsClose(expected, actual)
+
+    def test_submission_write_path_matches_rebuild(self):
+        # What production writes: a snapshot fold per submission, no skill_history
+        rng = random.Random(7)
+        user_id = str(ObjectId())
+        db = _FakeDb()
+        skill_vector = {}
+
+        async def scenario():
+            for step in range(12):
+                task_instance_id = f"inst_{step}"
+                for skill in rng.sample(["arrays", "hashing", "recursion"], k=2):
+                    skill_vector[skill] = SkillEntry(
+                        level=rng.random(),
+                        confidence=rng.random(),
+                        evidence_summary=EvidenceSummary(last_event_id=task_instance_id),
+                    )
+                await record_decision_snapshot(db, user_id, "dsa", skill_vector, task_instance_id)
+                db.task_submissions.docs.append({
+                    "_id": ObjectId(), "id": None, "user_id": user_id, "slot_id": "s",
+                    "task_instance_id": task_instance_id, "payload": {},
+                    "created_at": datetime(2026, 1, 1, step, tzinfo=timezone.utc),
+                })
+            db.user_learning_state.docs = [{
+                "user_id": ObjectId(user_id),
+                "skill_vector": {k: v.model_dump() for k, v in skill_vector.items()},
+            }]
+
+            from_snapshot = await get_decision_context(db, user_id, "dsa")
+            db.decision_context_snapshots.docs.clear()
+            rebuilt = await get_decision_context(db, user_id, "dsa")
+            return from_snapshot, rebuilt
+
+        from_snapshot, rebuilt = asyncio.run(scenario())
+        self.assertContextsClose(rebuilt, from_snapshot)
+        self.assertEqual(from_snapshot.learning_velocity, 0.0)
+
+    def test_skill_vector_writes_drop_the_snapshot(self):
+        user_id = str(ObjectId())
+        db = _FakeDb()
+        db.user_learning_state.docs = [{"user_id": ObjectId(user_id), "skill_vector": {}}]
+        entry = SkillEntry(level=0.4, confidence=0.5)
+
+        async def snapshot_count():
+            return len(db.decision_context_snapshots._match({"user_id": user_id}))
+
+        async def scenario():
+            counts = []
+            await record_decision_snapshot(db, user_id, "dsa", {"arrays": entry}, "inst_0")
+            await learning_state_repo.update_user_learning_state(db, user_id, {"goals": ["faang"]})
+            counts.append(await snapshot_count())
+
+            await learning_state_repo.update_user_learning_state(
+                db, user_id, {"skill_vector.arrays": entry.model_dump()}
+            )
+            counts.append(await snapshot_count())
+
+            await record_decision_snapshot(db, user_id, "dsa", {"arrays": entry}, "inst_1")
+            with patch.object(learning_state_repo, "missing_skills", AsyncMock(return_value=set())):
+                await learning_state_repo.add_or_update_skills(
+                    db, user_id, {"arrays": {"level": 0.9, "confidence": 0.9}}
+                )
+            counts.append(await snapshot_count())
+            return counts
+
+        self.assertEqual(asyncio.run(scenario()), [1, 0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
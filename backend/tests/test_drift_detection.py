@@ -1,5 +1,29 @@
+import random
+import statistics
 import unittest
-from app.services.evaluation_consistency import has_score_drift, has_directional_drift
+from datetime import datetime, timezone
+
+from app.domain.evaluation_history import (
+    EvaluationHistory,
+    EvaluationSnapshot,
+    MAX_EVALUATION_HISTORY,
+)
+from app.services.evaluation_consistency import (
+    has_score_drift,
+    has_directional_drift,
+    stability_factor,
+)
+
+
+def _snapshot(i, score):
+    return EvaluationSnapshot(
+        submission_id=str(i),
+        score=score,
+        confidence=0.9,
+        is_partial_credit=False,
+        evaluated_at=datetime.now(timezone.utc),
+    )
+
 
 class TestDriftDetection(unittest.TestCase):
     def test_has_score_drift(self):
@@ -22,5 +46,35 @@ class TestDriftDetection(unittest.TestCase):
         # Not enough samples
         self.assertFalse(has_directional_drift([0.9, 0.2]))
 
+    def test_ring_buffer_matches_legacy_functions(self):
+        # The ring buffer's running variance agrees with the plain-list path
+        rng = random.Random(7)
+
+        for _ in range(50):
+            history = EvaluationHistory()
+            scores = []
+            for i in range(rng.randint(1, 60)):
+                score = rng.choice([rng.random(), round(rng.random(), 1), 0.0, 1.0])
+                history.append(_snapshot(i, score))
+                scores = (scores + [score])[-MAX_EVALUATION_HISTORY:]
+
+                self.assertEqual(list(history.scores), scores)
+                self.assertAlmostEqual(
+                    history.score_variance(),
+                    statistics.pvariance(scores) if len(scores) > 1 else 0.0,
+                    places=12,
+                )
+                self.assertEqual(has_score_drift(history), has_score_drift(scores))
+                self.assertEqual(has_directional_drift(history), has_directional_drift(scores))
+                self.assertEqual(stability_factor(history), stability_factor(scores))
+
+    def test_constant_scores_have_zero_variance(self):
+        history = EvaluationHistory()
+        for i in range(25):
+            history.append(_snapshot(i, 0.7))
+        self.assertEqual(history.score_variance(), 0.0)
+        self.assertEqual(stability_factor(history), 1.0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from datetime import datetime, timezone
+
+from app.domain.evaluation_history import (
+    EvaluationHistory,
+    EvaluationSnapshot,
+    MAX_EVALUATION_HISTORY,
+)
+from app.schemas.roadmap_state import RoadmapState
+from app.services.roadmap_service import generate_v1_roadmap
+
+
+def _snapshot(i: int) -> EvaluationSnapshot:
+    return EvaluationSnapshot(
+        submission_id=f"s{i}",
+        score=i / 20,
+        confidence=0.9,
+        is_partial_credit=i % 2 == 0,
+        evaluated_at=datetime(2025, 1, 1, 0, i, tzinfo=timezone.utc),
+    )
+
+
+class TestEvaluationHistory(unittest.TestCase):
+    def test_append_keeps_latest_window(self):
+        history = EvaluationHistory()
+        for i in range(MAX_EVALUATION_HISTORY + 3):
+            history.append(_snapshot(i))
+
+        self.assertEqual(len(history), MAX_EVALUATION_HISTORY)
+        self.assertEqual(history[0], _snapshot(3))
+        self.assertEqual(list(history.scores)[-1], (MAX_EVALUATION_HISTORY + 2) / 20)
+
+    def test_roadmap_round_trip_and_legacy_format(self):
+        roadmap = generate_v1_roadmap(user_id="u1", goal="placement")
+        slot = roadmap.phases[0].slots[0]
+        for i in range(4):
+            slot.evaluation_history.append(_snapshot(i))
+
+        # Persisted form: packed columns
+        stored = roadmap.model_dump()["phases"][0]["slots"][0]["evaluation_history"]
+        self.assertIsInstance(stored["scores"], bytes)
+
+        restored = RoadmapState.model_validate(roadmap.model_dump())
+        self.assertEqual(restored.phases[0].slots[0].evaluation_history, slot.evaluation_history)
+
+        # API form and documents written before the columnar layout: list of snapshots
+        legacy = roadmap.model_dump(mode="json")
+        self.assertEqual(legacy["phases"][0]["slots"][0]["evaluation_history"][1]["submission_id"], "s1")
+        migrated = RoadmapState.model_validate(legacy)
+        self.assertEqual(migrated.phases[0].slots[0].evaluation_history, slot.evaluation_history)
+
+
+if __name__ == '__main__':
+    unittest.main()
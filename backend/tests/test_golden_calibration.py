@@ -0,0 +1,107 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from app.ai.provider_limiter import ProviderLimiter
+from app.core.system_status import system_status
+from app.domain.golden_tasks import GOLDEN_TASKS
+from app.schemas.ai_evaluation import AIEvaluationResult
+from app.services import calibration_service
+from app.services.calibration_service import CalibrationService
+
+
+class _FakeEvaluator:
+    def __init__(self, scores):
+        self.scores = scores  # task_id -> score
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, *, context, payload):
+        if self.scores[context.task_instance_id] is None:
+            raise RuntimeError("provider error")
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self._lock:
+            self.active -= 1
+        return AIEvaluationResult(passed=True, score=self.scores[context.task_instance_id], feedback="ok")
+
+
+async def _no_store(db, runs):
+    return None
+
+
+class TestGoldenCalibration(unittest.TestCase):
+    def tearDown(self):
+        system_status.transition_to("NORMAL", "test reset")
+        system_status.reset_passes()
+
+    def _run(self, evaluator, stored_runs, store=_no_store):
+        async def fake_baselines(db, runs_per_task):
+            return stored_runs
+
+        limiter = ProviderLimiter(max_concurrency=2)
+        with patch.object(calibration_service, "evaluate_task", evaluator), \
+             patch.object(calibration_service, "provider_limiter", limiter), \
+             patch.object(calibration_service, "get_golden_baseline_runs", fake_baselines), \
+             patch.object(calibration_service, "save_golden_runs", store):
+            return asyncio.run(CalibrationService(db=None).run_calibration(repeats=3))
+
+    def test_runs_concurrently_under_limiter(self):
+        evaluator = _FakeEvaluator({t.task_id: t.expected_score for t in GOLDEN_TASKS})
+        report = self._run(evaluator, stored_runs={})
+
+        self.assertEqual(report["failures"], 0)
+        self.assertEqual(evaluator.peak, 2)
+        self.assertTrue(all(len(r["samples"]) == 3 for r in report["details"]))
+        self.assertTrue(all(r["reference_source"] == "expected" for r in report["details"]))
+
+    def test_drift_measured_against_baseline(self):
+        scores = {t.task_id: t.expected_score for t in GOLDEN_TASKS}
+        # History says this evaluator scores the "perfect" answer at 0.8
+        stored = {"golden_python_sum_pass": [[0.8, 0.8, 0.8]] * 3}
+
+        scores["golden_python_sum_pass"] = 0.8
+        report = self._run(_FakeEvaluator(scores), stored)
+        self.assertEqual(report["failures"], 0)
+
+        scores["golden_python_sum_pass"] = 1.0  # matches expected_score, but drifts from history
+        report = self._run(_FakeEvaluator(scores), stored)
+        failed = [r["task_id"] for r in report["details"] if not r["passed_check"]]
+        self.assertEqual(failed, ["golden_python_sum_pass"])
+
+    def test_failed_runs_are_stored(self):
+        scores = {t.task_id: t.expected_score for t in GOLDEN_TASKS}
+        scores["golden_python_sum_pass"] = None
+        saved = []
+
+        async def store(db, runs):
+            saved.extend(runs)
+
+        self._run(_FakeEvaluator(scores), stored_runs={}, store=store)
+
+        self.assertEqual(len(saved), len(GOLDEN_TASKS))
+        failed = next(r for r in saved if r["task_id"] == "golden_python_sum_pass")
+        self.assertEqual(failed["samples"], [])
+        self.assertFalse(failed["passed_check"])
+        self.assertEqual(failed["error"], "provider error")
+
+    def test_timed_out_call_keeps_its_slot(self):
+        async def scenario():
+            limiter = ProviderLimiter(max_concurrency=1)
+            with self.assertRaises(asyncio.TimeoutError):
+                await limiter.run(time.sleep, 0.2, timeout=0.01)
+            # The abandoned thread still holds the only slot
+            self.assertTrue(limiter._semaphore.locked())
+            await limiter.run(time.sleep, 0)
+            self.assertFalse(limiter._semaphore.locked())
+
+        asyncio.run(scenario())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import random
+import unittest
+
+from app.domain.adaptive_control import DecisionContext
+from app.domain.governance_engine import (
+    apply_governance_to_roadmap,
+    compile_governance,
+    _compile_threshold,
+)
+from app.services.curriculum_service import CurriculumService
+from app.services.roadmap_service import generate_v1_roadmap
+
+
+def _slot_state(roadmap):
+    return [
+        (slot.slot_id, slot.status, slot.locked_reason, sorted(slot.flags))
+        for phase in roadmap.phases
+        for slot in phase.slots
+    ]
+
+
+class TestGovernanceEngine(unittest.TestCase):
+    def test_compiled_thresholds(self):
+        self.assertTrue(_compile_threshold(">0.7")(0.71))
+        self.assertFalse(_compile_threshold(">0.7")(0.7))
+        self.assertTrue(_compile_threshold(">=0.7")(0.7))
+        self.assertTrue(_compile_threshold("<0.3")(0.2))
+        self.assertTrue(_compile_threshold("<=0.3")(0.3))
+        self.assertTrue(_compile_threshold(0.5)(0.5))
+        self.assertFalse(_compile_threshold("garbage")(1.0))
+
+    def test_incremental_matches_full_evaluation(self):
+        curriculum = CurriculumService.get_curriculum("dsa")
+        governance = CurriculumService.get_compiled_governance("dsa")
+        skills = sorted(governance.dependencies) or ["complexity"]
+
+        incremental = generate_v1_roadmap(user_id="u1", goal="placement")
+        full = generate_v1_roadmap(user_id="u1", goal="placement")
+
+        rng = random.Random(7)
+        scores = {}
+        for _ in range(30):
+            # Mutate a couple of skills per step, sometimes none
+            for skill in rng.sample(skills, k=min(len(skills), rng.randint(0, 2))):
+                scores[skill] = round(rng.random(), 2)
+            context = DecisionContext(user_id="u1", track_id="dsa", all_scores=dict(scores))
+
+            apply_governance_to_roadmap(incremental, curriculum, context, governance=governance)
+
+            full.governance_fingerprint = None
+            apply_governance_to_roadmap(full, curriculum, context, governance=governance)
+
+            self.assertEqual(_slot_state(incremental), _slot_state(full))
+
+    def test_unchanged_inputs_skip_reevaluation(self):
+        curriculum = CurriculumService.get_curriculum("dsa")
+        governance = CurriculumService.get_compiled_governance("dsa")
+        roadmap = generate_v1_roadmap(user_id="u1", goal="placement")
+        context = DecisionContext(user_id="u1", track_id="dsa", all_scores={"arrays": 0.2})
+
+        apply_governance_to_roadmap(roadmap, curriculum, context, governance=governance)
+        self.assertEqual(roadmap.governance_fingerprint.scores["arrays"], 0.2)
+
+        reinforced = next(
+            slot
+            for phase in roadmap.phases
+            for slot in phase.slots
+            if slot.status == "reinforcement_required"
+        )
+        reinforced.user_message = "untouched"
+
+        # Same scores, same status: the slot is not re-evaluated
+        apply_governance_to_roadmap(roadmap, curriculum, context, governance=governance)
+        self.assertEqual(reinforced.user_message, "untouched")
+
+        # A dependent skill moved: the slot is re-evaluated
+        context.all_scores["arrays"] = 0.25
+        apply_governance_to_roadmap(roadmap, curriculum, context, governance=governance)
+        self.assertEqual(reinforced.user_message, "This skill needs reinforcement before you proceed.")
+
+    def test_policy_change_forces_full_pass(self):
+        curriculum = CurriculumService.get_curriculum("dsa").model_copy(deep=True)
+        governance = compile_governance(curriculum)
+        roadmap = generate_v1_roadmap(user_id="u1", goal="placement")
+        context = DecisionContext(user_id="u1", track_id="dsa", all_scores={"arrays": 0.2})
+        apply_governance_to_roadmap(roadmap, curriculum, context, governance=governance)
+
+        reinforced = next(
+            slot
+            for phase in roadmap.phases
+            for slot in phase.slots
+            if slot.status == "reinforcement_required"
+        )
+
+        # Same scores and statuses, but the curriculum's rule changed
+        slot_def = curriculum.get_slot_definition(reinforced.slot_id)
+        slot_def.governance.skip_if = {"arrays": "<0.5"}
+        changed = compile_governance(curriculum)
+        self.assertNotEqual(changed.policy_hash, governance.policy_hash)
+
+        apply_governance_to_roadmap(roadmap, curriculum, context, governance=changed)
+        self.assertEqual(roadmap.governance_fingerprint.policy_hash, changed.policy_hash)
+        self.assertEqual(reinforced.status, "skipped")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import asyncio
+import unittest
+
+from app.services.hint_service import HintCache, HintService, HINT_PLACEHOLDER
+
+
+class _FakeAIService:
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_skill_hint(self, skill, difficulty, user_level):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return f"{skill}/{difficulty}/{user_level}"
+
+
+class TestHintService(unittest.TestCase):
+    def test_miss_returns_placeholder_then_single_generation(self):
+        async def scenario():
+            ai = _FakeAIService()
+            service = HintService(ai_service=ai, cache=HintCache(max_size=10, ttl_seconds=60))
+
+            first = service.get_hint("arrays", "easy", 0.1)
+            second = service.get_hint("arrays", "easy", 0.2)  # same bucket
+            self.assertEqual(first, (HINT_PLACEHOLDER, "pending"))
+            self.assertEqual(second, (HINT_PLACEHOLDER, "pending"))
+
+            await asyncio.gather(*service._pending.values())
+            self.assertEqual(ai.calls, 1)
+            self.assertEqual(service.get_hint("arrays", "easy", 0.25), ("arrays/easy/beginner", "ready"))
+
+        asyncio.run(scenario())
+
+    def test_catalog_served_without_generation(self):
+        ai = _FakeAIService()
+        service = HintService(ai_service=ai, cache=HintCache(max_size=10, ttl_seconds=60))
+        service.load_catalog({("arrays", "easy", "advanced"): "precomputed"})
+
+        self.assertEqual(service.get_hint("arrays", "easy", 0.9), ("precomputed", "ready"))
+        self.assertEqual(service._pending, {})
+        self.assertEqual(ai.calls, 0)
+
+    def test_cache_lru_and_ttl(self):
+        cache = HintCache(max_size=2, ttl_seconds=60)
+        cache.set(("a", "easy", "beginner"), "A")
+        cache.set(("b", "easy", "beginner"), "B")
+        cache.get(("a", "easy", "beginner"))
+        cache.set(("c", "easy", "beginner"), "C")
+        self.assertIsNone(cache.get(("b", "easy", "beginner")))
+        self.assertEqual(cache.get(("a", "easy", "beginner")), "A")
+
+        expired = HintCache(max_size=2, ttl_seconds=-1)
+        expired.set(("a", "easy", "beginner"), "A")
+        self.assertIsNone(expired.get(("a", "easy", "beginner")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from fastapi import HTTPException
+from pymongo.errors import DuplicateKeyError
+
+from app.api import submissions
+from app.db.idempotency_repo import save_idempotency_record
+from app.schemas.task_submission import TaskSubmissionCreate
+from app.services.idempotency_service import request_fingerprint, get_stored_response
+
+
+class _FakeKeys:
+    def __init__(self):
+        self.docs = {}
+        self.reads = 0
+
+    async def find_one(self, query):
+        self.reads += 1
+        return self.docs.get(query["_id"])
+
+    async def insert_one(self, doc, session=None):
+        if doc["_id"] in self.docs:
+            raise DuplicateKeyError("E11000 duplicate key")
+        self.docs[doc["_id"]] = doc
+
+
+class _FakeDb:
+    def __init__(self):
+        self.idempotency_keys = _FakeKeys()
+
+
+class TestIdempotency(unittest.TestCase):
+    def test_fingerprint_ignores_key_order(self):
+        self.assertEqual(
+            request_fingerprint(slot_id="s1", payload={"a": 1, "b": 2}),
+            request_fingerprint(payload={"b": 2, "a": 1}, slot_id="s1"),
+        )
+        self.assertNotEqual(request_fingerprint(slot_id="s1"), request_fingerprint(slot_id="s2"))
+
+    def test_retry_returns_stored_response(self):
+        db = _FakeDb()
+        request_hash = request_fingerprint(slot_id="s1")
+
+        async def scenario():
+            first = await get_stored_response(db, "slot_start", "u1", "key-1", request_hash)
+            await save_idempotency_record(db, "slot_start", "u1", "key-1", request_hash, {"task_instance_id": "ti-1"})
+            # A concurrent retry finishing second keeps the first response
+            await save_idempotency_record(db, "slot_start", "u1", "key-1", request_hash, {"task_instance_id": "ti-2"})
+            retry = await get_stored_response(db, "slot_start", "u1", "key-1", request_hash)
+            other_user = await get_stored_response(db, "slot_start", "u2", "key-1", request_hash)
+            no_key = await get_stored_response(db, "slot_start", "u1", None, request_hash)
+            return first, retry, other_user, no_key
+
+        first, retry, other_user, no_key = asyncio.run(scenario())
+
+        self.assertIsNone(first)
+        self.assertEqual(retry, {"task_instance_id": "ti-1"})
+        self.assertIsNone(other_user)
+        self.assertIsNone(no_key)
+        self.assertEqual(db.idempotency_keys.reads, 3)  # no read without a key
+
+    def test_key_reuse_with_different_request_is_rejected(self):
+        db = _FakeDb()
+
+        async def scenario():
+            await save_idempotency_record(db, "submissions", "u1", "k", request_fingerprint(slot_id="s1"), {})
+            await get_stored_response(db, "submissions", "u1", "k", request_fingerprint(slot_id="s2"))
+
+        with self.assertRaises(HTTPException) as ctx:
+            asyncio.run(scenario())
+        self.assertEqual(ctx.exception.status_code, 422)
+
+    def test_concurrent_commit_of_the_same_key_returns_its_response(self):
+        db = _FakeDb()
+        payload = TaskSubmissionCreate(slot_id="s1", task_instance_id="ti-1", payload={"answer": 1})
+        request_hash = request_fingerprint(**payload.model_dump())
+
+        async def load_target(roadmap_repo, user_id, payload):
+            return SimpleNamespace(version=3), SimpleNamespace(), SimpleNamespace(task_template_id="t")
+
+        async def noop(*args, **kwargs):
+            return None
+
+        async def committed_elsewhere(fn):
+            # The other node's transaction stored the key first
+            await save_idempotency_record(db, "submissions", "u1", "k", request_hash, {"id": "sub-1"})
+            raise DuplicateKeyError("E11000 duplicate key")
+
+        patches = [
+            patch.object(submissions, "_load_submission_target", load_target),
+            patch.object(submissions, "get_task_template", lambda template_id: SimpleNamespace()),
+            patch.object(submissions, "evaluate_submission", lambda **kwargs: None),
+            patch.object(submissions, "get_user_learning_state", noop),
+            patch.object(submissions, "evaluate_submission_and_update_roadmap", noop),
+            patch.object(submissions, "run_transaction", committed_elsewhere),
+            patch.object(submissions, "validate_roadmap_state", lambda roadmap: None),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+        async def submit(key_hash):
+            return await submissions._submit_task(
+                payload, None, "u1", None, None, db, idempotency_key="k", request_hash=key_hash
+            )
+
+        self.assertEqual(asyncio.run(submit(request_hash)), {"id": "sub-1"})
+
+        with self.assertRaises(HTTPException) as ctx:
+            asyncio.run(submit(request_fingerprint(slot_id="other")))
+        self.assertEqual(ctx.exception.status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
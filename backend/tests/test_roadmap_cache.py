@@ -0,0 +1,103 @@
+import asyncio
+import unittest
+
+from app.db.user_roadmap_repo import RoadmapCache, UserRoadmapRepo
+from app.services.roadmap_service import generate_v1_roadmap
+
+
+class _Roadmaps:
+    """user_roadmaps holding one active document; counts full reads."""
+
+    def __init__(self, doc):
+        self.doc = doc
+        self.full_reads = 0
+
+    async def find_one(self, query, projection=None, session=None):
+        if self.doc is None:
+            return None
+        if projection == {"_id": 1, "version": 1}:
+            return {"_id": self.doc["_id"], "version": self.doc["version"]}
+        self.full_reads += 1
+        return dict(self.doc)
+
+    async def find_one_and_update(self, query, update, session=None):
+        if self.doc is None or self.doc["version"] != query["version"]:
+            return None
+        before = dict(self.doc)
+        self.doc.update(update["$set"])
+        self.doc["version"] += update["$inc"]["version"]
+        return before
+
+    async def insert_one(self, doc, session=None):
+        self.doc = {"_id": "r2", **doc}
+
+
+class _FakeDb:
+    def __init__(self, doc):
+        self.user_roadmaps = _Roadmaps(doc)
+
+
+def _repo():
+    roadmap = generate_v1_roadmap(user_id="u1", goal="placement")
+    doc = roadmap.model_dump()
+    doc["_id"] = "r1"
+    return UserRoadmapRepo(_FakeDb(doc), cache=RoadmapCache(max_size=8))
+
+
+class TestRoadmapCache(unittest.TestCase):
+    def test_hit_after_read_and_reload_after_external_write(self):
+        repo = _repo()
+
+        async def scenario():
+            first = await repo.get_user_roadmap_readonly("u1")
+            second = await repo.get_user_roadmap_readonly("u1")
+            self.assertIs(first, second)
+            self.assertEqual(repo.collection.full_reads, 1)
+
+            # Another process bumps the version
+            repo.collection.doc["version"] += 1
+            third = await repo.get_user_roadmap_readonly("u1")
+            self.assertIsNot(third, first)
+            self.assertEqual(repo.collection.full_reads, 2)
+
+        asyncio.run(scenario())
+        stats = repo.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+
+    def test_regenerated_roadmap_at_same_version_is_reloaded(self):
+        repo = _repo()
+
+        async def scenario():
+            first = await repo.get_user_roadmap_readonly("u1")
+            # Another process replaces the roadmap; the new document restarts at the same version
+            repo.collection.doc = dict(repo.collection.doc, _id="r2", goal="faang")
+            second = await repo.get_user_roadmap_readonly("u1")
+            self.assertIsNot(second, first)
+            self.assertEqual(second.goal, "faang")
+            self.assertEqual(repo.collection.full_reads, 2)
+
+            # A local create drops the entry at once
+            await repo.create_roadmap(generate_v1_roadmap(user_id="u1", goal="placement"))
+            self.assertEqual(len(repo.cache), 0)
+
+        asyncio.run(scenario())
+
+    def test_writes_invalidate_and_never_cache_the_callers_instance(self):
+        repo = _repo()
+
+        async def scenario():
+            await repo.get_user_roadmap_readonly("u1")
+            for session in (None, object()):
+                writer = await repo.get_user_roadmap("u1")
+                await repo.update_roadmap(writer, expected_version=writer.version, session=session)
+                self.assertEqual(len(repo.cache), 0)
+
+                cached = await repo.get_user_roadmap_readonly("u1")
+                self.assertIsNot(cached, writer)
+                self.assertEqual(cached.version, writer.version)
+
+        asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    unittest.main()
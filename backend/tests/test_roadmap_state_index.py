@@ -0,0 +1,60 @@
+import unittest
+from datetime import datetime, timezone
+
+from app.schemas.roadmap_state import TaskSlot
+from app.schemas.task_instance import TaskInstance
+from app.services.roadmap_service import generate_v1_roadmap
+
+
+def _instance(task_instance_id, slot_id):
+    return TaskInstance(
+        task_instance_id=task_instance_id,
+        skill="arrays",
+        slot_id=slot_id,
+        base_template_id="t",
+        task_template_id="t",
+        difficulty="easy",
+        started_at=datetime.now(timezone.utc),
+    )
+
+
+class TestRoadmapStateIndex(unittest.TestCase):
+    def test_slot_lookup_survives_structural_changes(self):
+        roadmap = generate_v1_roadmap(user_id="u1", goal="placement")
+        last_phase = roadmap.phases[-1]
+        last_slot = last_phase.slots[-1]
+        self.assertIs(roadmap.get_slot(last_slot.slot_id), last_slot)
+        self.assertIs(roadmap.get_phase_for_slot(last_slot.slot_id), last_phase)
+
+        # Insert ahead of the indexed slot; positions shift
+        extra = TaskSlot(slot_id="EXTRA_SLOT", skill="arrays", difficulty="easy", status="locked")
+        roadmap.phases[0].slots.insert(0, extra)
+        last_phase.slots.reverse()
+
+        self.assertIs(roadmap.get_slot("EXTRA_SLOT"), extra)
+        self.assertIs(roadmap.get_slot(last_slot.slot_id), last_slot)
+
+        roadmap.phases[0].slots.remove(extra)
+        with self.assertRaises(ValueError):
+            roadmap.get_slot("EXTRA_SLOT")
+
+    def test_task_instance_lookup(self):
+        roadmap = generate_v1_roadmap(user_id="u1", goal="placement")
+        slot_id = roadmap.phases[0].slots[0].slot_id
+
+        first = _instance("i1", slot_id)
+        roadmap.add_task_instance(first)
+        self.assertIs(roadmap.get_task_instance("i1"), first)
+
+        second = _instance("i2", slot_id)
+        roadmap.add_task_instance(second)
+        roadmap.task_instances.insert(0, _instance("i0", slot_id))  # bypasses add_task_instance
+
+        self.assertIs(roadmap.get_task_instance("i2"), second)
+        self.assertEqual(roadmap.get_task_instance("i0").task_instance_id, "i0")
+        with self.assertRaises(ValueError):
+            roadmap.get_task_instance("missing")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import random
+import unittest
+
+from app.domain.roadmap_validator import validate_roadmap_state, RoadmapValidationError
+from app.services.roadmap_service import generate_v1_roadmap
+
+
+def _outcome(roadmap, mode):
+    try:
+        validate_roadmap_state(roadmap, mode=mode)
+        return None
+    except RoadmapValidationError as e:
+        return str(e)
+
+
+class TestRoadmapValidator(unittest.TestCase):
+    def test_never_validated_roadmap_gets_full_pass(self):
+        roadmap = generate_v1_roadmap(user_id="u1", goal="placement")
+        roadmap.phases[1].slots[0].status = "available"  # inside a locked phase
+        roadmap.track_changes(validated=False)  # hide it from the dirty set
+
+        with self.assertRaises(RoadmapValidationError):
+            validate_roadmap_state(roadmap)
+
+    def test_incremental_catches_tracked_violations(self):
+        roadmap = generate_v1_roadmap(user_id="u1", goal="placement")
+        validate_roadmap_state(roadmap, mode="full")
+        self.assertEqual(roadmap.changes_since_validation(), (set(), set()))
+
+        first, second = roadmap.phases[0].slots[0], roadmap.phases[0].slots[1]
+        first.status = "in_progress"
+        first.active_task_instance_id = "i1"
+        validate_roadmap_state(roadmap)
+
+        second.status = "in_progress"
+        second.active_task_instance_id = "i2"
+        with self.assertRaisesRegex(RoadmapValidationError, "Multiple in_progress"):
+            validate_roadmap_state(roadmap)
+
+        # Failed pass keeps the change set; fixing it validates again
+        second.status = "available"
+        second.active_task_instance_id = None
+        validate_roadmap_state(roadmap)
+        self.assertEqual(roadmap.in_progress_slot_ids(), {first.slot_id})
+
+    def test_incremental_matches_full(self):
+        rng = random.Random(11)
+        statuses = ["locked", "available", "in_progress", "completed", "skipped"]
+
+        tracked = generate_v1_roadmap(user_id="u1", goal="placement")
+        validate_roadmap_state(tracked, mode="full")
+
+        for _ in range(200):
+            phase = rng.choice(tracked.phases)
+            if rng.random() < 0.2:
+                phase.phase_status = rng.choice(["locked", "active", "completed"])
+            else:
+                slot = rng.choice(phase.slots)
+                slot.status = rng.choice(statuses)
+                slot.active_task_instance_id = "i" if slot.status == "in_progress" else None
+
+            full = tracked.model_copy(deep=True)
+            self.assertEqual(_outcome(tracked, "incremental"), _outcome(full, "full"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import asyncio
+import random
+import statistics
+import unittest
+from unittest.mock import patch
+
+from app.domain.control_rules import ControlRules
+from app.domain.score_distribution import ScoreDistribution
+from app.services import calibration_scheduler
+from app.services.calibration_scheduler import CalibrationScheduler
+
+
+class TestScoreDistribution(unittest.TestCase):
+    def test_merged_rollups_match_direct_stats(self):
+        rng = random.Random(3)
+        scores = [rng.random() for _ in range(500)]
+
+        # Split across "hourly" rollups, persisted as $inc payloads
+        merged = ScoreDistribution()
+        for start in range(0, len(scores), 37):
+            hour = ScoreDistribution()
+            for score in scores[start:start + 37]:
+                hour.add(score, 0.5)
+            increments = hour.to_increments()
+            doc = {k: v for k, v in increments.items() if not k.startswith("histogram.")}
+            doc["histogram"] = {k.split(".")[1]: v for k, v in increments.items() if k.startswith("histogram.")}
+            merged.merge_document(doc)
+
+        stats = merged.to_stats()
+        self.assertEqual(stats["count"], len(scores))
+        self.assertAlmostEqual(stats["avg_score"], statistics.mean(scores), places=9)
+        self.assertAlmostEqual(stats["std_dev"], statistics.pstdev(scores), places=9)
+        # Histogram quantiles are within one bin of the exact value
+        self.assertLess(abs(stats["p50"] - statistics.median(scores)), 0.05)
+
+    def test_empty(self):
+        self.assertEqual(ScoreDistribution().to_stats(), {})
+
+
+class _SegmentedCalibration:
+    async def check_segmented_score_stats(self, hours=24):
+        return {
+            "arrays:easy:2.5.0": {"std_dev": 0.1, "count": 40},
+            "graphs:hard:2.5.0": {"std_dev": 0.42, "count": 12},
+        }
+
+
+class TestSegmentedScoreStats(unittest.TestCase):
+    def test_segment_drift_reaches_control_rules(self):
+        async def no_span(db):
+            return None, None
+
+        async def no_failure(db):
+            return None
+
+        async def calm_global(db, hours=24):
+            return {"std_dev": 0.1, "confidence_avg": 0.9}
+
+        scheduler = CalibrationScheduler(db=object())
+        scheduler._calibration_service = _SegmentedCalibration()
+        with patch.object(calibration_scheduler, "get_score_stats", calm_global), \
+                patch.object(calibration_scheduler, "get_golden_run_span", no_span), \
+                patch.object(calibration_scheduler, "get_last_replay_failure_at", no_failure):
+            metrics = asyncio.run(scheduler.analyze_score_distribution())
+
+        self.assertEqual(metrics["segment_std_dev_max"], 0.42)
+        self.assertTrue(ControlRules.check_normal_to_dampened(metrics))
+
+
+if __name__ == '__main__':
+    unittest.main()
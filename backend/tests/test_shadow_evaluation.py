@@ -0,0 +1,131 @@
+import asyncio
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from app.ai.provider_limiter import ProviderLimiter
+from app.schemas.ai_evaluation import AIEvaluationResult
+from app.schemas.task_instance import TaskInstance
+from app.schemas.task_template import TaskTemplate
+from app.services import shadow_evaluation_service
+from app.services.shadow_evaluation_service import (
+    run_shadow_evaluation,
+    should_shadow,
+    shadow_candidate,
+)
+
+
+def _task(question_type):
+    instance = TaskInstance(
+        task_instance_id="ti-1",
+        skill="recursion",
+        slot_id="s1",
+        base_template_id="tpl",
+        task_template_id="tpl",
+        difficulty="easy",
+        started_at=datetime.now(timezone.utc),
+    )
+    template = TaskTemplate(id="tpl", skill="recursion", type=question_type, prompt="Explain recursion")
+    return instance, template
+
+
+class TestShadowEvaluation(unittest.TestCase):
+    def test_sampling_is_deterministic(self):
+        ids = [f"sub-{i}" for i in range(2000)]
+        sampled = [i for i in ids if should_shadow(i, 0.1)]
+
+        self.assertEqual(sampled, [i for i in ids if should_shadow(i, 0.1)])
+        self.assertTrue(100 < len(sampled) < 300)
+        self.assertFalse(any(should_shadow(i, 0.0) for i in ids))
+
+    def test_sample_rate_setting_read_per_call(self):
+        settings = shadow_evaluation_service.settings
+        with patch.object(settings, "SHADOW_EVAL_SAMPLE_RATE", 0.0):
+            self.assertFalse(should_shadow("sub-1"))
+        with patch.object(settings, "SHADOW_EVAL_SAMPLE_RATE", 1.0):
+            self.assertTrue(should_shadow("sub-1"))
+
+    def test_candidate_must_differ_from_live(self):
+        settings = shadow_evaluation_service.settings
+        with patch.object(settings, "SHADOW_PROMPT_VERSION", None), patch.object(settings, "SHADOW_MODEL", None):
+            self.assertIsNone(shadow_candidate("explanation"))
+
+        with patch.object(settings, "SHADOW_PROMPT_VERSION", None), patch.object(settings, "SHADOW_MODEL", "candidate-model"):
+            self.assertEqual(shadow_candidate("explanation")[1], "candidate-model")
+            self.assertIsNone(shadow_candidate("mcq"))
+
+        # Versions missing from the prompt registry are never run
+        with patch.object(settings, "SHADOW_PROMPT_VERSION", "9.9.9"), patch.object(settings, "SHADOW_MODEL", None):
+            self.assertIsNone(shadow_candidate("coding"))
+
+    def test_stores_paired_result_against_raw_score(self):
+        saved = []
+        calls = []
+
+        async def save(db, doc):
+            saved.append(doc)
+
+        def evaluate(**kwargs):
+            calls.append(kwargs)
+            return AIEvaluationResult(
+                passed=False, score=0.5, feedback="ok",
+                model_name=kwargs["model"], prompt_version="2.5.0",
+            )
+
+        instance, template = _task("explanation")
+        live = AIEvaluationResult(passed=True, score=0.63, raw_score=0.7, feedback="ok", model_name="live-model")
+
+        settings = shadow_evaluation_service.settings
+        with patch.object(settings, "SHADOW_MODEL", "candidate-model"), \
+                patch.object(shadow_evaluation_service, "evaluate_task", evaluate), \
+                patch.object(shadow_evaluation_service, "save_shadow_evaluation", save):
+            doc = asyncio.run(run_shadow_evaluation(
+                None,
+                submission_id="sub-1",
+                user_id="u1",
+                task_instance=instance,
+                task_template=template,
+                payload={"text": "x"},
+                live=live,
+                limiter=ProviderLimiter(max_concurrency=1),
+            ))
+
+        self.assertEqual(saved, [doc])
+        self.assertEqual(calls[0]["model"], "candidate-model")
+        self.assertAlmostEqual(doc["delta"], -0.2)
+        self.assertFalse(doc["passed_agrees"])
+        self.assertEqual(doc["shadow"]["model_name"], "candidate-model")
+
+    def test_unparseable_candidate_output_is_not_stored(self):
+        saved = []
+
+        async def save(db, doc):
+            saved.append(doc)
+
+        def evaluate(**kwargs):
+            raise RuntimeError("Invalid JSON from explanation evaluator.")
+
+        instance, template = _task("explanation")
+        live = AIEvaluationResult(passed=True, score=0.7, feedback="ok")
+
+        settings = shadow_evaluation_service.settings
+        with patch.object(settings, "SHADOW_MODEL", "candidate-model"), \
+                patch.object(shadow_evaluation_service, "evaluate_task", evaluate), \
+                patch.object(shadow_evaluation_service, "save_shadow_evaluation", save):
+            doc = asyncio.run(run_shadow_evaluation(
+                None,
+                submission_id="sub-1",
+                user_id="u1",
+                task_instance=instance,
+                task_template=template,
+                payload={"text": "x"},
+                live=live,
+                limiter=ProviderLimiter(max_concurrency=1),
+            ))
+
+        self.assertIsNone(doc)
+        self.assertEqual(saved, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import asyncio
+import unittest
+
+from fastapi import HTTPException
+from pymongo.errors import DuplicateKeyError
+
+from app.core.single_flight import SingleFlight
+from app.db.submission_lease_repo import acquire_submission_lease
+
+
+class _FakeLeases:
+    """submission_leases with the upsert-on-expired semantics of Mongo."""
+
+    def __init__(self):
+        self.docs = {}
+
+    async def update_one(self, query, update, upsert):
+        doc = self.docs.get(query["_id"])
+        if doc is not None and not doc["expires_at"] <= query["expires_at"]["$lte"]:
+            raise DuplicateKeyError("E11000 duplicate key")
+        self.docs[query["_id"]] = dict(update["$set"])
+
+
+class _FakeDb:
+    def __init__(self):
+        self.submission_leases = _FakeLeases()
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_duplicates_share_one_call(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def evaluate():
+            calls.append(1)
+            await asyncio.sleep(0.02)
+            return {"submission": "s1"}
+
+        async def scenario():
+            return await asyncio.gather(*(
+                flight.run("u1", ("u1", "slot", "ti"), evaluate) for _ in range(3)
+            ))
+
+        results = asyncio.run(scenario())
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(flight._locks, {})
+
+    def test_other_calls_of_same_key_are_serialized(self):
+        flight = SingleFlight()
+        active = []
+        peak = []
+
+        async def submit():
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.pop()
+
+        async def scenario():
+            await asyncio.gather(
+                flight.run("u1", ("u1", "slot-a"), submit),
+                flight.run("u1", ("u1", "slot-b"), submit),
+                flight.run("u2", ("u2", "slot-a"), submit),
+            )
+
+        asyncio.run(scenario())
+        self.assertEqual(max(peak), 2)  # u1's two submits never overlap; u2 runs alongside
+
+    def test_sharers_get_the_same_error(self):
+        flight = SingleFlight()
+
+        async def conflict():
+            await asyncio.sleep(0.01)
+            raise HTTPException(409, "conflict")
+
+        async def scenario():
+            return await asyncio.gather(
+                flight.run("u1", "k", conflict),
+                flight.run("u1", "k", conflict),
+                return_exceptions=True,
+            )
+
+        errors = asyncio.run(scenario())
+        self.assertTrue(all(isinstance(e, HTTPException) and e.status_code == 409 for e in errors))
+
+    def test_lease_rejects_while_held(self):
+        db = _FakeDb()
+
+        async def scenario():
+            first = await acquire_submission_lease(db, "u1", "node-a", ttl_seconds=60)
+            second = await acquire_submission_lease(db, "u1", "node-b", ttl_seconds=60)
+            expired = await acquire_submission_lease(db, "u2", "node-a", ttl_seconds=-1)
+            reclaimed = await acquire_submission_lease(db, "u2", "node-b", ttl_seconds=60)
+            return first, second, expired, reclaimed
+
+        self.assertEqual(asyncio.run(scenario()), (True, False, True, True))
+        self.assertEqual(db.submission_leases.docs["u2"]["owner"], "node-b")
+
+
+if __name__ == "__main__":
+    unittest.main()
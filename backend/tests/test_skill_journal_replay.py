@@ -0,0 +1,202 @@
+import asyncio
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from bson import ObjectId
+
+from app.core.system_status import system_status
+from app.domain.skill_vector_updater import apply_skill_vector_update
+from app.schemas.ai_evaluation import AIEvaluationResult
+from app.schemas.learning_state import SkillEntry, UserLearningState
+from app.schemas.task_instance import TaskInstance
+from app.schemas.task_template import TaskTemplate
+from app.services import skill_journal_service
+from app.services.skill_journal_service import replay_skill_journal
+from app.services.learning_state_service import get_decision_context, record_decision_snapshot
+
+
+def _learning_state(user_id):
+    now = datetime.now(timezone.utc)
+    return UserLearningState(user_id=user_id, skill_vector={}, created_at=now, updated_at=now)
+
+
+def _submit(learning_state, score, journal):
+    instance = TaskInstance(
+        task_instance_id=f"ti-{score}",
+        skill="recursion",
+        slot_id="s1",
+        base_template_id="tpl",
+        task_template_id="tpl",
+        difficulty="medium",
+        started_at=datetime.now(timezone.utc),
+    )
+    template = TaskTemplate(id="tpl", skill="recursion", type="coding", prompt="Reverse a list")
+    evaluation = AIEvaluationResult(passed=True, score=score, confidence=0.9, feedback="ok", prompt_version="2.5.0")
+    return apply_skill_vector_update(
+        learning_state=learning_state,
+        evaluation=evaluation,
+        task_instance=instance,
+        task_template=template,
+        evaluation_id=f"eval-{score}",
+        journal=journal,
+    )
+
+
+async def _run_transaction(fn):
+    return await fn(object())
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self.docs = list(docs)
+
+    def sort(self, *args):
+        return self
+
+    def limit(self, n):
+        return self
+
+    async def to_list(self, length=None):
+        return self.docs
+
+    def __aiter__(self):
+        self._iter = iter(self.docs)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _Collection:
+    def __init__(self):
+        self.docs = {}
+
+    def find(self, query, projection=None, session=None):
+        return _Cursor([])
+
+    async def find_one(self, query, projection=None, session=None):
+        doc = self.docs.get(query["_id"])
+        return dict(doc) if doc else None
+
+    async def replace_one(self, query, doc, upsert=False, session=None):
+        self.docs[query["_id"]] = {"_id": query["_id"], **doc}
+
+
+class _FakeDb:
+    """Decision snapshots (plus the empty collections a snapshot seed reads)."""
+
+    def __init__(self):
+        self.decision_context_snapshots = _Collection()
+        self.skill_history = _Collection()
+        self.task_submissions = _Collection()
+
+
+class _FakeJournalStore:
+    """In-memory journal + learning states behind the replay's repo calls."""
+
+    def __init__(self, entries, states):
+        self.docs = [{**e.model_dump(), "_id": i} for i, e in enumerate(entries)]
+        self.states = states
+        self.bulk_writes = []
+
+    async def claim_journal_batch(self, db, replay_id, limit, stale_before):
+        return self.docs[:limit]
+
+    async def delete_journal_entries(self, db, ids, session=None):
+        self.docs = [d for d in self.docs if d["_id"] not in ids]
+
+    async def get_user_learning_states(self, db, user_ids, session=None):
+        return {u: self.states[u] for u in user_ids if u in self.states}
+
+    async def bulk_apply_skill_vector_updates(self, db, updates, session=None):
+        self.bulk_writes.append({u: sorted(skills) for u, skills in updates.items()})
+        return len(updates)
+
+
+class TestSkillJournalReplay(unittest.TestCase):
+    def tearDown(self):
+        system_status.transition_to("NORMAL", "test reset")
+
+    def test_frozen_updates_are_journaled_not_applied(self):
+        state = _learning_state("u1")
+        journal = []
+
+        system_status.transition_to("FROZEN", "test")
+        telemetry = _submit(state, 0.95, journal)
+
+        self.assertEqual(telemetry, [])
+        self.assertEqual(state.skill_vector, {})
+        self.assertEqual(len(journal), 1)
+        self.assertEqual(journal[0].user_id, "u1")
+        self.assertIn("recursion", journal[0].raw_deltas)
+
+    def test_replay_matches_live_application_in_bulk(self):
+        users = [str(ObjectId()), str(ObjectId())]
+        gone = str(ObjectId())
+        db = _FakeDb()
+
+        # Reference: the same evaluations applied live
+        live = {u: _learning_state(u) for u in users}
+        for u in live:
+            for score in (0.95, 0.7):
+                _submit(live[u], score, None)
+
+        journal = []
+        system_status.transition_to("FROZEN", "test")
+        replayed_states = {u: _learning_state(u) for u in users + [gone]}
+        for u in replayed_states:
+            # An untouched skill that a concurrent write may have changed
+            replayed_states[u].skill_vector["graphs"] = SkillEntry(level=0.4, confidence=0.5)
+            for score in (0.95, 0.7):
+                _submit(replayed_states[u], score, journal)
+                # Frozen submissions still fold into the snapshot (levels unchanged)
+                asyncio.run(record_decision_snapshot(
+                    db, u, "dsa", replayed_states[u].skill_vector, f"ti-{score}"
+                ))
+        del replayed_states[gone]
+        system_status.transition_to("NORMAL", "test")
+
+        store = _FakeJournalStore(journal, replayed_states)
+        patches = [
+            patch.object(skill_journal_service, name, getattr(store, name))
+            for name in (
+                "claim_journal_batch", "delete_journal_entries",
+                "get_user_learning_states", "bulk_apply_skill_vector_updates",
+            )
+        ] + [patch.object(skill_journal_service, "run_transaction", _run_transaction)]
+        for p in patches:
+            p.start()
+        try:
+            report = asyncio.run(replay_skill_journal(db, batch_size=3))
+        finally:
+            for p in patches:
+                p.stop()
+
+        self.assertEqual(report["replayed"], 6)
+        self.assertEqual(store.docs, [])
+        self.assertEqual(len(store.bulk_writes), 2)  # 6 entries in batches of 3
+        # Only the journaled skill is written back
+        for batch in store.bulk_writes:
+            self.assertTrue(all(skills == ["recursion"] for skills in batch.values()))
+        for u in users:
+            level = live[u].skill_vector["recursion"].level
+            self.assertEqual(replayed_states[u].skill_vector["recursion"].level, level)
+            self.assertEqual(replayed_states[u].skill_vector["recursion"].evidence_summary.total_events, 2)
+
+            # Governance reads the replayed levels, not the pre-freeze ones
+            context = asyncio.run(get_decision_context(db, u, "dsa"))
+            self.assertEqual(context.all_scores["recursion"], level)
+            self.assertEqual(context.recent_template_ids, ["ti-0.7", "ti-0.95"])
+
+    def test_replay_waits_while_frozen(self):
+        system_status.transition_to("FROZEN", "test")
+        report = asyncio.run(replay_skill_journal(None))
+        self.assertEqual(report["replayed"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from app.db import skill_registry_repo
+from app.db.skill_registry_repo import SkillRegistryCache
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self._docs = iter(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._docs)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _Registry:
+    def __init__(self, ids):
+        self.ids = list(ids)
+        self.queries = 0
+
+    def find(self, query, projection=None):
+        self.queries += 1
+        wanted = query.get("_id", {}).get("$in")
+        return _Cursor([{"_id": i} for i in self.ids if wanted is None or i in wanted])
+
+    async def insert_one(self, doc):
+        self.ids.append(doc["_id"])
+
+
+class _FakeDb:
+    def __init__(self, ids):
+        self.skill_registry = _Registry(ids)
+
+
+class TestSkillRegistryCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = SkillRegistryCache(ttl_seconds=300)
+        patcher = patch.object(skill_registry_repo, "skill_registry", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_known_skills_are_validated_without_queries(self):
+        db = _FakeDb(["arrays", "graphs", "strings"])
+
+        async def scenario():
+            self.assertEqual(await skill_registry_repo.load_skill_registry(db), 3)
+            self.assertTrue(await skill_registry_repo.skill_exists(db, "arrays"))
+            self.assertEqual(await skill_registry_repo.missing_skills(db, ["arrays", "graphs"]), set())
+            self.assertEqual(db.skill_registry.queries, 1)
+
+            # Unknown ids are confirmed once, together
+            missing = await skill_registry_repo.missing_skills(db, ["arrays", "dp", "heaps"])
+            self.assertEqual(missing, {"dp", "heaps"})
+            self.assertEqual(db.skill_registry.queries, 2)
+
+        asyncio.run(scenario())
+
+    def test_registered_elsewhere_is_found_and_remembered(self):
+        db = _FakeDb(["arrays"])
+
+        async def scenario():
+            await skill_registry_repo.load_skill_registry(db)
+            db.skill_registry.ids.append("dp")  # another process registered it
+            self.assertTrue(await skill_registry_repo.skill_exists(db, "dp"))
+            self.assertTrue(await skill_registry_repo.skill_exists(db, "dp"))
+            self.assertEqual(db.skill_registry.queries, 2)
+
+            await skill_registry_repo.add_skill(db, "trees")
+            self.assertEqual(await skill_registry_repo.get_all_skills(db), ["arrays", "dp", "trees"])
+            self.assertEqual(db.skill_registry.queries, 2)
+
+        asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import asyncio
+import unittest
+from datetime import datetime, timezone
+
+from unittest.mock import patch
+
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError, OperationFailure
+
+from app.core.exceptions import DuplicateSubmissionError
+from app.db import indexes
+from app.db.indexes import ensure_indexes
+from app.db.task_submission_repo import TaskSubmissionRepo
+
+
+class _UniqueSubmissions:
+    """task_submissions with the unique (user_id, slot_id, task_instance_id) index."""
+
+    def __init__(self):
+        self.docs = {}
+
+    async def insert_one(self, doc, session=None):
+        key = (doc["user_id"], doc["slot_id"], doc["task_instance_id"])
+        if key in self.docs:
+            raise DuplicateKeyError("E11000 duplicate key error index: unique_submission")
+        doc.setdefault("_id", ObjectId())
+        self.docs[key] = dict(doc)
+
+        class _Result:
+            inserted_id = doc["_id"]
+        return _Result()
+
+    async def find_one(self, query, session=None):
+        return next((dict(d) for d in self.docs.values() if d["_id"] == query["_id"]), None)
+
+
+class _FakeDb:
+    def __init__(self):
+        self.task_submissions = _UniqueSubmissions()
+
+
+def _submission():
+    return {
+        "user_id": "u1",
+        "slot_id": "s1",
+        "task_instance_id": "ti-1",
+        "payload": {"answer": "x"},
+        "status": "evaluated",
+        "evaluated_at": datetime.now(timezone.utc),
+    }
+
+
+class TestSubmissionUniqueness(unittest.TestCase):
+    def test_duplicate_insert_raises_domain_error(self):
+        repo = TaskSubmissionRepo(_FakeDb())
+
+        async def scenario():
+            first = await repo.create_submission(_submission())
+            await repo.create_submission(_submission())
+            return first
+
+        with self.assertRaises(DuplicateSubmissionError):
+            asyncio.run(scenario())
+
+    def test_startup_fails_without_the_unique_index(self):
+        async def duplicates_present(db):
+            raise OperationFailure("E11000 duplicate key error index: unique_submission")
+
+        async def optional_fails(db):
+            raise OperationFailure("not authorized")
+
+        with patch.object(indexes, "ensure_task_submission_indexes", duplicates_present):
+            with self.assertRaises(OperationFailure):
+                asyncio.run(ensure_indexes(object()))
+
+        async def ok(db):
+            return None
+
+        # Other collections only log
+        with patch.object(indexes, "ensure_task_submission_indexes", ok), \
+                patch.object(indexes, "ensure_idempotency_indexes", optional_fails), \
+                patch.object(indexes, "ensure_skill_journal_indexes", optional_fails):
+            with self.assertLogs(indexes.logger, level="ERROR"):
+                asyncio.run(ensure_indexes(object()))
+
+
+if __name__ == "__main__":
+    unittest.main()
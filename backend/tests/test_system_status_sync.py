@@ -0,0 +1,103 @@
+import asyncio
+import unittest
+
+from pymongo.errors import OperationFailure
+
+from app.core.system_status import SystemStateManager
+
+
+class _FakeStateCollection:
+    """Single-document stand-in for db.system_state on a standalone server."""
+
+    def __init__(self):
+        self.doc = None
+
+    async def find_one(self, query):
+        return dict(self.doc) if self.doc else None
+
+    async def find_one_and_update(self, query, update, upsert, return_document):
+        doc = dict(self.doc or {"_id": query["_id"], "version": 0})
+        doc.update(update["$set"])
+        doc["version"] += update["$inc"]["version"]
+        self.doc = doc
+        return dict(doc)
+
+    def watch(self, pipeline, full_document):
+        raise OperationFailure("The $changeStream stage is only supported on replica sets")
+
+
+class _FakeDb:
+    def __init__(self):
+        self.system_state = _FakeStateCollection()
+
+
+class TestSystemStatusSync(unittest.TestCase):
+    def test_transition_reaches_other_workers(self):
+        db = _FakeDb()
+        a, b = SystemStateManager(), SystemStateManager()
+
+        async def scenario():
+            await a.start(db, poll_interval_seconds=0.01)
+            await b.start(db, poll_interval_seconds=0.01)
+
+            await a.transition("FROZEN", "incident")
+            await asyncio.sleep(0.05)
+            frozen = (b.is_frozen, b.version, b.sync_mode)
+
+            # Background write-through from the sync API
+            b.transition_to("DAMPENED", "calibration", dampening_factor=0.5)
+            await asyncio.sleep(0.05)
+            dampened = (a.status.mode, a.dampening_factor, a.version)
+
+            await a.stop()
+            await b.stop()
+            return frozen, dampened
+
+        frozen, dampened = asyncio.run(scenario())
+
+        self.assertEqual(frozen, (True, 1, "polling"))
+        self.assertEqual(dampened, ("DAMPENED", 0.5, 2))
+
+    def test_stale_documents_are_ignored(self):
+        manager = SystemStateManager()
+        manager.version = 5
+        stale = {
+            "version": 4, "mode": "FROZEN", "dampening_factor": 0.0, "reason": "old",
+            "entered_at": manager.status.entered_at, "last_checked_at": manager.status.last_checked_at,
+        }
+
+        self.assertFalse(manager._apply_document(stale))
+        self.assertFalse(manager.is_frozen)
+
+    def test_update_skipped_during_local_write_is_caught_up(self):
+        db = _FakeDb()
+        manager = SystemStateManager()
+        save = db.system_state.find_one_and_update
+
+        async def save_then_foreign_write(query, update, upsert, return_document):
+            ours = await save(query, update, upsert, return_document)
+            # Another worker writes next; its change event lands mid-write
+            frozen = {"$set": {"mode": "FROZEN", "dampening_factor": 0.0}, "$inc": {"version": 1}}
+            foreign = await save(query, frozen, upsert, return_document)
+            self.assertFalse(manager._apply_document(foreign))
+            return ours
+
+        db.system_state.find_one_and_update = save_then_foreign_write
+        manager._db = db
+
+        async def scenario():
+            await manager.transition("DAMPENED", "calibration", dampening_factor=0.5)
+            return manager.status.mode, manager.version
+
+        self.assertEqual(asyncio.run(scenario()), ("FROZEN", 2))
+
+    def test_without_db_transitions_stay_local(self):
+        manager = SystemStateManager()
+        manager.set_freeze(True)
+
+        self.assertTrue(manager.is_frozen)
+        self.assertEqual(manager.version, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import asyncio
+import unittest
+from datetime import datetime, timezone
+
+from app.schemas.evaluation_telemetry import EvaluationTelemetry
+from app.services.telemetry_service import TelemetryWriter
+
+
+class _FakeCollection:
+    def __init__(self):
+        self.batches = []
+        self.rollup_ops = []
+
+    async def insert_many(self, docs, ordered=True):
+        self.batches.append(list(docs))
+
+    async def bulk_write(self, ops, ordered=True):
+        self.rollup_ops.extend(ops)
+
+
+class _FakeDb(dict):
+    def __missing__(self, name):
+        collection = self[name] = _FakeCollection()
+        return collection
+
+
+def _telemetry(i: int, score: float) -> EvaluationTelemetry:
+    return EvaluationTelemetry(
+        evaluation_id=str(i),
+        user_id="u1",
+        slot_id="s1",
+        task_instance_id=f"t{i}",
+        skill="arrays",
+        difficulty="easy",
+        score=score,
+        confidence=0.8,
+        is_partial_credit=False,
+        model_name="m",
+        model_version="1",
+        prompt_version="1.0",
+        temperature=0.0,
+        double_pass_used=False,
+        score_drift_detected=False,
+        directional_drift_detected=False,
+        low_confidence=False,
+        created_at=datetime(2025, 1, 1, 10, i, tzinfo=timezone.utc),
+    )
+
+
+class TestTelemetryWriter(unittest.TestCase):
+    def test_batches_on_size_and_rolls_up_hourly(self):
+        async def scenario():
+            db = _FakeDb()
+            writer = TelemetryWriter(batch_size=3, flush_interval_seconds=60, max_buffer=100)
+            writer._db = db  # no timer; size-triggered flushes only
+
+            for i, score in enumerate([0.2, 0.4, 0.6]):
+                writer.record_evaluation(_telemetry(i, score))
+            self.assertEqual(db["evaluation_telemetry"].batches, [])  # recording never awaits
+            await writer._flush_task
+
+            self.assertEqual([len(b) for b in db["evaluation_telemetry"].batches], [3])
+            writer.record_evaluation(_telemetry(3, 0.8))
+            await writer.flush()
+            self.assertEqual([len(b) for b in db["evaluation_telemetry"].batches], [3, 1])
+
+            ops = db["evaluation_score_rollups"].rollup_ops
+            self.assertEqual(len(ops), 2)  # one upsert per flush for the 10:00 bucket
+            self.assertEqual(ops[0]._filter, {"_id": "2025-01-01T10|arrays|easy|1.0"})
+            first = ops[0]._doc["$inc"]
+            self.assertEqual(first["count"], 3)
+            self.assertAlmostEqual(first["score_sum"], 1.2)
+            self.assertEqual(first["histogram.4"], 1)  # 0.2 -> [0.20, 0.25)
+
+        asyncio.run(scenario())
+
+    def test_drops_beyond_max_buffer_without_db(self):
+        writer = TelemetryWriter(batch_size=10, flush_interval_seconds=60, max_buffer=2)
+        for i in range(5):
+            writer.record_evaluation(_telemetry(i, 0.5))
+        self.assertEqual(writer.dropped, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from pymongo.errors import OperationFailure
+
+from app.core.exceptions import ConcurrencyError
+from app.db import transactions
+from app.db.transactions import run_transaction
+
+
+def _labelled(label):
+    return OperationFailure("write conflict", details={"errorLabels": [label]})
+
+
+class _FakeSession:
+    def __init__(self, commit_errors=()):
+        self.commit_errors = list(commit_errors)
+        self.in_transaction = False
+        self.started = self.commits = self.aborts = 0
+
+    def start_transaction(self):
+        self.in_transaction = True
+        self.started += 1
+
+    async def abort_transaction(self):
+        self.in_transaction = False
+        self.aborts += 1
+
+    async def commit_transaction(self):
+        self.commits += 1
+        if self.commit_errors:
+            raise self.commit_errors.pop(0)
+        self.in_transaction = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeClient:
+    def __init__(self, session):
+        self.session = session
+
+    async def start_session(self):
+        return self.session
+
+
+class TestRunTransaction(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(transactions, "backoff_delay", lambda attempt: 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, fn, session, max_attempts=4):
+        return asyncio.run(run_transaction(fn, max_attempts=max_attempts, client=_FakeClient(session)))
+
+    def test_transient_error_retries_whole_transaction(self):
+        session = _FakeSession()
+        calls = []
+
+        async def body(s):
+            calls.append(s)
+            if len(calls) < 3:
+                raise _labelled("TransientTransactionError")
+            return "done"
+
+        self.assertEqual(self._run(body, session), "done")
+        self.assertEqual((session.started, session.aborts, session.commits), (3, 2, 1))
+
+    def test_unknown_commit_result_retries_commit_only(self):
+        session = _FakeSession(commit_errors=[_labelled("UnknownTransactionCommitResult")])
+        calls = []
+
+        async def body(s):
+            calls.append(s)
+            return "done"
+
+        self.assertEqual(self._run(body, session), "done")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(session.commits, 2)
+
+    def test_version_conflict_is_not_retried(self):
+        session = _FakeSession()
+
+        async def body(s):
+            raise ConcurrencyError("version mismatch")
+
+        with self.assertRaises(ConcurrencyError):
+            self._run(body, session)
+        self.assertEqual((session.started, session.aborts), (1, 1))
+
+    def test_gives_up_after_max_attempts(self):
+        session = _FakeSession()
+
+        async def body(s):
+            raise _labelled("TransientTransactionError")
+
+        with self.assertRaises(OperationFailure) as ctx:
+            self._run(body, session, max_attempts=2)
+        self.assertTrue(transactions.is_transient(ctx.exception))
+        self.assertEqual(session.started, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()